@@ -7,7 +7,14 @@
 fastapi_import_export 包导出定义。
 """
 
-from fastapi_import_export.easy import export_csv, export_xlsx, import_csv, import_xlsx
+from fastapi_import_export.easy import (
+    export_arrow,
+    export_csv,
+    export_parquet,
+    export_xlsx,
+    import_csv,
+    import_xlsx,
+)
 from fastapi_import_export.exceptions import ExportError, ImportExportError, ParseError, PersistError, ValidationError
 from fastapi_import_export.exporter import ExportPayload
 from fastapi_import_export.formats import ExportFormat
@@ -33,7 +40,9 @@ __all__ = [
     "PersistError",
     "Resource",
     "ValidationError",
+    "export_arrow",
     "export_csv",
+    "export_parquet",
     "export_xlsx",
     "import_csv",
     "import_xlsx",
@@ -7,9 +7,13 @@
 SQLAlchemy CSV 导出适配器。
 """
 
+from collections.abc import AsyncIterator, Callable
+from operator import attrgetter
 from typing import Any
 
+from fastapi_import_export.codecs import Codec
 from fastapi_import_export.contrib.sqlalchemy.adapters import (
+    FieldSpec,
     _require_sqlalchemy,
     get_field_specs,
     resolve_export_specs,
@@ -17,7 +21,11 @@ from fastapi_import_export.contrib.sqlalchemy.adapters import (
 )
 from fastapi_import_export.easy import export_csv
 from fastapi_import_export.exporter import ExportPayload
+from fastapi_import_export.formats import ExportFormat, media_type_for
 from fastapi_import_export.options import ExportOptions
+from fastapi_import_export.serializers import CsvSerializer
+
+_EXPORT_PARTITION_SIZE = 10_000
 
 
 def _apply_filters(stmt: Any, *, model: Any, filters: Any) -> Any:
@@ -54,12 +62,103 @@ def _apply_filters(stmt: Any, *, model: Any, filters: Any) -> Any:
         if col is None:
             continue
         if isinstance(value, (list, tuple, set)):
-            stmt = stmt.where(col.in_(list(value)))
+            stmt = stmt.where(col.in_(value if isinstance(value, (list, tuple)) else tuple(value)))
         else:
             stmt = stmt.where(col == value)
     return stmt
 
 
+def _build_row_formatter(
+    *,
+    model: Any,
+    specs: list[FieldSpec],
+    codecs: dict[str, Codec],
+) -> Callable[[Any], dict[str, Any]]:
+    """Build a row formatter specialized for a fixed export column set.
+    为固定的导出列集合构建专用的行格式化函数。
+
+    Attribute access is bound once through `operator.attrgetter` and codec
+    `format` methods are pre-bound per column, so formatting a row does not
+    iterate specs or look up codecs.
+    属性访问通过 `operator.attrgetter` 一次绑定，编解码器的 `format` 方法按列预先绑定，
+    因此格式化一行时无需遍历字段规范或查找编解码器。
+
+    Args:
+        model: SQLAlchemy model class.
+            SQLAlchemy 模型类。
+        specs: Export field specifications.
+            导出字段规范。
+        codecs: Field codecs keyed by field name.
+            以字段名为键的字段编解码器。
+    Returns:
+        A callable converting an ORM instance into an export row dict.
+        将 ORM 实例转换为导出行字典的可调用对象。
+    """
+    names = tuple(spec.name for spec in specs)
+    if not names:
+        return lambda row: {}
+    formatters = tuple(codecs[name].format if name in codecs else None for name in names)
+    get_values: Callable[[Any], tuple[Any, ...]]
+    if not all(hasattr(model, name) for name in names):
+
+        def get_values(row: Any) -> tuple[Any, ...]:
+            return tuple(getattr(row, name, None) for name in names)
+
+    elif len(names) == 1:
+        getter = attrgetter(names[0])
+
+        def get_values(row: Any) -> tuple[Any, ...]:
+            return (getter(row),)
+
+    else:
+        get_values = attrgetter(*names)
+
+    def format_row(row: Any) -> dict[str, Any]:
+        return {
+            name: value if formatter is None else formatter(value)
+            for name, formatter, value in zip(names, formatters, get_values(row), strict=True)
+        }
+
+    return format_row
+
+
+async def _stream_csv(
+    *,
+    db: Any,
+    stmt: Any,
+    format_row: Callable[[Any], dict[str, Any]],
+    options: ExportOptions,
+) -> AsyncIterator[bytes]:
+    """Stream ORM rows as CSV chunks, one chunk per fetched partition.
+    按获取的分区逐块将 ORM 行流式输出为 CSV。
+
+    Rows are fetched with a server-side cursor (`yield_per`) so only one partition
+    is held in memory; the header (and BOM) is only written with the first chunk.
+    使用服务端游标（`yield_per`）获取行，内存中仅保留一个分区；表头（及 BOM）仅随第一块写出。
+
+    Args:
+        db: Asynchronous database session/connection supporting `stream()`.
+            支持 `stream()` 的异步数据库会话/连接。
+        stmt: SQLAlchemy select statement of ORM entities.
+            查询 ORM 实体的 SQLAlchemy select 语句。
+        format_row: Row formatter built by `_build_row_formatter`.
+            由 `_build_row_formatter` 构建的行格式化函数。
+        options: Effective export options (columns, BOM, line ending).
+            生效的导出选项（列、BOM、换行符）。
+    Yields:
+        bytes: Encoded CSV chunks.
+            编码后的 CSV 分块。
+    """
+    serializer = CsvSerializer()
+    result = await db.stream(stmt.execution_options(yield_per=_EXPORT_PARTITION_SIZE))
+    first = True
+    async for partition in result.scalars().partitions():
+        yield serializer.serialize(data=[format_row(row) for row in partition], options=options, include_header=first)
+        first = False
+    if first:
+        yield serializer.serialize(data=[], options=options)
+
+
 async def export_model_csv(
     *,
     model: Any,
@@ -67,6 +166,7 @@ async def export_model_csv(
     filters: dict[str, object] | None = None,
     columns: list[str] | None = None,
     options: ExportOptions | None = None,
+    stream: bool = False,
 ) -> ExportPayload:
     """Export ORM model rows to CSV using a SQLAlchemy async session.
     使用 SQLAlchemy 异步会话导出 CSV。
@@ -75,6 +175,10 @@ async def export_model_csv(
     inferred from the model and optional filtering/column selection.
     从 SQLAlchemy 模型导出行到 CSV，自动根据模型推断字段编解码器，并支持可选的过滤与字段选择。
 
+    With `stream=True`, rows are fetched lazily in partitions while the payload is
+    consumed, keeping memory bounded; `db` must then stay open until streaming ends.
+    当 `stream=True` 时，在消费负载的过程中按分区惰性获取行以限制内存；此时 `db` 必须保持打开直至流结束。
+
     Args:
         model: SQLAlchemy model class.
             SQLAlchemy 模型类。
@@ -87,6 +191,8 @@ async def export_model_csv(
             可选的要包含的列名列表；默认导出所有可导出的列。
         options: Optional `ExportOptions` to override default export settings.
             可选的 `ExportOptions`，用于覆盖默认导出设置。
+        stream: Whether to stream rows from a server-side cursor instead of loading them all.
+            是否通过服务端游标流式读取行，而不是一次性全部加载。
 
     Returns:
         ExportPayload: Contains filename, media_type and an async byte stream.
@@ -100,18 +206,6 @@ async def export_model_csv(
     columns_final = columns if columns is not None else (options.columns if options else None)
     specs = resolve_export_specs(get_field_specs(model), columns_final)
     codecs = resolve_field_codecs(model, specs)
-    stmt = _apply_filters(sa.select(model), model=model, filters=filters)
-    result = await db.execute(stmt)
-    rows = result.scalars().all()
-    data: list[dict[str, Any]] = []
-    for row in rows:
-        item: dict[str, Any] = {}
-        for spec in specs:
-            value = getattr(row, spec.name, None)
-            codec = codecs.get(spec.name)
-            item[spec.name] = codec.format(value) if codec is not None else value
-        data.append(item)
-
     filename = options.filename if options else None
     effective_options = ExportOptions(
         filename=filename or f"{model.__name__.lower()}.csv",
@@ -121,4 +215,21 @@ async def export_model_csv(
         chunk_size=options.chunk_size if options else 64 * 1024,
         columns=[spec.name for spec in specs],
     )
+    from sqlalchemy.orm import raiseload
+
+    # Export specs are table columns only; forbid relationship lazy-loads so an
+    # accidental relationship access fails fast instead of issuing N+1 queries.
+    # 导出字段仅为表列；禁止关系懒加载，使意外的关系访问立即失败而非产生 N+1 查询。
+    orm_stmt = _apply_filters(sa.select(model).options(raiseload("*")), model=model, filters=filters)
+    format_row = _build_row_formatter(model=model, specs=specs, codecs=codecs)
+    if stream:
+        return ExportPayload(
+            filename=effective_options.filename or f"{model.__name__.lower()}.csv",
+            media_type=effective_options.media_type or media_type_for(ExportFormat.CSV),
+            stream=_stream_csv(db=db, stmt=orm_stmt, format_row=format_row, options=effective_options),
+        )
+
+    result = await db.execute(orm_stmt)
+    data = [format_row(row) for row in result.scalars().all()]
+
     return await export_csv(data, options=effective_options)
@@ -7,17 +7,26 @@
 SQLAlchemy CSV 导入适配器。
 """
 
+import asyncio
+import importlib
 import inspect
+from collections import Counter
+from datetime import date
+from enum import Enum
+from functools import lru_cache
+from itertools import batched, repeat
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from fastapi import UploadFile
 
+from fastapi_import_export.codecs import BoolCodec, Codec
 from fastapi_import_export.contrib.sqlalchemy.adapters import (
     FieldSpec,
     _require_polars,
     _require_sqlalchemy,
-    cast_basic,
     get_field_specs,
+    resolve_caster,
     resolve_field_codecs,
     resolve_import_specs,
 )
@@ -27,50 +36,155 @@ from fastapi_import_export.importer import ImportResult, ImportStatus
 from fastapi_import_export.options import ImportOptions
 from fastapi_import_export.schemas import ImportCommitRequest, ImportErrorItem
 from fastapi_import_export.service import ImportExportService
-from fastapi_import_export.validation_core import ErrorCollector
 
+_UNIQUE_CHECK_CHUNK_SIZE = 1000
+# Parsed-column dtypes by field type; other types (Decimal, Enum, tz-aware datetimes)
+# keep value-based inference so no precision or timezone is lost.
+# 按字段类型确定的解析列类型；其他类型（Decimal、Enum、带时区的日期时间）仍按值推断，避免丢失精度或时区。
+_POLARS_DTYPE_NAMES: dict[type[Any], str] = {int: "Int64", float: "Float64", bool: "Boolean", date: "Date"}
+_THREADED_VALIDATION_MIN_ROWS = 50_000
+_INSERT_CHUNK_SIZE = 1000
+_CONFLICT_INSERT_DIALECTS = {
+    "postgresql": "sqlalchemy.dialects.postgresql",
+    "sqlite": "sqlalchemy.dialects.sqlite",
+}
 
-def _build_column_aliases(specs: list[FieldSpec]) -> dict[str, str]:
-    """Build column alias mapping used for file column -> model field resolution.
-    构建列别名映射，用于文件列到模型字段的解析。
 
-    Args:
-        specs: List of FieldSpec describing importable fields.
-            描述可导入字段的 FieldSpec 列表。
-
-    Returns:
-        dict[str, str]: Mapping from column name to alias (identity mapping here).
-            列名到别名的映射（此处为恒等映射）。
-    """
-    return {spec.name: spec.name for spec in specs}
-
-
-def _required_fields(specs: list[FieldSpec]) -> set[str]:
+def _required_fields(specs: list[FieldSpec]) -> frozenset[str]:
     """Compute the set of required field names for import.
     计算导入时必填字段的集合。
 
     A field is required when it is not nullable, has no default, and is
-    not an auto-incrementing primary key.
-    当字段非空、无默认值且不是自增主键时，视为必填字段。
+    not an auto-incrementing primary key. Results are cached per spec tuple.
+    当字段非空、无默认值且不是自增主键时，视为必填字段。结果按规范元组缓存。
 
     Args:
         specs: Field specifications to evaluate.
             用于评估的字段规范列表。
 
     Returns:
-        set[str]: Set of required field names.
+        frozenset[str]: Set of required field names.
             必填字段名称集合。
     """
-    required: set[str] = set()
-    for spec in specs:
-        if spec.nullable:
-            continue
-        if spec.has_default:
-            continue
-        if spec.primary_key and spec.autoincrement:
-            continue
-        required.add(spec.name)
-    return required
+    return _required_fields_cached(tuple(specs))
+
+
+@lru_cache(maxsize=256)
+def _required_fields_cached(specs: tuple[FieldSpec, ...]) -> frozenset[str]:
+    """Cached set-algebra implementation of `_required_fields`.
+    `_required_fields` 的缓存集合运算实现。
+
+    Args:
+        specs: Field specifications as a hashable tuple.
+            以可哈希元组表示的字段规范。
+
+    Returns:
+        frozenset[str]: Set of required field names.
+            必填字段名称集合。
+    """
+    names = {spec.name for spec in specs}
+    optional = {
+        spec.name for spec in specs if spec.nullable or spec.has_default or (spec.primary_key and spec.autoincrement)
+    }
+    return frozenset(names - optional)
+
+
+def _dialect(db: Any) -> Any | None:
+    """Return the SQLAlchemy dialect of the engine behind a session/connection.
+    返回会话/连接背后引擎的 SQLAlchemy 方言。
+
+    Args:
+        db: Asynchronous database session/connection.
+            异步数据库会话/连接。
+
+    Returns:
+        The dialect object, or None when it cannot be determined.
+        方言对象；无法确定时返回 None。
+    """
+    bind = getattr(db, "bind", None) or db
+    return getattr(bind, "dialect", None)
+
+
+def _dialect_name(db: Any) -> str:
+    """Return the SQL dialect name of the engine behind a session/connection.
+    返回会话/连接背后引擎的 SQL 方言名称。
+
+    Args:
+        db: Asynchronous database session/connection.
+            异步数据库会话/连接。
+
+    Returns:
+        str: Dialect name such as "postgresql" or "sqlite", or "" when unknown.
+            方言名称，例如 "postgresql" 或 "sqlite"；未知时返回 ""。
+    """
+    return getattr(_dialect(db), "name", None) or ""
+
+
+def _insert_batch_size(dialect: Any, width: int) -> int:
+    """Return the rows per INSERT batch that keep a multi-row VALUES statement within bind limits.
+    返回使多行 VALUES 语句不超过绑定参数上限的每批行数。
+
+    The limit comes from the dialect's `insertmanyvalues_max_parameters` (for
+    example 2099 on SQL Server and 999 on SQLite before 3.32).
+    上限取自方言的 `insertmanyvalues_max_parameters`（例如 SQL Server 为 2099，SQLite 3.32 之前为 999）。
+
+    Args:
+        dialect: SQLAlchemy dialect, or None when unknown.
+            SQLAlchemy 方言；未知时为 None。
+        width: Number of columns (bind parameters) per row.
+            每行的列数（绑定参数数）。
+
+    Returns:
+        int: Batch size between 1 and `_INSERT_CHUNK_SIZE`.
+            介于 1 与 `_INSERT_CHUNK_SIZE` 之间的批大小。
+    """
+    max_params = getattr(dialect, "insertmanyvalues_max_parameters", None) or _INSERT_CHUNK_SIZE
+    return max(1, min(_INSERT_CHUNK_SIZE, max_params // max(width, 1)))
+
+
+def _group_row_numbers(df: Any, fields: list[str]) -> dict[Any, list[int]]:
+    """Group row numbers by unique key, skipping rows with a null or blank key part.
+    按唯一键分组行号，跳过任一键部分为空或空白的行。
+
+    Keys are grouped by Polars `group_by`; single-field keys are bare values and
+    composite keys are tuples. Object columns (e.g. parsed enums) cannot be hashed
+    by Polars and are grouped in Python instead.
+    使用 Polars `group_by` 分组；单字段键为原值，组合键为元组。Object 列（例如解析后的枚举）
+    无法由 Polars 哈希，改为在 Python 中分组。
+
+    Args:
+        df: Frame with `row_number` and the key columns.
+            包含 `row_number` 与键列的数据帧。
+        fields: Unique field names.
+            唯一字段名列表。
+    Returns:
+        Mapping from key to the row numbers carrying it, in first-seen order.
+        键到其所在行号列表的映射，按首次出现顺序排列。
+    """
+    pl = _require_polars()
+    keyed = df.drop_nulls(fields)
+    blank = [pl.col(name).str.strip_chars() == "" for name in fields if keyed.schema[name] == pl.String]
+    if blank:
+        keyed = keyed.filter(~pl.any_horizontal(blank))
+    if keyed.is_empty():
+        return {}
+    if any(keyed.schema[name] == pl.Object for name in fields):
+        key_to_rows: dict[Any, list[int]] = {}
+        values = (
+            keyed[fields[0]].to_list()
+            if len(fields) == 1
+            else zip(*[keyed[name].to_list() for name in fields], strict=True)
+        )
+        for key, row_number in zip(values, keyed["row_number"].to_list(), strict=True):
+            key_to_rows.setdefault(key, []).append(row_number)
+        return key_to_rows
+    grouped = keyed.group_by(fields, maintain_order=True).agg(pl.col("row_number"))
+    keys = (
+        grouped[fields[0]].to_list()
+        if len(fields) == 1
+        else zip(*[grouped[name].to_list() for name in fields], strict=True)
+    )
+    return dict(zip(keys, grouped["row_number"].to_list(), strict=True))
 
 
 async def _check_db_unique(
@@ -78,8 +192,8 @@ async def _check_db_unique(
     db: Any,
     model: Any,
     unique_fields: list[str],
-    rows: list[dict[str, Any]],
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    df: Any,
+) -> tuple[list[dict[str, Any]], Any]:
     """Check the database for existing rows that would conflict with unique fields.
     校验数据库中是否存在与指定唯一字段冲突的记录。
 
@@ -94,74 +208,259 @@ async def _check_db_unique(
             用于查询现有值的 SQLAlchemy 模型类。
         unique_fields: Fields to consider for uniqueness.
             用于唯一性判断的字段列表。
-        rows: Candidate rows with a `row_number` for error reporting.
-            带有 `row_number` 的候选行，用于错误定位。
+        df: Candidate key frame: an Int64 `row_number` column plus the parsed key columns.
+            候选键数据帧：Int64 的 `row_number` 列及解析后的键列。
 
     Returns:
         Tuple of (errors, filtered_rows):
             errors: list of error dicts describing conflicts.
                 描述冲突的错误字典列表。
-            filtered_rows: rows with conflicting entries removed.
-                去除冲突条目的行列表。
+            filtered_rows: key frame with conflicting rows removed.
+                去除冲突行后的键数据帧。
     """
     sa = _require_sqlalchemy()
     fields = [f for f in unique_fields if f]
     if not fields:
-        return [], rows
+        return [], df
     columns = []
     for name in fields:
         col = getattr(model, name, None)
         if col is None:
-            return [], rows
+            return [], df
         columns.append(col)
-
-    key_to_rows: dict[tuple[Any, ...], list[int]] = {}
-    for row in rows:
-        key = tuple(row.get(f) for f in fields)
-        if any(part is None or (isinstance(part, str) and not part.strip()) for part in key):
-            continue
-        key_to_rows.setdefault(key, []).append(int(row.get("row_number") or 0))
-
+    if any(name not in df.columns for name in fields):
+        return [], df
+    single = len(fields) == 1
+    key_to_rows = _group_row_numbers(df, fields)
     keys = list(key_to_rows.keys())
     if not keys:
-        return [], rows
-
-    if len(columns) == 1:
-        values = [k[0] for k in keys]
-        stmt = sa.select(columns[0]).where(columns[0].in_(values))
-    else:
-        stmt = sa.select(*columns).where(sa.tuple_(*columns).in_(keys))
-    result = await db.execute(stmt)
-    existing: set[tuple[Any, ...]] = set()
-    for row in result.all():
-        if len(columns) == 1:
-            existing.add((row[0],))
+        return [], df
+
+    # Query in bounded batches so the IN-list stays within driver parameter limits.
+    # On PostgreSQL composite keys are sent as a VALUES list probed with EXISTS, which the
+    # planner runs as a hash semi-join instead of expanding a row-value IN-list.
+    # 分批查询，使 IN 列表不超过驱动参数数量限制。
+    # 在 PostgreSQL 上组合键以 VALUES 列表配合 EXISTS 探测，规划器按哈希半连接执行，而非展开行值 IN 列表。
+    semi_join = not single and _dialect_name(db) == "postgresql"
+    existing: set[Any] = set()
+    for batch in batched(keys, _UNIQUE_CHECK_CHUNK_SIZE):
+        if single:
+            result = await db.execute(sa.select(columns[0]).where(columns[0].in_(list(batch))))
+            existing.update(result.scalars().all())
+            continue
+        if semi_join:
+            probe = sa.values(
+                *[sa.column(name, col.type) for name, col in zip(fields, columns, strict=True)],
+                name="unique_keys",
+            ).data(list(batch))
+            match = sa.and_(*[col == probe.c[name] for name, col in zip(fields, columns, strict=True)])
+            stmt = sa.select(*probe.c).where(sa.exists().where(match))
         else:
-            existing.add(tuple(row))
+            stmt = sa.select(*columns).where(sa.tuple_(*columns).in_(batch))
+        result = await db.execute(stmt)
+        existing.update(tuple(row) for row in result.all())
 
     if not existing:
-        return [], rows
-
+        return [], df
+
+    conflict_keys = [key for key in key_to_rows if key in existing]
+    if not conflict_keys:
+        return [], df
+    pl = _require_polars()
+    if any(df.schema[name] == pl.Object for name in fields):
+        # Object columns cannot be joined; drop conflicting rows by row number.
+        # Object 列无法参与连接；按行号剔除冲突行。
+        conflicts = [(rn, key) for key in conflict_keys for rn in key_to_rows[key]]
+        filtered = df.filter(~pl.col("row_number").is_in([rn for rn, _ in conflicts]))
+    else:
+        # Semi/anti join the key frame with the existing keys instead of matching rows in Python.
+        # 使用半连接/反连接将键数据帧与已存在的键匹配，而非在 Python 中逐行匹配。
+        columns = [conflict_keys] if single else [list(part) for part in zip(*conflict_keys, strict=True)]
+        existing_df = pl.DataFrame(columns, schema={name: df.schema[name] for name in fields}, orient="col")
+        matched = df.join(existing_df, on=fields, how="semi", maintain_order="left").select("row_number", *fields)
+        conflicts = [(row[0], row[1] if single else row[1:]) for row in matched.iter_rows()]
+        filtered = df.join(existing_df, on=fields, how="anti", maintain_order="left")
+
+    field = fields[0] if single else None
     errors: list[dict[str, Any]] = []
-    conflict_rows: set[int] = set()
-    for key in existing:
-        row_numbers = key_to_rows.get(key, [])
-        for rn in row_numbers:
-            errors.append(
-                {
-                    "row_number": int(rn),
-                    "field": fields[0] if len(fields) == 1 else None,
-                    "message": f"Unique conflict: {fields}={key} / 唯一性冲突: {fields}={key}",
-                    "type": "db_unique",
-                    "value": key,
-                }
-            )
-            conflict_rows.add(int(rn))
-
-    filtered = [row for row in rows if int(row.get("row_number") or 0) not in conflict_rows]
+    for rn, key in conflicts:
+        value = (key,) if single else key
+        errors.append(
+            {
+                "row_number": rn,
+                "field": field,
+                "message": f"Unique conflict: {fields}={value} / 唯一性冲突: {fields}={value}",
+                "type": "db_unique",
+                "value": value,
+            }
+        )
     return errors, filtered
 
 
+def _stringify(value: Any) -> str:
+    """Convert a non-text cell to stripped text.
+    将非文本单元格转换为去除首尾空白的文本。
+
+    Args:
+        value: Cell value.
+            单元格值。
+    Returns:
+        str: Stripped text.
+            去除首尾空白的文本。
+    """
+    return str(value).strip()
+
+
+def _text_expr(pl: Any, df: Any, name: str) -> Any:
+    """Build the stripped-text expression of a field with blank cells mapped to null.
+    构建字段的去空白文本表达式，空白单元格映射为 null。
+
+    Args:
+        pl: The Polars module.
+            Polars 模块。
+        df: Input DataFrame.
+            输入 DataFrame。
+        name: Field name.
+            字段名。
+    Returns:
+        A Polars expression aliased to `name`.
+        以 `name` 命名的 Polars 表达式。
+    """
+    dtype = df.schema.get(name)
+    if dtype is None or dtype == pl.Null:
+        return pl.lit(None, dtype=pl.String).alias(name)
+    if dtype == pl.String:
+        expr = pl.col(name).str.strip_chars()
+    else:
+        expr = pl.lit(pl.Series(name, [_stringify(v) if v is not None else None for v in df[name]], dtype=pl.String))
+    return pl.when(expr != "").then(expr).alias(name)
+
+
+def _to_series(pl: Any, name: str, values: list[Any], dtype: Any = None) -> Any:
+    """Build a Series from parsed Python values, falling back to row-wise inference.
+    由解析后的 Python 值构建 Series，失败时回退到按行推断。
+
+    Args:
+        pl: The Polars module.
+            Polars 模块。
+        name: Series name.
+            Series 名称。
+        values: Parsed values.
+            解析后的值。
+        dtype: Expected Polars dtype; skips inference when the values match it.
+            预期的 Polars 类型；值与之匹配时跳过类型推断。
+    Returns:
+        A Polars Series.
+        Polars Series。
+    """
+    if any(isinstance(value, Enum) for value in values):
+        # The Series constructor stores enum members as their values, which ORM enum
+        # columns would then persist instead of the member; keep the members as objects.
+        # Series 构造器会将枚举成员存为其值，ORM 枚举列随后会持久化该值而非成员；因此保留成员对象。
+        return pl.Series(name, range(len(values))).map_elements(values.__getitem__, return_dtype=pl.Object)
+    if dtype is not None:
+        try:
+            return pl.Series(name, values, dtype=dtype)
+        except Exception:
+            pass
+    try:
+        return pl.Series(name, values, strict=False)
+    except Exception:
+        return pl.DataFrame([{name: value} for value in values])[name]
+
+
+def _polars_dtype(pl: Any, python_type: type[Any] | None) -> Any:
+    """Map a field's Python type to the Polars dtype of its parsed column.
+    将字段的 Python 类型映射为其解析列的 Polars 类型。
+
+    Args:
+        pl: The Polars module.
+            Polars 模块。
+        python_type: Field Python type, or None.
+            字段的 Python 类型，或 None。
+    Returns:
+        The Polars dtype, or None to let Polars infer it from the values.
+        Polars 类型；返回 None 时由 Polars 根据值推断。
+    """
+    name = _POLARS_DTYPE_NAMES.get(python_type) if python_type is not None else None
+    return getattr(pl, name) if name is not None else None
+
+
+def _parse_bool(pl: Any, text: Any, codec: BoolCodec) -> tuple[Any, Any]:
+    """Parse a stripped text column with the built-in `BoolCodec` rules, column-wise.
+    按内置 `BoolCodec` 规则对去空白文本列进行整列解析。
+
+    Args:
+        pl: The Polars module.
+            Polars 模块。
+        text: Stripped text Series with blanks as null.
+            去空白且空白为 null 的文本 Series。
+        codec: The bool codec supplying the truthy/falsy spellings.
+            提供真/假拼写集合的布尔编解码器。
+    Returns:
+        Tuple of (values, failed): Boolean Series and boolean Series of parse failures.
+            (values, failed)：布尔 Series 与表示解析失败的布尔 Series。
+    """
+    lowered = text.str.to_lowercase()
+    truthy = lowered.is_in(list(codec._truthy)).fill_null(False)
+    matched = truthy | lowered.is_in(list(codec._falsy)).fill_null(False)
+    missing = pl.Series(text.name, [None] * text.len(), dtype=pl.Boolean)
+    return truthy.zip_with(matched, missing).alias(text.name), text.is_not_null() & ~matched
+
+
+def _parse_field(pl: Any, text: Any, *, codec: Codec | None, caster: Any, dtype: Any = None) -> tuple[Any, Any]:
+    """Parse one stripped text column into typed values and a failure mask.
+    将一列去空白文本解析为类型化值与失败掩码。
+
+    int/float columns without a codec are cast by Polars in one pass; only when
+    some cells fail that cast does the column fall back to the Python caster,
+    which keeps Python's parsing rules. Built-in bool codec columns are matched
+    column-wise; other codec columns are parsed value by value.
+    无编解码器的 int/float 列由 Polars 一次性转换；仅当部分单元格转换失败时才回退到 Python
+    转换函数，以保持 Python 的解析规则。内置布尔编解码器列按列匹配；其他编解码器列逐值解析。
+
+    Args:
+        pl: The Polars module.
+            Polars 模块。
+        text: Stripped text Series with blanks as null.
+            去空白且空白为 null 的文本 Series。
+        codec: Field codec, if any.
+            字段编解码器（如有）。
+        caster: Basic caster resolved for the field.
+            为字段解析的基础转换函数。
+        dtype: Expected Polars dtype of the parsed values, if known.
+            解析结果的预期 Polars 类型（如已知）。
+    Returns:
+        Tuple of (values, failed): parsed Series and boolean Series of parse failures.
+            (values, failed)：解析后的 Series 与表示解析失败的布尔 Series。
+    """
+    if codec is None:
+        if caster is int or caster is float:
+            values = text.cast(pl.Int64 if caster is int else pl.Float64, strict=False)
+            failed = text.is_not_null() & values.is_null()
+            if not failed.any():
+                return values, failed
+        else:
+            return text, pl.repeat(False, text.len(), eager=True)
+    elif type(codec) is BoolCodec:
+        return _parse_bool(pl, text, codec)
+    parse = codec.parse if codec is not None else caster
+    parsed: list[Any] = []
+    flags: list[bool] = []
+    for raw_text in text.to_list():
+        if raw_text is None:
+            parsed.append(None)
+            flags.append(False)
+            continue
+        try:
+            parsed.append(parse(raw_text))
+            flags.append(False)
+        except Exception:
+            parsed.append(None)
+            flags.append(True)
+    return _to_series(pl, text.name, parsed, dtype), pl.Series(flags, dtype=pl.Boolean)
+
+
 def _build_validate_fn(
     *,
     model: Any,
@@ -189,107 +488,422 @@ def _build_validate_fn(
     """
     codecs = resolve_field_codecs(model, specs)
     required = _required_fields(specs)
+    names = [spec.name for spec in specs]
+    # Per-field lookups resolved once, indexed by field position.
+    # 按字段位置预先解析的逐字段查找结果。
+    required_flags = [name in required for name in names]
+    codec_list = [codecs.get(name) for name in names]
+    caster_list = [resolve_caster(spec.python_type) for spec in specs]
 
     async def validate_fn(db: Any, df: Any, *, allow_overwrite: bool = False) -> tuple[Any, list[dict[str, Any]]]:
         pl = _require_polars()
+        dtype_list = [_polars_dtype(pl, spec.python_type) for spec in specs]
         errors: list[dict[str, Any]] = []
-        collector = ErrorCollector(errors)
-        valid_rows: list[dict[str, Any]] = []
-        rows = df.to_dicts() if not df.is_empty() else []
-        for row in rows:
-            row_number = int(row.get("row_number") or 0)
-            parsed: dict[str, Any] = {"row_number": row_number}
-            has_error = False
-            for spec in specs:
-                field = spec.name
-                raw = row.get(field)
-                raw_text = str(raw).strip() if raw is not None else ""
-                if raw is None or raw_text == "":
-                    if field in required:
-                        collector.add(
-                            row_number=row_number,
-                            field=field,
-                            message=f"Missing required field {field} / 缺少必填字段 {field}",
-                            type="required",
-                        )
-                        has_error = True
-                    parsed[field] = None
-                    continue
-                codec = codecs.get(field)
-                if codec is not None:
-                    try:
-                        parsed[field] = codec.parse(raw_text)
-                    except Exception:
-                        collector.add(
-                            row_number=row_number,
-                            field=field,
-                            message=f"Invalid value for {field}: {raw_text} / 字段 {field} 格式错误: {raw_text}",
-                            type="format",
-                            value=raw_text,
+        if df.is_empty():
+            return pl.DataFrame(), errors
+        # Normalize every field to stripped text (blank -> null) in one Polars pass.
+        # 在一次 Polars 计算中将所有字段规范为去空白文本（空白 -> null）。
+        row_number_expr = (
+            pl.col("row_number").fill_null(0).cast(pl.Int64)
+            if "row_number" in df.columns
+            else pl.lit(0, dtype=pl.Int64)
+        )
+        text_df = df.with_columns(
+            row_number_expr.alias("row_number"), *[_text_expr(pl, df, name) for name in names]
+        ).select("row_number", *names)
+        parsed: list[Any] = [None] * len(names)
+
+        check_task: asyncio.Task[tuple[list[dict[str, Any]], Any]] | None = None
+        if unique_fields and not allow_overwrite:
+            # Start the DB unique check on the key columns first so its round trip
+            # overlaps with parsing the remaining columns.
+            # 先基于键列发起数据库唯一性校验，使其往返时间与其余列的解析重叠。
+            key_indexes = [index for index, name in enumerate(names) if name in unique_fields]
+            for index in key_indexes:
+                parsed[index] = _parse_field(
+                    pl,
+                    text_df[names[index]],
+                    codec=codec_list[index],
+                    caster=caster_list[index],
+                    dtype=dtype_list[index],
+                )
+            key_df = pl.DataFrame(
+                [text_df["row_number"], *[parsed[index][0].alias(names[index]) for index in key_indexes]]
+            )
+            check_task = asyncio.create_task(
+                _check_db_unique(db=db, model=model, unique_fields=unique_fields, df=key_df)
+            )
+            await asyncio.sleep(0)
+        try:
+            pending_indexes = [index for index in range(len(names)) if parsed[index] is None]
+            if text_df.height >= _THREADED_VALIDATION_MIN_ROWS:
+                # Parse columns on worker threads for large imports: Polars casts release the
+                # GIL and the event loop stays responsive while codec columns are parsed.
+                # 大批量导入时在工作线程中解析各列：Polars 转换会释放 GIL，解析编解码器列时事件循环仍可响应。
+                results = await asyncio.gather(
+                    *[
+                        asyncio.to_thread(
+                            _parse_field,
+                            pl,
+                            text_df[names[index]],
+                            codec=codec_list[index],
+                            caster=caster_list[index],
+                            dtype=dtype_list[index],
                         )
-                        has_error = True
-                    continue
-                try:
-                    parsed[field] = cast_basic(raw_text, spec.python_type)
-                except Exception:
-                    collector.add(
-                        row_number=row_number,
-                        field=field,
-                        message=f"Invalid value for {field}: {raw_text} / 字段 {field} 格式错误: {raw_text}",
-                        type="format",
-                        value=raw_text,
+                        for index in pending_indexes
+                    ]
+                )
+                for index, result in zip(pending_indexes, results, strict=True):
+                    parsed[index] = result
+            else:
+                for index in pending_indexes:
+                    parsed[index] = _parse_field(
+                        pl,
+                        text_df[names[index]],
+                        codec=codec_list[index],
+                        caster=caster_list[index],
+                        dtype=dtype_list[index],
                     )
-                    has_error = True
-            if not has_error:
-                valid_rows.append(parsed)
-
-        if unique_fields and not allow_overwrite and valid_rows:
-            db_errors, valid_rows = await _check_db_unique(
-                db=db,
-                model=model,
-                unique_fields=unique_fields,
-                rows=valid_rows,
-            )
-            errors.extend(db_errors)
+        except BaseException:
+            if check_task is not None:
+                check_task.cancel()
+            raise
+
+        has_error = pl.repeat(False, text_df.height, eager=True)
+        pending: list[tuple[int, int, Any]] = []
+        for index, (name, result) in enumerate(zip(names, parsed, strict=True)):
+            text = text_df[name]
+            if required_flags[index]:
+                missing = text.is_null()
+                if missing.any():
+                    has_error = has_error | missing
+                    pending.extend(zip(missing.arg_true().to_list(), repeat(index), repeat(None), strict=False))
+            failed = result[1]
+            if failed.any():
+                has_error = has_error | failed
+                positions = failed.arg_true()
+                pending.extend(zip(positions.to_list(), repeat(index), text.gather(positions).to_list(), strict=False))
+        if pending:
+            # Report errors in row order, then field order, as the row-wise loop did.
+            # 按行顺序、再按字段顺序报告错误，与逐行循环保持一致。
+            pending.sort(key=lambda item: (item[0], item[1]))
+            # Append error dicts directly (same shape as `ErrorCollector.add`); row
+            # numbers are already ints from the Int64 column.
+            # 直接追加错误字典（与 `ErrorCollector.add` 结构一致）；行号来自 Int64 列，已是整数。
+            row_numbers = text_df["row_number"].to_list()
+            append_error = errors.append
+            for pos, index, raw_text in pending:
+                field = names[index]
+                if raw_text is None:
+                    append_error(
+                        {
+                            "row_number": row_numbers[pos],
+                            "field": field,
+                            "message": f"Missing required field {field} / 缺少必填字段 {field}",
+                            "type": "required",
+                        }
+                    )
+                else:
+                    append_error(
+                        {
+                            "row_number": row_numbers[pos],
+                            "field": field,
+                            "message": f"Invalid value for {field}: {raw_text} / 字段 {field} 格式错误: {raw_text}",
+                            "value": raw_text,
+                            "type": "format",
+                        }
+                    )
+
+        valid_df = (
+            text_df.select("row_number")
+            .with_columns([result[0].alias(name) for name, result in zip(names, parsed, strict=True)])
+            .filter(~has_error)
+        )
 
-        valid_df = pl.DataFrame(valid_rows) if valid_rows else pl.DataFrame()
-        return valid_df, errors
+        if check_task is not None:
+            db_errors, _ = await check_task
+            if db_errors:
+                valid_numbers = set(valid_df["row_number"].to_list())
+                conflict_rows = {error["row_number"] for error in db_errors}
+                errors.extend(error for error in db_errors if error["row_number"] in valid_numbers)
+                valid_df = valid_df.filter(~pl.col("row_number").is_in(list(conflict_rows)))
 
+        return (valid_df if not valid_df.is_empty() else pl.DataFrame()), errors
+
+    return validate_fn
+
+
+_VALIDATE_FN_CACHE: WeakKeyDictionary[Any, dict[tuple[Any, ...], Any]] = WeakKeyDictionary()
+
+
+def _cached_validate_fn(*, model: Any, specs: list[FieldSpec], unique_fields: list[str] | None) -> Any:
+    """Return the validation function for a model, building it once per spec set.
+    返回模型的校验函数，每组字段规范仅构建一次。
+
+    The function is a pure product of the model, its resolved import specs and the
+    unique fields, so it is reused across imports instead of re-resolving codecs,
+    required flags and casters per request.
+    校验函数仅由模型、解析后的导入字段规范与唯一字段决定，因此可在多次导入间复用，
+    无需每次请求重新解析编解码器、必填标记与转换函数。
+
+    Args:
+        model: SQLAlchemy model class.
+            SQLAlchemy 模型类。
+        specs: Resolved import field specifications.
+            解析后的导入字段规范。
+        unique_fields: Optional per-import unique field list for DB checks.
+            可选的按导入指定的唯一字段列表，用于数据库校验。
+    Returns:
+        Callable: Cached async validation function.
+            缓存的异步校验函数。
+    """
+    key = (tuple(specs), tuple(unique_fields) if unique_fields is not None else None)
+    per_model = _VALIDATE_FN_CACHE.get(model)
+    if per_model is None:
+        per_model = {}
+        _VALIDATE_FN_CACHE[model] = per_model
+    validate_fn = per_model.get(key)
+    if validate_fn is None:
+        validate_fn = _build_validate_fn(model=model, specs=specs, unique_fields=unique_fields)
+        per_model[key] = validate_fn
     return validate_fn
 
 
-def _build_persist_fn(*, model: Any) -> Any:
+_COMMIT_IS_ASYNC_CACHE: dict[type, bool] = {}
+
+
+def _commit_is_async(db: Any, commit: Any) -> bool:
+    """Return whether `db.commit` is a coroutine function, cached per session class.
+    返回 `db.commit` 是否为协程函数，按会话类缓存。
+
+    Args:
+        db: Database session/connection.
+            数据库会话/连接。
+        commit: The bound `commit` callable of `db`.
+            `db` 上绑定的 `commit` 可调用对象。
+
+    Returns:
+        bool: True when `commit` must be awaited.
+            `commit` 需要 await 时返回 True。
+    """
+    cls = type(db)
+    is_async = _COMMIT_IS_ASYNC_CACHE.get(cls)
+    if is_async is None:
+        is_async = inspect.iscoroutinefunction(commit)
+        _COMMIT_IS_ASYNC_CACHE[cls] = is_async
+    return is_async
+
+
+def _has_unique_constraint(table: Any, fields: list[str]) -> bool:
+    """Check whether `fields` exactly match a primary key, unique constraint or unique index.
+    检查 `fields` 是否恰好对应主键、唯一约束或唯一索引。
+
+    Args:
+        table: SQLAlchemy `Table` of the model.
+            模型的 SQLAlchemy `Table`。
+        fields: Unique field names.
+            唯一字段名列表。
+
+    Returns:
+        bool: True when an `ON CONFLICT (fields)` target exists on the table.
+            表上存在 `ON CONFLICT (fields)` 冲突目标时返回 True。
+    """
+    target = set(fields)
+    if not target:
+        return False
+    if len(fields) == 1:
+        column = table.c.get(fields[0])
+        if column is not None and column.unique:
+            return True
+    sa = _require_sqlalchemy()
+    column_sets = [
+        table.primary_key.columns,
+        *(constraint.columns for constraint in table.constraints if isinstance(constraint, sa.UniqueConstraint)),
+        *(index.columns for index in table.indexes if index.unique),
+    ]
+    return any({column.name for column in columns} == target for columns in column_sets)
+
+
+def _resolve_conflict_insert(*, db: Any, model: Any, unique_fields: list[str] | None) -> Any | None:
+    """Resolve a dialect `insert` supporting `ON CONFLICT DO NOTHING` for the unique fields.
+    为唯一字段解析支持 `ON CONFLICT DO NOTHING` 的方言 `insert`。
+
+    Args:
+        db: Asynchronous database session/connection.
+            异步数据库会话/连接。
+        model: SQLAlchemy model class.
+            SQLAlchemy 模型类。
+        unique_fields: Unique field names, if any.
+            唯一字段名列表（如有）。
+
+    Returns:
+        The dialect `insert` construct, or None when the dialect has no conflict clause
+        or `INSERT ... RETURNING`, or the fields are not backed by a unique constraint.
+        方言的 `insert` 构造；若方言不支持冲突子句或 `INSERT ... RETURNING`，或字段无唯一约束则返回 None。
+    """
+    if not unique_fields:
+        return None
+    # Skipped rows are found from RETURNING, which e.g. SQLite before 3.35 lacks.
+    # 被跳过的行通过 RETURNING 识别，而 SQLite 3.35 之前等版本不支持 RETURNING。
+    if not getattr(_dialect(db), "insert_returning", False):
+        return None
+    module_name = _CONFLICT_INSERT_DIALECTS.get(_dialect_name(db))
+    if module_name is None or not _has_unique_constraint(model.__table__, unique_fields):
+        return None
+    return importlib.import_module(module_name).insert
+
+
+def _skipped_conflicts(
+    batch: list[dict[str, Any]],
+    row_numbers: list[Any],
+    *,
+    fields: list[str],
+    inserted: Counter[tuple[Any, ...]],
+) -> list[dict[str, Any]]:
+    """Diff a batch against the keys returned by `ON CONFLICT DO NOTHING ... RETURNING`.
+    将一批输入行与 `ON CONFLICT DO NOTHING ... RETURNING` 返回的键进行比对。
+
+    Each returned key accounts for one input row carrying it; rows left over were
+    skipped by the conflict clause and become `db_unique` errors.
+    每个返回的键对应一条携带该键的输入行；剩余的行即被冲突子句跳过，转换为 `db_unique` 错误。
+
+    Args:
+        batch: Row dicts of the batch, in insert order.
+            按插入顺序排列的批次行字典。
+        row_numbers: Source row number of each batch row.
+            每行对应的源行号。
+        fields: Unique field names, in RETURNING order.
+            唯一字段名列表，与 RETURNING 顺序一致。
+        inserted: Counts of the returned key tuples; consumed by this call.
+            返回键元组的计数；本调用会消耗该计数。
+
+    Returns:
+        list[dict]: Error dicts for the skipped rows.
+            被跳过行的错误字典列表。
+    """
+    field = fields[0] if len(fields) == 1 else None
+    errors: list[dict[str, Any]] = []
+    for row, row_number in zip(batch, row_numbers, strict=True):
+        key = tuple(row.get(name) for name in fields)
+        if inserted[key] > 0:
+            inserted[key] -= 1
+            continue
+        errors.append(
+            {
+                "row_number": row_number,
+                "field": field,
+                "message": f"Unique conflict: {fields}={key} / 唯一性冲突: {fields}={key}",
+                "type": "db_unique",
+                "value": key,
+            }
+        )
+    return errors
+
+
+def _build_persist_fn(*, model: Any, unique_fields: list[str] | None = None) -> Any:
     """Build and return a persistence function for SQLAlchemy insert operations.
     构建并返回用于 SQLAlchemy 插入操作的持久化函数。
 
     The returned `persist_fn` will accept (db, valid_df, *, allow_overwrite=False)
-    and perform bulk insert of validated rows.
-    返回的 `persist_fn` 接受 (db, valid_df, *, allow_overwrite=False) 并对校验通过的行进行批量插入。
+    and perform bulk insert of validated rows. Dialects supporting multi-row VALUES
+    get one INSERT per batch, sized to the dialect's bind-parameter limit; others
+    (e.g. Oracle) keep an executemany INSERT per batch.
+    返回的 `persist_fn` 接受 (db, valid_df, *, allow_overwrite=False)，并批量插入校验通过的行。
+    支持多行 VALUES 的方言每批执行一条 INSERT，批大小按方言的绑定参数上限确定；
+    其他方言（例如 Oracle）每批仍使用 executemany INSERT。
+
+    On PostgreSQL and SQLite, when `unique_fields` match a unique constraint and
+    overwrite is not allowed, rows are inserted with `ON CONFLICT DO NOTHING ...
+    RETURNING` the unique key. Rows written concurrently after validation are then
+    found by diffing the returned keys against each batch; all batches are still
+    tried so every skipped row is reported, after which the transaction is rolled
+    back and an `ImportExportError` listing them as `db_unique` errors is raised.
+    在 PostgreSQL 与 SQLite 上，当 `unique_fields` 对应唯一约束且不允许覆盖时，使用
+    `ON CONFLICT DO NOTHING ... RETURNING` 唯一键插入。校验之后被并发写入的行通过比对返回的键与每批输入识别；
+    所有批次仍会执行以报告全部被跳过的行，随后回滚事务并抛出以 `db_unique` 错误列出这些行的 `ImportExportError`。
 
     Args:
         model: SQLAlchemy model class to insert into.
             要插入的 SQLAlchemy 模型类。
+        unique_fields: Optional unique field names used as the conflict target.
+            可选：用作冲突目标的唯一字段名列表。
 
     Returns:
         Callable: An async persistence function that returns number of written rows.
             异步持久化函数，返回写入的行数。
+
+    Raises:
+        ImportExportError: From `persist_fn`, when conflicting rows were skipped.
+            `persist_fn` 在有冲突行被跳过时抛出。
     """
 
     async def persist_fn(db: Any, valid_df: Any, *, allow_overwrite: bool = False) -> int:
-        rows = valid_df.to_dicts() if not valid_df.is_empty() else []
-        for row in rows:
-            row.pop("row_number", None)
-        if not rows:
+        if valid_df.is_empty():
             return 0
         sa = _require_sqlalchemy()
-        stmt = sa.insert(model)
-        await db.execute(stmt, rows)
+        dialect = _dialect(db)
+        width = valid_df.width - ("row_number" in valid_df.columns)
+        # One multi-row VALUES statement per batch instead of a per-row executemany
+        # where the dialect supports it, with rows * columns under its bind limit.
+        # 方言支持时每批使用一条多行 VALUES 语句代替逐行 executemany，且行数 * 列数不超过其绑定参数上限。
+        multi_values = bool(getattr(dialect, "supports_multivalues_insert", False))
+        batch_size = _insert_batch_size(dialect, width) if multi_values else _INSERT_CHUNK_SIZE
+        conflict_insert = (
+            None if allow_overwrite else _resolve_conflict_insert(db=db, model=model, unique_fields=unique_fields)
+        )
+        written = 0
+        conflicts: list[dict[str, Any]] = []
+        # Row dicts are built one batch at a time from frame slices, so only a single
+        # batch of Python objects is alive alongside the columnar frame; the
+        # bookkeeping column is dropped in Polars.
+        # 按帧切片逐批构建行字典，使与列式数据帧并存的 Python 对象仅有一批；辅助列在 Polars 中删除。
+        for batch_frame in valid_df.iter_slices(n_rows=batch_size):
+            batch = batch_frame.drop("row_number", strict=False).to_dicts()
+            if conflict_insert is None:
+                if multi_values:
+                    await db.execute(sa.insert(model).values(batch))
+                else:
+                    await db.execute(sa.insert(model), batch)
+                written += len(batch)
+                continue
+            stmt = (
+                conflict_insert(model)
+                .values(batch)
+                .on_conflict_do_nothing(index_elements=unique_fields)
+                .returning(*[model.__table__.c[name] for name in unique_fields])
+            )
+            inserted = Counter(tuple(row) for row in (await db.execute(stmt)).all())
+            written += sum(inserted.values())
+            row_numbers = (
+                batch_frame["row_number"].to_list() if "row_number" in batch_frame.columns else [None] * len(batch)
+            )
+            conflicts.extend(_skipped_conflicts(batch, row_numbers, fields=unique_fields, inserted=inserted))
+        if conflicts:
+            rollback = getattr(db, "rollback", None)
+            if callable(rollback):
+                result = rollback()
+                if result is not None and inspect.isawaitable(result):
+                    await result
+            raise ImportExportError(
+                message=(
+                    f"Unique conflict: {len(conflicts)} row(s) match keys written after validation on {unique_fields}"
+                    f" / 唯一性冲突：{len(conflicts)} 行与校验后写入的 {unique_fields} 键冲突"
+                ),
+                details={
+                    "columns": list(unique_fields or []),
+                    "row_numbers": [error["row_number"] for error in conflicts],
+                    "errors": conflicts,
+                },
+            )
         commit = getattr(db, "commit", None)
         if callable(commit):
-            result = commit()
-            if inspect.isawaitable(result):
-                await result
-        return len(rows)
+            if _commit_is_async(db, commit):
+                await commit()
+            else:
+                result = commit()
+                if result is not None and inspect.isawaitable(result):
+                    await result
+        return written
 
     return persist_fn
 
@@ -342,14 +956,16 @@ async def import_model_csv(
     opts = options or ImportOptions()
     effective_unique_fields = unique_fields if unique_fields is not None else opts.unique_fields
     specs = resolve_import_specs(get_field_specs(model), columns)
-    validate_fn = _build_validate_fn(model=model, specs=specs, unique_fields=effective_unique_fields)
-    persist_fn_final = persist_fn or _build_persist_fn(model=model)
+    validate_fn = _cached_validate_fn(model=model, specs=specs, unique_fields=effective_unique_fields)
+    persist_fn_final = persist_fn or _build_persist_fn(model=model, unique_fields=effective_unique_fields)
     svc = ImportExportService(db=db)
     allow_exts = CSV_ALLOWED_EXTENSIONS if opts.allowed_extensions is None else opts.allowed_extensions
     allow_mimes = CSV_ALLOWED_MIME_TYPES if opts.allowed_mime_types is None else opts.allowed_mime_types
     validate_resp = await svc.upload_parse_validate(
         file=file,
-        column_aliases=_build_column_aliases(specs),
+        # Headers already match model field names; None skips the rename pass.
+        # 表头已与模型字段名一致；传入 None 以跳过重命名步骤。
+        column_aliases=None,
         validate_fn=validate_fn,
         allow_overwrite=opts.allow_overwrite,
         unique_fields=effective_unique_fields,
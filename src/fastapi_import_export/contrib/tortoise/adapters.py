@@ -7,11 +7,13 @@
 Tortoise ORM 适配器辅助函数。
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from fastapi_import_export.codecs import BoolCodec, Codec, DateCodec, DatetimeCodec, DecimalCodec, EnumCodec
 from fastapi_import_export.exceptions import ImportExportError
@@ -96,10 +98,59 @@ class FieldSpec:
     field: Any
 
 
+# Built-in codecs are stateless, so one shared instance serves every model.
+# 内置编解码器无状态，所有模型共享同一实例。
+_BOOL_CODEC = BoolCodec()
+_DATE_CODEC = DateCodec()
+_DATETIME_CODEC = DatetimeCodec()
+_DECIMAL_CODEC = DecimalCodec()
+_BASIC_CODECS: dict[type[Any], Codec] = {
+    bool: _BOOL_CODEC,
+    date: _DATE_CODEC,
+    datetime: _DATETIME_CODEC,
+    Decimal: _DECIMAL_CODEC,
+}
+
+_SPEC_CACHE: WeakKeyDictionary[Any, tuple[FieldSpec, ...]] = WeakKeyDictionary()
+_CODEC_CACHE: WeakKeyDictionary[Any, dict[tuple[str, ...], dict[str, Codec]]] = WeakKeyDictionary()
+
+
+def clear_cache() -> None:
+    """Clear cached field specifications and codecs for all models.
+    清除所有模型缓存的字段规范与编解码器。
+    """
+    _SPEC_CACHE.clear()
+    _CODEC_CACHE.clear()
+
+
 def get_field_specs(model: Any) -> list[FieldSpec]:
     """Extract field specifications for a Tortoise model.
     为 Tortoise 模型提取字段规范。
 
+    Results are cached per model class; call `clear_cache()` after mutating a model.
+    结果按模型类缓存；修改模型后请调用 `clear_cache()`。
+
+    Args:
+        model: Tortoise model class.
+            Tortoise 模型类。
+    Returns:
+        List[FieldSpec]: List of extracted field specifications.
+            提取到的字段规范列表。
+    Raises:
+        ImportExportError: If model meta information is missing or malformed.
+            如果模型 meta 信息缺失或格式不正确则抛出。
+    """
+    cached = _SPEC_CACHE.get(model)
+    if cached is None:
+        cached = tuple(_build_field_specs(model))
+        _SPEC_CACHE[model] = cached
+    return list(cached)
+
+
+def _build_field_specs(model: Any) -> list[FieldSpec]:
+    """Extract field specifications for a Tortoise model.
+    为 Tortoise 模型提取字段规范。
+
     Args:
         model: Tortoise model class.
             Tortoise 模型类。
@@ -185,6 +236,9 @@ def resolve_field_codecs(model: Any, specs: list[FieldSpec]) -> dict[str, Codec]
     """Resolve field codecs for a Tortoise model based on field specifications.
     根据字段规范解析 Tortoise 模型的字段编解码器。
 
+    Results are cached per model class and field set; codecs are stateless and shared.
+    结果按模型类与字段集合缓存；编解码器无状态，可共享。
+
     Args:
         model: Tortoise model class.
             Tortoise 模型类。
@@ -194,6 +248,31 @@ def resolve_field_codecs(model: Any, specs: list[FieldSpec]) -> dict[str, Codec]
         Mapping from field name to Codec instance.
             字段名到 Codec 实例的映射。
     """
+    key = tuple(spec.name for spec in specs)
+    per_model = _CODEC_CACHE.get(model)
+    if per_model is None:
+        per_model = {}
+        _CODEC_CACHE[model] = per_model
+    cached = per_model.get(key)
+    if cached is None:
+        cached = _build_field_codecs(model, specs)
+        per_model[key] = cached
+    return cached
+
+
+def _build_field_codecs(model: Any, specs: list[FieldSpec]) -> dict[str, Codec]:
+    """Resolve field codecs without caching.
+    不经缓存地解析字段编解码器。
+
+    Args:
+        model: Tortoise model class.
+            Tortoise 模型类。
+        specs: Field specifications.
+            字段规范列表。
+    Returns:
+        Mapping from field name to Codec instance.
+        字段名到 Codec 实例的映射。
+    """
     custom: dict[str, Codec] = {}
     for attr in ("field_codecs", "__import_export_codecs__"):
         value = getattr(model, attr, None)
@@ -229,14 +308,9 @@ def _infer_codec(spec: FieldSpec) -> Codec | None:
     if py is not None and isinstance(py, type):
         if issubclass(py, Enum):
             return EnumCodec(py)
-        if py is bool:
-            return BoolCodec()
-        if py is date:
-            return DateCodec()
-        if py is datetime:
-            return DatetimeCodec()
-        if py is Decimal:
-            return DecimalCodec()
+        codec = _BASIC_CODECS.get(py)
+        if codec is not None:
+            return codec
 
     enum_type = getattr(spec.field, "enum_type", None)
     if enum_type is not None:
@@ -264,3 +338,40 @@ def cast_basic(value: Any, python_type: type[Any] | None) -> Any:
     if python_type is float:
         return float(str(value).strip())
     return value
+
+
+def _identity(value: str) -> Any:
+    """Return the value unchanged (caster for types without a basic cast).
+    原样返回值（用于无基础转换的类型）。
+
+    Args:
+        value: The stripped cell text.
+            已去除首尾空白的单元格文本。
+    Returns:
+        The same value.
+        相同的值。
+    """
+    return value
+
+
+# `int()`/`float()` already tolerate surrounding whitespace, so no strip wrapper is needed.
+# `int()`/`float()` 本身可容忍首尾空白，无需额外 strip 包装。
+_CASTERS: dict[type[Any], Callable[[str], Any]] = {int: int, float: float}
+
+
+def resolve_caster(python_type: type[Any] | None) -> Callable[[str], Any]:
+    """Resolve a specialized caster for a Python type once per field.
+    为每个字段一次性解析专用的类型转换函数。
+
+    The returned callable is equivalent to `cast_basic(text, python_type)` for
+    stripped text, but avoids re-dispatching on the type for every cell.
+    返回的函数对已去空白的文本等价于 `cast_basic(text, python_type)`，但避免每个单元格重复按类型分派。
+
+    Args:
+        python_type: The target Python type, or None to leave unchanged.
+        python_type: 目标 Python 类型，或 None 表示保持不变。
+    Returns:
+        A callable converting stripped cell text to the target type.
+        将去空白的单元格文本转换为目标类型的可调用对象。
+    """
+    return _CASTERS.get(python_type, _identity) if python_type is not None else _identity
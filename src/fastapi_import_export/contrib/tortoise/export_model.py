@@ -7,16 +7,113 @@
 Tortoise ORM CSV 导出适配器。
 """
 
+from collections.abc import AsyncIterator
 from typing import Any
 
+from fastapi_import_export.codecs import Codec
 from fastapi_import_export.contrib.tortoise.adapters import (
+    FieldSpec,
+    _require_polars,
     get_field_specs,
     resolve_export_specs,
     resolve_field_codecs,
 )
 from fastapi_import_export.easy import export_csv
 from fastapi_import_export.exporter import ExportPayload
+from fastapi_import_export.formats import ExportFormat, media_type_for
 from fastapi_import_export.options import ExportOptions
+from fastapi_import_export.serializers import CsvSerializer
+
+_EXPORT_PARTITION_SIZE = 10_000
+
+
+def _build_export_frame(*, specs: list[FieldSpec], codecs: dict[str, Codec], rows: list[tuple[Any, ...]]) -> Any:
+    """Build a Polars DataFrame from `values_list` tuples, formatting codecs column by column.
+    由 `values_list` 元组构建 Polars DataFrame，并按列应用编解码器格式化。
+
+    Codec columns become strings and plain int/float/str columns keep a native dtype;
+    any other column is stored as `pl.Object` so the exported values stay unchanged.
+    编解码器列转为字符串，普通 int/float/str 列保留原生类型；其他列以 `pl.Object` 存储，导出值保持不变。
+
+    Args:
+        specs: Export field specifications.
+            导出字段规范。
+        codecs: Field codecs keyed by field name.
+            以字段名为键的字段编解码器。
+        rows: Positional rows in spec order.
+            按字段规范顺序排列的位置行。
+    Returns:
+        A Polars DataFrame with one column per spec.
+        每个字段规范对应一列的 Polars DataFrame。
+    """
+    pl = _require_polars()
+    native = {int: pl.Int64, float: pl.Float64, str: pl.String}
+    columns = list(zip(*rows, strict=True)) if rows else [() for _ in specs]
+    series = []
+    for spec, values in zip(specs, columns, strict=True):
+        codec = codecs.get(spec.name)
+        if codec is not None:
+            fmt = codec.format
+            series.append(pl.Series(spec.name, [fmt(value) for value in values], dtype=pl.String))
+            continue
+        dtype = native.get(spec.python_type) if spec.python_type is not None else None
+        try:
+            series.append(pl.Series(spec.name, values, dtype=dtype or pl.Object))
+        except (TypeError, OverflowError, pl.exceptions.PolarsError):
+            series.append(pl.Series(spec.name, values, dtype=pl.Object))
+    return pl.DataFrame(series)
+
+
+async def _stream_csv(
+    *,
+    model: Any,
+    queryset: Any,
+    specs: list[FieldSpec],
+    codecs: dict[str, Codec],
+    options: ExportOptions,
+) -> AsyncIterator[bytes]:
+    """Stream queryset rows as CSV chunks using keyset pagination on the primary key.
+    基于主键的键集分页，将 queryset 行按块流式输出为 CSV。
+
+    Each page holds at most `_EXPORT_PARTITION_SIZE` rows; the header (and BOM) is
+    only written with the first chunk.
+    每页最多包含 `_EXPORT_PARTITION_SIZE` 行；表头（及 BOM）仅随第一块写出。
+
+    Args:
+        model: Tortoise model class.
+            Tortoise 模型类。
+        queryset: Filtered queryset to export.
+            已过滤的待导出 queryset。
+        specs: Export field specifications.
+            导出字段规范。
+        codecs: Field codecs keyed by field name.
+            以字段名为键的字段编解码器。
+        options: Effective export options (columns, BOM, line ending).
+            生效的导出选项（列、BOM、换行符）。
+    Yields:
+        bytes: Encoded CSV chunks.
+            编码后的 CSV 分块。
+    """
+    serializer = CsvSerializer()
+    pk_attr = model._meta.pk_attr
+    field_names = [spec.name for spec in specs]
+    first = True
+    last_pk: Any = None
+    while True:
+        page = queryset.order_by(pk_attr)
+        if last_pk is not None:
+            page = page.filter(**{f"{pk_attr}__gt": last_pk})
+        rows = await page.limit(_EXPORT_PARTITION_SIZE).values_list(pk_attr, *field_names)
+        if not rows:
+            break
+        last_pk = rows[-1][0]
+        frame = _build_export_frame(specs=specs, codecs=codecs, rows=[row[1:] for row in rows])
+        yield serializer.serialize(data=frame, options=options, include_header=first)
+        first = False
+        if len(rows) < _EXPORT_PARTITION_SIZE:
+            break
+    if first:
+        yield serializer.serialize(data=[], options=options)
 
 
 async def export_model_csv(
@@ -25,10 +122,15 @@ async def export_model_csv(
     filters: dict[str, object] | None = None,
     columns: list[str] | None = None,
     options: ExportOptions | None = None,
+    stream: bool = False,
 ) -> ExportPayload:
     """Export ORM model rows to CSV using Tortoise ORM.
     使用 Tortoise ORM 导出 CSV。
 
+    With `stream=True`, rows are fetched lazily page by page (keyset pagination on
+    the primary key) while the payload is consumed, keeping memory bounded.
+    当 `stream=True` 时，在消费负载的过程中按页（基于主键的键集分页）惰性获取行以限制内存。
+
     Args:
         model: Tortoise model class.
             Tortoise 模型类。
@@ -38,6 +140,8 @@ async def export_model_csv(
             可选：要包含的列名列表。
         options: Optional `ExportOptions` to override defaults.
             可选的 `ExportOptions`，用于覆盖默认导出设置。
+        stream: Whether to stream rows page by page instead of loading them all.
+            是否按页流式读取行，而不是一次性全部加载。
 
     Returns:
         ExportPayload: Export result with filename, media type and byte stream.
@@ -64,16 +168,6 @@ async def export_model_csv(
         queryset = model.filter(**kwargs)
 
     field_names = [spec.name for spec in specs]
-    rows = await queryset.values(*field_names) if field_names else await queryset.values()
-    data: list[dict[str, Any]] = []
-    for row in rows:
-        item: dict[str, Any] = {}
-        for spec in specs:
-            value = row.get(spec.name)
-            codec = codecs.get(spec.name)
-            item[spec.name] = codec.format(value) if codec is not None else value
-        data.append(item)
-
     filename = options.filename if options else None
     effective_options = ExportOptions(
         filename=filename or f"{model.__name__.lower()}.csv",
@@ -83,4 +177,19 @@ async def export_model_csv(
         chunk_size=options.chunk_size if options else 64 * 1024,
         columns=field_names,
     )
+    if stream:
+        return ExportPayload(
+            filename=effective_options.filename or f"{model.__name__.lower()}.csv",
+            media_type=effective_options.media_type or media_type_for(ExportFormat.CSV),
+            stream=_stream_csv(model=model, queryset=queryset, specs=specs, codecs=codecs, options=effective_options),
+        )
+
+    data: Any
+    if field_names:
+        # Fetch positional tuples and format whole columns instead of building a dict per row.
+        # 获取按位置排列的元组并整列格式化，而不是为每行构建字典。
+        data = _build_export_frame(specs=specs, codecs=codecs, rows=await queryset.values_list(*field_names))
+    else:
+        data = [{} for _ in await queryset.values()]
+
     return await export_csv(data, options=effective_options)
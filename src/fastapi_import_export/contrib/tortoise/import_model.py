@@ -7,16 +7,24 @@
 Tortoise ORM CSV 导入适配器。
 """
 
+import asyncio
+from copy import copy
+from datetime import date
+from enum import Enum
+from itertools import batched, repeat
 from typing import Any
+from uuid import uuid4
+from weakref import WeakKeyDictionary
 
 from fastapi import UploadFile
 
+from fastapi_import_export.codecs import BoolCodec, Codec
 from fastapi_import_export.contrib.tortoise.adapters import (
     FieldSpec,
     _require_polars,
     _require_tortoise,
-    cast_basic,
     get_field_specs,
+    resolve_caster,
     resolve_field_codecs,
     resolve_import_specs,
 )
@@ -25,21 +33,25 @@ from fastapi_import_export.importer import ImportResult, ImportStatus
 from fastapi_import_export.options import ImportOptions
 from fastapi_import_export.schemas import ImportCommitRequest, ImportErrorItem
 from fastapi_import_export.service import ImportExportService
-from fastapi_import_export.validation_core import ErrorCollector
 
-
-def _build_column_aliases(specs: list[FieldSpec]) -> dict[str, str]:
-    """Build column alias mapping for Tortoise import.
-    为 Tortoise 导入构建列别名映射。
-
-    Args:
-        specs: Field specification list.
-            字段规范列表。
-    Returns:
-        dict[str, str]: Column name -> alias mapping.
-            列名到别名的映射。
-    """
-    return {spec.name: spec.name for spec in specs}
+_UNIQUE_CHECK_CHUNK_SIZE = 1000
+# Parsed-column dtypes by field type; other types (Decimal, Enum, tz-aware datetimes)
+# keep value-based inference so no precision or timezone is lost.
+# 按字段类型确定的解析列类型；其他类型（Decimal、Enum、带时区的日期时间）仍按值推断，避免丢失精度或时区。
+_POLARS_DTYPE_NAMES: dict[type[Any], str] = {int: "Int64", float: "Float64", bool: "Boolean", date: "Date"}
+_THREADED_VALIDATION_MIN_ROWS = 50_000
+_BULK_CREATE_BATCH_SIZE = 1000
+_COPY_MIN_ROWS = 500
+# Identifier quote per Tortoise dialect with row-value `IN` support.
+# 支持行值 `IN` 的 Tortoise 方言对应的标识符引号。
+_ROW_VALUE_IN_QUOTES = {"postgres": '"', "sqlite": '"', "mysql": "`"}
+# On asyncpg, key sets of at least this size are checked by COPYing them into a
+# temporary table and joining it with the target table.
+# 在 asyncpg 上，键数量不少于该值时通过 COPY 写入临时表并与目标表连接来校验。
+_TEMP_TABLE_MIN_KEYS = 5000
+# Each check appends a random suffix so concurrent checks on one connection never collide.
+# 每次校验附加随机后缀，使同一连接上的并发校验互不冲突。
+_TEMP_TABLE_PREFIX = "_import_unique_keys"
 
 
 def _required_fields(specs: list[FieldSpec]) -> set[str]:
@@ -65,12 +77,180 @@ def _required_fields(specs: list[FieldSpec]) -> set[str]:
     return required
 
 
+def _to_db_param(field: Any, value: Any) -> Any:
+    """Convert a parsed key value to a driver parameter using the field's `to_db_value`.
+    使用字段的 `to_db_value` 将解析后的键值转换为驱动参数。
+
+    Args:
+        field: Tortoise field object.
+            Tortoise 字段对象。
+        value: Parsed Python value.
+            解析后的 Python 值。
+    Returns:
+        The database value, or the original value when the field needs an instance.
+        数据库值；若字段转换需要实例则返回原值。
+    """
+    try:
+        return field.to_db_value(value, None)
+    except Exception:
+        return value
+
+
+async def _fetch_existing_tuples(*, model: Any, fields: list[str], keys: tuple[Any, ...]) -> list[Any] | None:
+    """Fetch existing composite keys with one row-value `IN` query.
+    使用一条行值 `IN` 查询获取已存在的组合键。
+
+    Builds `SELECT f1, f2 FROM table WHERE (f1, f2) IN ((..), ..)` with the
+    client's placeholder style and converts the result back with `to_python_value`.
+    按客户端的占位符风格构建 `SELECT f1, f2 FROM table WHERE (f1, f2) IN ((..), ..)`，
+    并通过 `to_python_value` 将结果转换回 Python 值。
+
+    Args:
+        model: Tortoise model class.
+            Tortoise 模型类。
+        fields: Composite unique field names.
+            组合唯一字段名列表。
+        keys: Batch of key tuples.
+            键元组批次。
+    Returns:
+        Existing key tuples, or None when the dialect has no row-value `IN` support.
+        已存在的键元组；若方言不支持行值 `IN` 则返回 None。
+    """
+    meta = model._meta
+    client = meta.db
+    dialect = getattr(getattr(client, "capabilities", None), "dialect", None)
+    quote = _ROW_VALUE_IN_QUOTES.get(dialect or "")
+    if quote is None:
+        return None
+    field_objects = [meta.fields_map[name] for name in fields]
+    columns = [meta.fields_db_projection[name] for name in fields]
+    width = len(fields)
+    # The "postgres" dialect covers asyncpg (`$n`) and psycopg (`%s`), so pick by client.
+    # "postgres" 方言同时涵盖 asyncpg（`$n`）与 psycopg（`%s`），因此按客户端选择占位符。
+    if _is_asyncpg_client(client):
+        groups = ["(" + ", ".join(f"${i * width + j + 1}" for j in range(width)) + ")" for i in range(len(keys))]
+    else:
+        marker = "?" if dialect == "sqlite" else "%s"
+        groups = ["(" + ", ".join([marker] * width) + ")"] * len(keys)
+    quoted = ", ".join(f"{quote}{column}{quote}" for column in columns)
+    table = f"{quote}{meta.db_table}{quote}"
+    schema = getattr(meta, "schema", None)
+    if schema:
+        table = f"{quote}{schema}{quote}.{table}"
+    sql = f"SELECT {quoted} FROM {table} WHERE ({quoted}) IN ({', '.join(groups)})"
+    params = [_to_db_param(field, part) for key in keys for field, part in zip(field_objects, key, strict=True)]
+    result = await client.execute_query_dict(sql, params)
+    return [
+        tuple(field.to_python_value(row[column]) for field, column in zip(field_objects, columns, strict=True))
+        for row in result
+    ]
+
+
+async def _fetch_existing_via_temp_table(*, model: Any, fields: list[str], keys: list[Any]) -> list[Any]:
+    """Fetch existing keys by COPYing them into a temporary table and joining it (asyncpg).
+    将键 COPY 到临时表并与目标表连接以获取已存在的键（asyncpg）。
+
+    The temporary table copies the key column types from the target table, so the
+    join runs as a native hash join instead of a large parameterized `IN` list.
+    It gets a unique name, is created `ON COMMIT DROP` and is used inside its own
+    transaction (a savepoint when the client is already in one), so a failing COPY
+    is rolled back without leaving the table behind or masking the original error.
+    临时表沿用目标表键列的类型，连接以原生哈希连接执行，而非庞大的参数化 `IN` 列表。
+    临时表使用唯一名称、以 `ON COMMIT DROP` 创建，并在独立事务中使用（客户端已处于事务中时为保存点），
+    因此 COPY 失败时会被回滚，既不会遗留该表，也不会掩盖原始错误。
+
+    Args:
+        model: Tortoise model class.
+            Tortoise 模型类。
+        fields: Unique field names.
+            唯一字段名列表。
+        keys: Keys to check; bare values for one field, tuples otherwise.
+            待校验的键；单字段为原值，否则为元组。
+    Returns:
+        Existing keys in the same shape as `keys`.
+        已存在的键，形式与 `keys` 相同。
+    """
+    meta = model._meta
+    single = len(fields) == 1
+    field_objects = [meta.fields_map[name] for name in fields]
+    columns = [meta.fields_db_projection[name] for name in fields]
+    quoted = ", ".join(f'"{column}"' for column in columns)
+    table = f'"{meta.db_table}"'
+    schema = getattr(meta, "schema", None)
+    if schema:
+        table = f'"{schema}".{table}'
+    records = [
+        tuple(_to_db_param(field, part) for field, part in zip(field_objects, (key,) if single else key, strict=True))
+        for key in keys
+    ]
+    temp_name = f"{_TEMP_TABLE_PREFIX}_{uuid4().hex}"
+    temp_table = f'"{temp_name}"'
+    async with meta.db.acquire_connection() as connection, connection.transaction():
+        await connection.execute(
+            f"CREATE TEMP TABLE {temp_table} ON COMMIT DROP AS SELECT {quoted} FROM {table} WITH NO DATA"
+        )
+        await connection.copy_records_to_table(temp_name, records=records, columns=columns)
+        rows = await connection.fetch(f"SELECT DISTINCT {quoted} FROM {table} JOIN {temp_table} USING ({quoted})")
+        # Free the table now; ON COMMIT DROP only fires when an enclosing transaction commits.
+        # 立即删除该表；ON COMMIT DROP 仅在外层事务提交时生效。
+        await connection.execute(f"DROP TABLE {temp_table}")
+    matched = [
+        tuple(field.to_python_value(value) for field, value in zip(field_objects, row, strict=True)) for row in rows
+    ]
+    return [key[0] for key in matched] if single else matched
+
+
+def _group_row_numbers(df: Any, fields: list[str]) -> dict[Any, list[int]]:
+    """Group row numbers by unique key, skipping rows with a null or blank key part.
+    按唯一键分组行号，跳过任一键部分为空或空白的行。
+
+    Keys are grouped by Polars `group_by`; single-field keys are bare values and
+    composite keys are tuples. Object columns (e.g. parsed enums) cannot be hashed
+    by Polars and are grouped in Python instead.
+    使用 Polars `group_by` 分组；单字段键为原值，组合键为元组。Object 列（例如解析后的枚举）
+    无法由 Polars 哈希，改为在 Python 中分组。
+
+    Args:
+        df: Frame with `row_number` and the key columns.
+            包含 `row_number` 与键列的数据帧。
+        fields: Unique field names.
+            唯一字段名列表。
+    Returns:
+        Mapping from key to the row numbers carrying it, in first-seen order.
+        键到其所在行号列表的映射，按首次出现顺序排列。
+    """
+    pl = _require_polars()
+    keyed = df.drop_nulls(fields)
+    blank = [pl.col(name).str.strip_chars() == "" for name in fields if keyed.schema[name] == pl.String]
+    if blank:
+        keyed = keyed.filter(~pl.any_horizontal(blank))
+    if keyed.is_empty():
+        return {}
+    if any(keyed.schema[name] == pl.Object for name in fields):
+        key_to_rows: dict[Any, list[int]] = {}
+        values = (
+            keyed[fields[0]].to_list()
+            if len(fields) == 1
+            else zip(*[keyed[name].to_list() for name in fields], strict=True)
+        )
+        for key, row_number in zip(values, keyed["row_number"].to_list(), strict=True):
+            key_to_rows.setdefault(key, []).append(row_number)
+        return key_to_rows
+    grouped = keyed.group_by(fields, maintain_order=True).agg(pl.col("row_number"))
+    keys = (
+        grouped[fields[0]].to_list()
+        if len(fields) == 1
+        else zip(*[grouped[name].to_list() for name in fields], strict=True)
+    )
+    return dict(zip(keys, grouped["row_number"].to_list(), strict=True))
+
+
 async def _check_db_unique(
     *,
     model: Any,
     unique_fields: list[str],
-    rows: list[dict[str, Any]],
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    df: Any,
+) -> tuple[list[dict[str, Any]], Any]:
     """Check for existing records in the DB that conflict with unique fields (Tortoise).
     检查数据库中是否存在与唯一字段冲突的记录（Tortoise 版本）。
 
@@ -82,68 +262,251 @@ async def _check_db_unique(
             Tortoise 模型类。
         unique_fields: Fields to consider for uniqueness.
             用于唯一性判断的字段列表。
-        rows: Candidate rows with `row_number` for error reporting.
-            带有 `row_number` 的候选行，用于错误定位。
+        df: Candidate key frame: an Int64 `row_number` column plus the parsed key columns.
+            候选键数据帧：Int64 的 `row_number` 列及解析后的键列。
 
     Returns:
         Tuple of (errors, filtered_rows).
-            (错误列表, 过滤后的行列表)。
+            (错误列表, 过滤后的键数据帧)。
     """
     _require_tortoise()
-    from tortoise.expressions import Q
 
     fields = [f for f in unique_fields if f]
     if not fields:
-        return [], rows
-
-    key_to_rows: dict[tuple[Any, ...], list[int]] = {}
-    for row in rows:
-        key = tuple(row.get(f) for f in fields)
-        if any(part is None or (isinstance(part, str) and not part.strip()) for part in key):
-            continue
-        key_to_rows.setdefault(key, []).append(int(row.get("row_number") or 0))
+        return [], df
 
+    if any(name not in df.columns for name in fields):
+        return [], df
+    single = len(fields) == 1
+    key_to_rows = _group_row_numbers(df, fields)
     keys = list(key_to_rows.keys())
     if not keys:
-        return [], rows
-
-    existing: set[tuple[Any, ...]] = set()
-    if len(fields) == 1:
-        values = [k[0] for k in keys]
-        existing_values = await model.filter(**{f"{fields[0]}__in": values}).values_list(fields[0], flat=True)
-        existing = {(v,) for v in existing_values}
+        return [], df
+
+    # Query in bounded batches, issued concurrently so their round trips overlap.
+    # Composite keys use a row-value IN query where the dialect supports it; otherwise
+    # one IN-list per field (a superset of the batch) is intersected locally, avoiding
+    # a giant OR-tree.
+    # 分批并发查询，使各批次的往返时间重叠。方言支持时组合键使用行值 IN 查询；
+    # 否则对每个字段使用一个 IN 列表（批次的超集）并在本地取交集，避免巨大的 OR 树。
+    # Very large key sets on asyncpg are joined through a temporary table instead.
+    # 在 asyncpg 上，超大键集合改为通过临时表连接校验。
+    async def fetch_batch(batch: tuple[Any, ...]) -> list[Any]:
+        if single:
+            return list(await model.filter(**{f"{fields[0]}__in": list(batch)}).values_list(fields[0], flat=True))
+        matched = await _fetch_existing_tuples(model=model, fields=fields, keys=batch)
+        if matched is None:
+            filters = {f"{name}__in": list({k[idx] for k in batch}) for idx, name in enumerate(fields)}
+            matched = [tuple(r) for r in await model.filter(**filters).values_list(*fields)]
+        return matched
+
+    if len(keys) >= _TEMP_TABLE_MIN_KEYS and _is_asyncpg_client(model._meta.db):
+        results = [await _fetch_existing_via_temp_table(model=model, fields=fields, keys=keys)]
     else:
-        query = None
-        for key in keys:
-            cond = Q(**dict(zip(fields, key, strict=True)))
-            query = cond if query is None else (query | cond)
-        if query is not None:
-            existing_rows = await model.filter(query).values_list(*fields)
-            existing = {tuple(r) for r in existing_rows}
+        results = await asyncio.gather(*[fetch_batch(batch) for batch in batched(keys, _UNIQUE_CHECK_CHUNK_SIZE)])
+    existing = {key for matched in results for key in matched if key in key_to_rows}
 
     if not existing:
-        return [], rows
-
+        return [], df
+
+    conflict_keys = [key for key in key_to_rows if key in existing]
+    if not conflict_keys:
+        return [], df
+    pl = _require_polars()
+    if any(df.schema[name] == pl.Object for name in fields):
+        # Object columns cannot be joined; drop conflicting rows by row number.
+        # Object 列无法参与连接；按行号剔除冲突行。
+        conflicts = [(rn, key) for key in conflict_keys for rn in key_to_rows[key]]
+        filtered = df.filter(~pl.col("row_number").is_in([rn for rn, _ in conflicts]))
+    else:
+        # Semi/anti join the key frame with the existing keys instead of matching rows in Python.
+        # 使用半连接/反连接将键数据帧与已存在的键匹配，而非在 Python 中逐行匹配。
+        columns = [conflict_keys] if single else [list(part) for part in zip(*conflict_keys, strict=True)]
+        existing_df = pl.DataFrame(columns, schema={name: df.schema[name] for name in fields}, orient="col")
+        matched = df.join(existing_df, on=fields, how="semi", maintain_order="left").select("row_number", *fields)
+        conflicts = [(row[0], row[1] if single else row[1:]) for row in matched.iter_rows()]
+        filtered = df.join(existing_df, on=fields, how="anti", maintain_order="left")
+
+    field = fields[0] if single else None
     errors: list[dict[str, Any]] = []
-    conflict_rows: set[int] = set()
-    for key in existing:
-        row_numbers = key_to_rows.get(key, [])
-        for rn in row_numbers:
-            errors.append(
-                {
-                    "row_number": int(rn),
-                    "field": fields[0] if len(fields) == 1 else None,
-                    "message": f"Unique conflict: {fields}={key} / 唯一性冲突: {fields}={key}",
-                    "type": "db_unique",
-                    "value": key,
-                }
-            )
-            conflict_rows.add(int(rn))
-
-    filtered = [row for row in rows if int(row.get("row_number") or 0) not in conflict_rows]
+    for rn, key in conflicts:
+        value = (key,) if single else key
+        errors.append(
+            {
+                "row_number": rn,
+                "field": field,
+                "message": f"Unique conflict: {fields}={value} / 唯一性冲突: {fields}={value}",
+                "type": "db_unique",
+                "value": value,
+            }
+        )
     return errors, filtered
 
 
+def _stringify(value: Any) -> str:
+    """Convert a non-text cell to stripped text.
+    将非文本单元格转换为去除首尾空白的文本。
+
+    Args:
+        value: Cell value.
+            单元格值。
+    Returns:
+        str: Stripped text.
+            去除首尾空白的文本。
+    """
+    return str(value).strip()
+
+
+def _text_expr(pl: Any, df: Any, name: str) -> Any:
+    """Build the stripped-text expression of a field with blank cells mapped to null.
+    构建字段的去空白文本表达式，空白单元格映射为 null。
+
+    Args:
+        pl: The Polars module.
+            Polars 模块。
+        df: Input DataFrame.
+            输入 DataFrame。
+        name: Field name.
+            字段名。
+    Returns:
+        A Polars expression aliased to `name`.
+        以 `name` 命名的 Polars 表达式。
+    """
+    dtype = df.schema.get(name)
+    if dtype is None or dtype == pl.Null:
+        return pl.lit(None, dtype=pl.String).alias(name)
+    if dtype == pl.String:
+        expr = pl.col(name).str.strip_chars()
+    else:
+        expr = pl.lit(pl.Series(name, [_stringify(v) if v is not None else None for v in df[name]], dtype=pl.String))
+    return pl.when(expr != "").then(expr).alias(name)
+
+
+def _to_series(pl: Any, name: str, values: list[Any], dtype: Any = None) -> Any:
+    """Build a Series from parsed Python values, falling back to row-wise inference.
+    由解析后的 Python 值构建 Series，失败时回退到按行推断。
+
+    Args:
+        pl: The Polars module.
+            Polars 模块。
+        name: Series name.
+            Series 名称。
+        values: Parsed values.
+            解析后的值。
+        dtype: Expected Polars dtype; skips inference when the values match it.
+            预期的 Polars 类型；值与之匹配时跳过类型推断。
+    Returns:
+        A Polars Series.
+        Polars Series。
+    """
+    if any(isinstance(value, Enum) for value in values):
+        # The Series constructor stores enum members as their values, which ORM enum
+        # columns would then persist instead of the member; keep the members as objects.
+        # Series 构造器会将枚举成员存为其值，ORM 枚举列随后会持久化该值而非成员；因此保留成员对象。
+        return pl.Series(name, range(len(values))).map_elements(values.__getitem__, return_dtype=pl.Object)
+    if dtype is not None:
+        try:
+            return pl.Series(name, values, dtype=dtype)
+        except Exception:
+            pass
+    try:
+        return pl.Series(name, values, strict=False)
+    except Exception:
+        return pl.DataFrame([{name: value} for value in values])[name]
+
+
+def _polars_dtype(pl: Any, python_type: type[Any] | None) -> Any:
+    """Map a field's Python type to the Polars dtype of its parsed column.
+    将字段的 Python 类型映射为其解析列的 Polars 类型。
+
+    Args:
+        pl: The Polars module.
+            Polars 模块。
+        python_type: Field Python type, or None.
+            字段的 Python 类型，或 None。
+    Returns:
+        The Polars dtype, or None to let Polars infer it from the values.
+        Polars 类型；返回 None 时由 Polars 根据值推断。
+    """
+    name = _POLARS_DTYPE_NAMES.get(python_type) if python_type is not None else None
+    return getattr(pl, name) if name is not None else None
+
+
+def _parse_bool(pl: Any, text: Any, codec: BoolCodec) -> tuple[Any, Any]:
+    """Parse a stripped text column with the built-in `BoolCodec` rules, column-wise.
+    按内置 `BoolCodec` 规则对去空白文本列进行整列解析。
+
+    Args:
+        pl: The Polars module.
+            Polars 模块。
+        text: Stripped text Series with blanks as null.
+            去空白且空白为 null 的文本 Series。
+        codec: The bool codec supplying the truthy/falsy spellings.
+            提供真/假拼写集合的布尔编解码器。
+    Returns:
+        Tuple of (values, failed): Boolean Series and boolean Series of parse failures.
+            (values, failed)：布尔 Series 与表示解析失败的布尔 Series。
+    """
+    lowered = text.str.to_lowercase()
+    truthy = lowered.is_in(list(codec._truthy)).fill_null(False)
+    matched = truthy | lowered.is_in(list(codec._falsy)).fill_null(False)
+    missing = pl.Series(text.name, [None] * text.len(), dtype=pl.Boolean)
+    return truthy.zip_with(matched, missing).alias(text.name), text.is_not_null() & ~matched
+
+
+def _parse_field(pl: Any, text: Any, *, codec: Codec | None, caster: Any, dtype: Any = None) -> tuple[Any, Any]:
+    """Parse one stripped text column into typed values and a failure mask.
+    将一列去空白文本解析为类型化值与失败掩码。
+
+    int/float columns without a codec are cast by Polars in one pass; only when
+    some cells fail that cast does the column fall back to the Python caster,
+    which keeps Python's parsing rules. Built-in bool codec columns are matched
+    column-wise; other codec columns are parsed value by value.
+    无编解码器的 int/float 列由 Polars 一次性转换；仅当部分单元格转换失败时才回退到 Python
+    转换函数，以保持 Python 的解析规则。内置布尔编解码器列按列匹配；其他编解码器列逐值解析。
+
+    Args:
+        pl: The Polars module.
+            Polars 模块。
+        text: Stripped text Series with blanks as null.
+            去空白且空白为 null 的文本 Series。
+        codec: Field codec, if any.
+            字段编解码器（如有）。
+        caster: Basic caster resolved for the field.
+            为字段解析的基础转换函数。
+        dtype: Expected Polars dtype of the parsed values, if known.
+            解析结果的预期 Polars 类型（如已知）。
+    Returns:
+        Tuple of (values, failed): parsed Series and boolean Series of parse failures.
+            (values, failed)：解析后的 Series 与表示解析失败的布尔 Series。
+    """
+    if codec is None:
+        if caster is int or caster is float:
+            values = text.cast(pl.Int64 if caster is int else pl.Float64, strict=False)
+            failed = text.is_not_null() & values.is_null()
+            if not failed.any():
+                return values, failed
+        else:
+            return text, pl.repeat(False, text.len(), eager=True)
+    elif type(codec) is BoolCodec:
+        return _parse_bool(pl, text, codec)
+    parse = codec.parse if codec is not None else caster
+    parsed: list[Any] = []
+    flags: list[bool] = []
+    for raw_text in text.to_list():
+        if raw_text is None:
+            parsed.append(None)
+            flags.append(False)
+            continue
+        try:
+            parsed.append(parse(raw_text))
+            flags.append(False)
+        except Exception:
+            parsed.append(None)
+            flags.append(True)
+    return _to_series(pl, text.name, parsed, dtype), pl.Series(flags, dtype=pl.Boolean)
+
+
 def _build_validate_fn(
     *,
     model: Any,
@@ -171,77 +534,292 @@ def _build_validate_fn(
     """
     codecs = resolve_field_codecs(model, specs)
     required = _required_fields(specs)
+    names = [spec.name for spec in specs]
+    # Per-field lookups resolved once, indexed by field position.
+    # 按字段位置预先解析的逐字段查找结果。
+    required_flags = [name in required for name in names]
+    codec_list = [codecs.get(name) for name in names]
+    caster_list = [resolve_caster(spec.python_type) for spec in specs]
 
     async def validate_fn(db: Any, df: Any, *, allow_overwrite: bool = False) -> tuple[Any, list[dict[str, Any]]]:
         pl = _require_polars()
+        dtype_list = [_polars_dtype(pl, spec.python_type) for spec in specs]
         errors: list[dict[str, Any]] = []
-        collector = ErrorCollector(errors)
-        valid_rows: list[dict[str, Any]] = []
-        rows = df.to_dicts() if not df.is_empty() else []
-        for row in rows:
-            row_number = int(row.get("row_number") or 0)
-            parsed: dict[str, Any] = {"row_number": row_number}
-            has_error = False
-            for spec in specs:
-                field = spec.name
-                raw = row.get(field)
-                raw_text = str(raw).strip() if raw is not None else ""
-                if raw is None or raw_text == "":
-                    if field in required:
-                        collector.add(
-                            row_number=row_number,
-                            field=field,
-                            message=f"Missing required field {field} / 缺少必填字段 {field}",
-                            type="required",
-                        )
-                        has_error = True
-                    parsed[field] = None
-                    continue
-                codec = codecs.get(field)
-                if codec is not None:
-                    try:
-                        parsed[field] = codec.parse(raw_text)
-                    except Exception:
-                        collector.add(
-                            row_number=row_number,
-                            field=field,
-                            message=f"Invalid value for {field}: {raw_text} / 字段 {field} 格式错误: {raw_text}",
-                            type="format",
-                            value=raw_text,
+        if df.is_empty():
+            return pl.DataFrame(), errors
+        # Normalize every field to stripped text (blank -> null) in one Polars pass.
+        # 在一次 Polars 计算中将所有字段规范为去空白文本（空白 -> null）。
+        row_number_expr = (
+            pl.col("row_number").fill_null(0).cast(pl.Int64)
+            if "row_number" in df.columns
+            else pl.lit(0, dtype=pl.Int64)
+        )
+        text_df = df.with_columns(
+            row_number_expr.alias("row_number"), *[_text_expr(pl, df, name) for name in names]
+        ).select("row_number", *names)
+        parsed: list[Any] = [None] * len(names)
+
+        check_task: asyncio.Task[tuple[list[dict[str, Any]], Any]] | None = None
+        if unique_fields and not allow_overwrite:
+            # Start the DB unique check on the key columns first so its round trip
+            # overlaps with parsing the remaining columns.
+            # 先基于键列发起数据库唯一性校验，使其往返时间与其余列的解析重叠。
+            key_indexes = [index for index, name in enumerate(names) if name in unique_fields]
+            for index in key_indexes:
+                parsed[index] = _parse_field(
+                    pl,
+                    text_df[names[index]],
+                    codec=codec_list[index],
+                    caster=caster_list[index],
+                    dtype=dtype_list[index],
+                )
+            key_df = pl.DataFrame(
+                [text_df["row_number"], *[parsed[index][0].alias(names[index]) for index in key_indexes]]
+            )
+            check_task = asyncio.create_task(_check_db_unique(model=model, unique_fields=unique_fields, df=key_df))
+            await asyncio.sleep(0)
+        try:
+            pending_indexes = [index for index in range(len(names)) if parsed[index] is None]
+            if text_df.height >= _THREADED_VALIDATION_MIN_ROWS:
+                # Parse columns on worker threads for large imports: Polars casts release the
+                # GIL and the event loop stays responsive while codec columns are parsed.
+                # 大批量导入时在工作线程中解析各列：Polars 转换会释放 GIL，解析编解码器列时事件循环仍可响应。
+                results = await asyncio.gather(
+                    *[
+                        asyncio.to_thread(
+                            _parse_field,
+                            pl,
+                            text_df[names[index]],
+                            codec=codec_list[index],
+                            caster=caster_list[index],
+                            dtype=dtype_list[index],
                         )
-                        has_error = True
-                    continue
-                try:
-                    parsed[field] = cast_basic(raw_text, spec.python_type)
-                except Exception:
-                    collector.add(
-                        row_number=row_number,
-                        field=field,
-                        message=f"Invalid value for {field}: {raw_text} / 字段 {field} 格式错误: {raw_text}",
-                        type="format",
-                        value=raw_text,
+                        for index in pending_indexes
+                    ]
+                )
+                for index, result in zip(pending_indexes, results, strict=True):
+                    parsed[index] = result
+            else:
+                for index in pending_indexes:
+                    parsed[index] = _parse_field(
+                        pl,
+                        text_df[names[index]],
+                        codec=codec_list[index],
+                        caster=caster_list[index],
+                        dtype=dtype_list[index],
+                    )
+        except BaseException:
+            if check_task is not None:
+                check_task.cancel()
+            raise
+
+        has_error = pl.repeat(False, text_df.height, eager=True)
+        pending: list[tuple[int, int, Any]] = []
+        for index, (name, result) in enumerate(zip(names, parsed, strict=True)):
+            text = text_df[name]
+            if required_flags[index]:
+                missing = text.is_null()
+                if missing.any():
+                    has_error = has_error | missing
+                    pending.extend(zip(missing.arg_true().to_list(), repeat(index), repeat(None), strict=False))
+            failed = result[1]
+            if failed.any():
+                has_error = has_error | failed
+                positions = failed.arg_true()
+                pending.extend(zip(positions.to_list(), repeat(index), text.gather(positions).to_list(), strict=False))
+        if pending:
+            # Report errors in row order, then field order, as the row-wise loop did.
+            # 按行顺序、再按字段顺序报告错误，与逐行循环保持一致。
+            pending.sort(key=lambda item: (item[0], item[1]))
+            # Append error dicts directly (same shape as `ErrorCollector.add`); row
+            # numbers are already ints from the Int64 column.
+            # 直接追加错误字典（与 `ErrorCollector.add` 结构一致）；行号来自 Int64 列，已是整数。
+            row_numbers = text_df["row_number"].to_list()
+            append_error = errors.append
+            for pos, index, raw_text in pending:
+                field = names[index]
+                if raw_text is None:
+                    append_error(
+                        {
+                            "row_number": row_numbers[pos],
+                            "field": field,
+                            "message": f"Missing required field {field} / 缺少必填字段 {field}",
+                            "type": "required",
+                        }
                     )
-                    has_error = True
-            if not has_error:
-                valid_rows.append(parsed)
+                else:
+                    append_error(
+                        {
+                            "row_number": row_numbers[pos],
+                            "field": field,
+                            "message": f"Invalid value for {field}: {raw_text} / 字段 {field} 格式错误: {raw_text}",
+                            "value": raw_text,
+                            "type": "format",
+                        }
+                    )
+
+        valid_df = (
+            text_df.select("row_number")
+            .with_columns([result[0].alias(name) for name, result in zip(names, parsed, strict=True)])
+            .filter(~has_error)
+        )
+
+        if check_task is not None:
+            db_errors, _ = await check_task
+            if db_errors:
+                valid_numbers = set(valid_df["row_number"].to_list())
+                conflict_rows = {error["row_number"] for error in db_errors}
+                errors.extend(error for error in db_errors if error["row_number"] in valid_numbers)
+                valid_df = valid_df.filter(~pl.col("row_number").is_in(list(conflict_rows)))
+
+        return (valid_df if not valid_df.is_empty() else pl.DataFrame()), errors
+
+    return validate_fn
+
+
+_VALIDATE_FN_CACHE: WeakKeyDictionary[Any, dict[tuple[Any, ...], Any]] = WeakKeyDictionary()
+
 
-        if unique_fields and not allow_overwrite and valid_rows:
-            db_errors, valid_rows = await _check_db_unique(model=model, unique_fields=unique_fields, rows=valid_rows)
-            errors.extend(db_errors)
+def _cached_validate_fn(*, model: Any, specs: list[FieldSpec], unique_fields: list[str] | None) -> Any:
+    """Return the validation function for a model, building it once per spec set.
+    返回模型的校验函数，每组字段规范仅构建一次。
 
-        valid_df = pl.DataFrame(valid_rows) if valid_rows else pl.DataFrame()
-        return valid_df, errors
+    The function is a pure product of the model, its resolved import specs and the
+    unique fields, so it is reused across imports instead of re-resolving codecs,
+    required flags and casters per request.
+    校验函数仅由模型、解析后的导入字段规范与唯一字段决定，因此可在多次导入间复用，
+    无需每次请求重新解析编解码器、必填标记与转换函数。
 
+    Args:
+        model: Tortoise model class.
+            Tortoise 模型类。
+        specs: Resolved import field specifications.
+            解析后的导入字段规范。
+        unique_fields: Optional per-import unique field list for DB checks.
+            可选的按导入指定的唯一字段列表，用于数据库校验。
+    Returns:
+        Callable: Cached async validation function.
+            缓存的异步校验函数。
+    """
+    key = (tuple(specs), tuple(unique_fields) if unique_fields is not None else None)
+    per_model = _VALIDATE_FN_CACHE.get(model)
+    if per_model is None:
+        per_model = {}
+        _VALIDATE_FN_CACHE[model] = per_model
+    validate_fn = per_model.get(key)
+    if validate_fn is None:
+        validate_fn = _build_validate_fn(model=model, specs=specs, unique_fields=unique_fields)
+        per_model[key] = validate_fn
     return validate_fn
 
 
+def _build_instances(model: Any, frame: Any) -> list[Any]:
+    """Build unsaved model instances from validated rows for `bulk_create`.
+    由校验通过的行构建供 `bulk_create` 使用的未保存模型实例。
+
+    The first row goes through `Model.__init__`. When the frame supplies every
+    non-generated DB field (so no defaults must be computed per row), later rows
+    skip `__init__`: they are created with `object.__new__`, receive a copy of the
+    internal state `__init__` set on the first instance, and take the already
+    parsed values directly. Otherwise every row uses `Model.__init__`.
+    第一行通过 `Model.__init__` 构造。若数据帧提供了所有非生成的数据库字段（无需逐行计算默认值），
+    后续行跳过 `__init__`：使用 `object.__new__` 创建，复制第一个实例上由 `__init__` 设置的内部状态，
+    并直接写入已解析的值。否则每行都使用 `Model.__init__`。
+
+    Args:
+        model: Tortoise model class.
+            Tortoise 模型类。
+        frame: Validated Polars DataFrame without `row_number`.
+            不含 `row_number` 的已校验 Polars DataFrame。
+    Returns:
+        list: Model instances in row order.
+            按行顺序排列的模型实例列表。
+    """
+    columns = frame.columns
+    rows = frame.iter_rows()
+    first = next(rows, None)
+    if first is None:
+        return []
+    prototype = model(**dict(zip(columns, first, strict=True)))
+    meta = model._meta
+    column_set = set(columns)
+    needed = {name for name in meta.fields_db_projection if not (name == meta.pk_attr and meta.pk.generated)}
+    if not needed <= column_set:
+        return [prototype, *(model(**dict(zip(columns, row, strict=True))) for row in rows)]
+
+    state = {key: value for key, value in prototype.__dict__.items() if key not in column_set}
+    mutable_keys = [key for key, value in state.items() if isinstance(value, (dict, list, set))]
+    new_instance = object.__new__
+    objs = [prototype]
+    for row in rows:
+        instance = new_instance(model)
+        attrs = instance.__dict__
+        attrs.update(state)
+        for key in mutable_keys:
+            attrs[key] = copy(state[key])
+        attrs.update(zip(columns, row, strict=True))
+        objs.append(instance)
+    return objs
+
+
+def _is_asyncpg_client(client: Any) -> bool:
+    """Check whether a Tortoise connection client is backed by asyncpg.
+    检查 Tortoise 连接客户端是否由 asyncpg 支持。
+
+    Args:
+        client: Tortoise DB client (or transaction wrapper) of the model.
+            模型的 Tortoise 数据库客户端（或事务包装器）。
+    Returns:
+        True for clients from `tortoise.backends.asyncpg`, False otherwise.
+        客户端来自 `tortoise.backends.asyncpg` 时返回 True，否则返回 False。
+    """
+    module = type(client).__module__ or ""
+    return module.startswith("tortoise.backends.asyncpg")
+
+
+async def _copy_instances(*, client: Any, model: Any, objs: list[Any]) -> None:
+    """Insert model instances with PostgreSQL COPY through the raw asyncpg connection.
+    通过原始 asyncpg 连接使用 PostgreSQL COPY 插入模型实例。
+
+    Values are converted with each field's `to_db_value`, as Tortoise's insert
+    executor does; generated fields are left to the database.
+    与 Tortoise 插入执行器一致，值通过各字段的 `to_db_value` 转换；生成字段交由数据库处理。
+
+    Args:
+        client: asyncpg-backed Tortoise DB client (or transaction wrapper).
+            基于 asyncpg 的 Tortoise 数据库客户端（或事务包装器）。
+        model: Tortoise model class.
+            Tortoise 模型类。
+        objs: Unsaved model instances.
+            未保存的模型实例。
+    """
+    meta = model._meta
+    fields = [
+        (name, meta.fields_map[name]) for name in meta.fields_db_projection if not meta.fields_map[name].generated
+    ]
+    records = [tuple(field.to_db_value(getattr(obj, name), obj) for name, field in fields) for obj in objs]
+    # Without an explicit schema, leave the table to the connection's search_path.
+    # 未显式指定 schema 时，由连接的 search_path 解析表。
+    schema = getattr(meta, "schema", None)
+    options = {"schema_name": schema} if schema else {}
+    async with client.acquire_connection() as connection:
+        await connection.copy_records_to_table(
+            meta.db_table,
+            records=records,
+            columns=[meta.fields_db_projection[name] for name, _ in fields],
+            **options,
+        )
+
+
 def _build_persist_fn(*, model: Any) -> Any:
     """Build a persistence function that bulk-creates model instances (Tortoise).
     构建用于批量创建模型实例的持久化函数（Tortoise）。
 
     The returned `persist_fn` accepts (db, valid_df, *, allow_overwrite=False)
-    and uses Tortoise `bulk_create` to persist rows.
-    返回的 `persist_fn` 接受 (db, valid_df, *, allow_overwrite=False)，并使用 Tortoise 的 `bulk_create` 持久化行。
+    and uses Tortoise `bulk_create` to persist rows in batches of 1000. On the
+    asyncpg backend, imports of at least `_COPY_MIN_ROWS` rows use PostgreSQL COPY.
+    返回的 `persist_fn` 接受 (db, valid_df, *, allow_overwrite=False)，并使用 Tortoise 的 `bulk_create` 以每批 1000 行持久化。
+    在 asyncpg 后端上，行数不少于 `_COPY_MIN_ROWS` 的导入使用 PostgreSQL COPY。
 
     Args:
         model: Tortoise model class.
@@ -253,14 +831,17 @@ def _build_persist_fn(*, model: Any) -> Any:
     """
 
     async def persist_fn(db: Any, valid_df: Any, *, allow_overwrite: bool = False) -> int:
-        rows = valid_df.to_dicts() if not valid_df.is_empty() else []
-        for row in rows:
-            row.pop("row_number", None)
-        if not rows:
+        if valid_df.is_empty():
+            return 0
+        objs = _build_instances(model, valid_df.drop("row_number", strict=False))
+        if not objs:
             return 0
-        objs = [model(**row) for row in rows]
-        await model.bulk_create(objs)
-        return len(rows)
+        client = model._meta.db
+        if len(objs) >= _COPY_MIN_ROWS and _is_asyncpg_client(client):
+            await _copy_instances(client=client, model=model, objs=objs)
+        else:
+            await model.bulk_create(objs, batch_size=_BULK_CREATE_BATCH_SIZE)
+        return len(objs)
 
     return persist_fn
 
@@ -302,14 +883,16 @@ async def import_model_csv(
     opts = options or ImportOptions()
     effective_unique_fields = unique_fields if unique_fields is not None else opts.unique_fields
     specs = resolve_import_specs(get_field_specs(model), columns)
-    validate_fn = _build_validate_fn(model=model, specs=specs, unique_fields=effective_unique_fields)
+    validate_fn = _cached_validate_fn(model=model, specs=specs, unique_fields=effective_unique_fields)
     persist_fn_final = persist_fn or _build_persist_fn(model=model)
     svc = ImportExportService(db=opts.db)
     allow_exts = CSV_ALLOWED_EXTENSIONS if opts.allowed_extensions is None else opts.allowed_extensions
     allow_mimes = CSV_ALLOWED_MIME_TYPES if opts.allowed_mime_types is None else opts.allowed_mime_types
     validate_resp = await svc.upload_parse_validate(
         file=file,
-        column_aliases=_build_column_aliases(specs),
+        # Headers already match model field names; None skips the rename pass.
+        # 表头已与模型字段名一致；传入 None 以跳过重命名步骤。
+        column_aliases=None,
         validate_fn=validate_fn,
         allow_overwrite=opts.allow_overwrite,
         unique_fields=effective_unique_fields,
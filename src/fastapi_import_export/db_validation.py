@@ -9,6 +9,7 @@
 
 from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Protocol
 
 from fastapi_import_export.exceptions import ImportExportError
@@ -60,10 +61,14 @@ class DbCheckSpec:
     type: str = "db_check"
 
 
+@lru_cache(maxsize=1)
 def _load_backend() -> Any:
     """Load optional backend module for DB validation (polars).
     加载数据库校验可选后端模块（polars）。
 
+    The module is cached after the first successful load; failures are not cached.
+    首次加载成功后缓存该模块；加载失败不会被缓存。
+
     Returns:
         The backend module providing DB validation helpers.
             提供数据库校验辅助的后端模块。
@@ -146,6 +151,7 @@ async def run_db_checks(
     df: Any,
     specs: list[DbCheckSpec],
     allow_overwrite: bool = False,
+    concurrent: bool = False,
 ) -> list[dict[str, Any]]:
     """
     Run database checks and return error list.
@@ -160,9 +166,14 @@ async def run_db_checks(
             定义要运行的校验的 DbCheckSpec 列表。
         allow_overwrite: Whether to allow overwriting existing values (affects checks).
             是否允许覆盖现有值（影响校验行为）。
+        concurrent: Run independent checks concurrently so DB round trips overlap; only safe
+            when `db` supports concurrent use (e.g. a pool or engine, not a single `AsyncSession`).
+            是否并发执行相互独立的校验以重叠数据库往返；仅当 `db` 支持并发使用时安全（例如连接池或引擎，而非单个 `AsyncSession`）。
     Returns:
         List of error dicts for any detected issues.
             检测到的问题的错误字典列表。
     """
     backend = _load_backend()
-    return await backend.run_db_checks(db=db, df=df, specs=specs, allow_overwrite=allow_overwrite)
+    return await backend.run_db_checks(
+        db=db, df=df, specs=specs, allow_overwrite=allow_overwrite, concurrent=concurrent
+    )
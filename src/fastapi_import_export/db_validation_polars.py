@@ -7,6 +7,7 @@
 基于 Polars 的数据库校验辅助。
 """
 
+import asyncio
 from collections.abc import Iterable
 from typing import Any
 
@@ -14,6 +15,53 @@ import polars as pl
 
 from fastapi_import_export.db_validation import DbCheckSpec, KeyTuple
 
+# Every character Python's `str.strip()` removes; Polars' default `strip_chars()` keeps
+# the \x1c-\x1f separators, so keys pass these explicitly.
+# Python `str.strip()` 会去除的全部字符；Polars 默认 `strip_chars()` 保留 \x1c-\x1f 分隔符，因此键处理时显式传入。
+_PY_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005"
+    "\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+
+def _key_text_expr(dtype: Any, name: str) -> pl.Expr:
+    """Build the key-text expression of a column, matching `str(value or "").strip()`.
+    构建列的键文本表达式，结果与 `str(value or "").strip()` 一致。
+
+    String, integer and boolean columns are converted natively; other dtypes
+    (floats, temporals, objects, and nested List/Array/Struct values) are formatted
+    with Python `str` over the column's Python values.
+    字符串、整数与布尔列以原生方式转换；其他类型（浮点、时间、对象以及嵌套的 List/Array/Struct 值）
+    基于列的 Python 值使用 Python `str` 格式化。
+
+    Args:
+        dtype: Column dtype.
+            列类型。
+        name: Column name.
+            列名。
+
+    Returns:
+        pl.Expr: String expression; falsy values map to "" or null.
+        pl.Expr: 字符串表达式；假值映射为 "" 或 null。
+    """
+    col = pl.col(name)
+    if dtype == pl.String:
+        return col.str.strip_chars(_PY_WHITESPACE)
+    if dtype.is_integer():
+        return pl.when(col != 0).then(col.cast(pl.String)).alias(name)
+    if dtype == pl.Boolean:
+        return pl.when(col).then(pl.lit("True")).alias(name)
+    if dtype == pl.Null:
+        return pl.lit(None, dtype=pl.String).alias(name)
+    # `to_list()` yields plain Python values (lists/dicts for nested dtypes), whose
+    # truthiness is defined, unlike the Series `map_elements` passes for nested values.
+    # `to_list()` 产生普通 Python 值（嵌套类型为列表/字典），其真值有定义；而 `map_elements`
+    # 对嵌套值传入的是 Series。
+    return col.map_batches(
+        lambda series: pl.Series([str(value or "").strip() for value in series.to_list()], dtype=pl.String),
+        return_dtype=pl.String,
+    )
+
 
 def build_key_to_row_numbers(df: pl.DataFrame, key_fields: Iterable[str]) -> dict[KeyTuple, list[int]]:
     """
@@ -39,15 +87,20 @@ def build_key_to_row_numbers(df: pl.DataFrame, key_fields: Iterable[str]) -> dic
         if f not in df.columns:
             return {}
 
-    key_to_rows: dict[KeyTuple, list[int]] = {}
-    rows = df.select(["row_number", *fields]).to_dicts()
-    for r in rows:
-        row_number = int(r.get("row_number") or 0)
-        key = tuple(str(r.get(f) or "").strip() for f in fields)
-        if any(not part for part in key):
-            continue
-        key_to_rows.setdefault(key, []).append(row_number)
-    return key_to_rows
+    # Stripped key text, null/blank rows filtered and row numbers grouped per key in
+    # one Polars pipeline; groups keep first-seen key order.
+    # 在一次 Polars 计算中生成去空白的键文本、过滤空值/空白行并按键分组行号；分组保持键的首次出现顺序。
+    grouped = (
+        df.select(
+            pl.col("row_number").fill_null(0).cast(pl.Int64),
+            *[_key_text_expr(df.schema[f], f) for f in fields],
+        )
+        .filter(pl.all_horizontal([pl.col(f).is_not_null() & (pl.col(f) != "") for f in fields]))
+        .group_by(fields, maintain_order=True)
+        .agg(pl.col("row_number"))
+    )
+    keys = zip(*[grouped.get_column(f).to_list() for f in fields], strict=True)
+    return dict(zip(keys, grouped.get_column("row_number").to_list(), strict=True))
 
 
 def build_db_conflict_errors(
@@ -83,16 +136,24 @@ def build_db_conflict_errors(
     """
     errors: list[dict[str, Any]] = []
     for key, info in conflicts.items():
-        row_numbers = key_to_row_numbers.get(key, [])
+        row_numbers = key_to_row_numbers.get(key)
+        if not row_numbers:
+            continue
         msg = str(info.get("message") or default_message)
         details = info.get("details")
         value = info.get("value") or info.get("values") or key
-        for rn in row_numbers[:max_rows_per_key]:
-            item: dict[str, Any] = {"row_number": int(rn), "field": field, "message": msg, "type": type}
-            item["value"] = value
-            if details is not None:
-                item["details"] = details
-            errors.append(item)
+        # Each error is a single dict literal; row numbers are already ints.
+        # 每条错误以单个字典字面量构建；行号已为整数。
+        if details is None:
+            errors.extend(
+                {"row_number": rn, "field": field, "message": msg, "type": type, "value": value}
+                for rn in row_numbers[:max_rows_per_key]
+            )
+        else:
+            errors.extend(
+                {"row_number": rn, "field": field, "message": msg, "type": type, "value": value, "details": details}
+                for rn in row_numbers[:max_rows_per_key]
+            )
     return errors
 
 
@@ -102,6 +163,7 @@ async def run_db_checks(
     df: pl.DataFrame,
     specs: list[DbCheckSpec],
     allow_overwrite: bool = False,
+    concurrent: bool = False,
 ) -> list[dict[str, Any]]:
     """
     Run database checks and return error list.
@@ -116,19 +178,37 @@ async def run_db_checks(
         specs: 数据库校验规范列表。
         allow_overwrite: Allow overwrite flag.
         allow_overwrite: 是否允许覆盖。
+        concurrent: Run the checks concurrently; only safe when `db` supports concurrent use
+            (e.g. a pool or engine, not a single `AsyncSession`).
+        concurrent: 是否并发执行校验；仅当 `db` 支持并发使用时安全（例如连接池或引擎，而非单个 `AsyncSession`）。
 
     Returns:
         list[dict[str, Any]]: Error list.
         list[dict[str, Any]]: 错误列表。
     """
-    all_errors: list[dict[str, Any]] = []
+    # Keys are built per spec up front; with `concurrent=True` the independent checks
+    # then run together so their DB round trips overlap.
+    # 先为每个规范构建键；`concurrent=True` 时相互独立的校验并发执行，使数据库往返时间重叠。
+    checks: list[tuple[DbCheckSpec, dict[KeyTuple, list[int]]]] = []
     for spec in specs:
         key_to_rows = build_key_to_row_numbers(df, spec.key_fields)
-        keys = list(key_to_rows.keys())
-        if not keys:
-            continue
+        if key_to_rows:
+            checks.append((spec, key_to_rows))
+    if concurrent:
+        results = await asyncio.gather(
+            *[
+                spec.check_fn(db, list(key_to_rows.keys()), allow_overwrite=allow_overwrite)
+                for spec, key_to_rows in checks
+            ]
+        )
+    else:
+        results = [
+            await spec.check_fn(db, list(key_to_rows.keys()), allow_overwrite=allow_overwrite)
+            for spec, key_to_rows in checks
+        ]
 
-        conflicts = await spec.check_fn(db, keys, allow_overwrite=allow_overwrite)
+    all_errors: list[dict[str, Any]] = []
+    for (spec, key_to_rows), conflicts in zip(checks, results, strict=True):
         if not conflicts:
             continue
 
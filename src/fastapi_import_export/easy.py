@@ -7,9 +7,13 @@
 易用层 API：零配置 / 显式配置入口。
 """
 
+import asyncio
 import inspect
-from collections.abc import Iterable, Mapping
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping, Sized
+from enum import Enum
+from operator import attrgetter
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from fastapi import UploadFile
 
@@ -25,14 +29,34 @@ from fastapi_import_export.formats import (
     extension_for,
     media_type_for,
 )
+from fastapi_import_export.helpers.rows import _polars_dataframe_type
 from fastapi_import_export.importer import ImportResult, ImportStatus
 from fastapi_import_export.options import ExportOptions, ImportOptions
-from fastapi_import_export.renderers import render_chunks
+from fastapi_import_export.renderers import render_chunks, render_iter
 from fastapi_import_export.resource import Resource
 from fastapi_import_export.schemas import ImportCommitRequest, ImportErrorItem
-from fastapi_import_export.serializers import CsvSerializer, XlsxSerializer
+from fastapi_import_export.serializers import (
+    ArrowSerializer,
+    CsvSerializer,
+    ParquetSerializer,
+    Serializer,
+    XlsxSerializer,
+    _infer_columns,
+)
 from fastapi_import_export.service import ImportExportService
 
+_SERIALIZERS: dict[ExportFormat, Callable[[], Serializer]] = {
+    ExportFormat.CSV: CsvSerializer,
+    ExportFormat.XLSX: XlsxSerializer,
+    ExportFormat.ARROW: ArrowSerializer,
+    ExportFormat.PARQUET: ParquetSerializer,
+}
+_QUERY_FN_KWARGS: WeakKeyDictionary[Any, tuple[bool, bool]] = WeakKeyDictionary()
+# Sized inputs below this many rows are exported on the event loop: the work is shorter
+# than a worker-thread round trip. Larger or unsized inputs go to a worker thread.
+# 行数低于该值的有长度输入直接在事件循环中导出，其耗时短于一次工作线程往返；更大或无长度的输入交给工作线程。
+_THREADED_EXPORT_MIN_ROWS = 1_000
+
 
 async def export_csv(
     source: Any,
@@ -100,6 +124,80 @@ async def export_xlsx(
     )
 
 
+async def export_arrow(
+    source: Any,
+    *,
+    resource: type[Resource] | None = None,
+    params: Any | None = None,
+    options: ExportOptions | None = None,
+) -> ExportPayload:
+    """Export data to an Arrow IPC file with sensible defaults.
+    以合理默认值导出 Arrow IPC 文件。
+
+    Columnar binary output for API clients that can read it; values keep their
+    types and are not encoded as text.
+    面向可读取该格式的 API 客户端的列式二进制输出；值保留类型，不编码为文本。
+
+    Args:
+        source: Data source (iterable rows, DataFrame, or query function).
+            数据源（可迭代行、DataFrame 或查询函数）。
+        resource: Optional Resource class for field mapping.
+            可选的用于字段映射的 Resource 类。
+        params: Optional parameters to pass to query function if source is callable.
+            如果 source 可调用，传递给查询函数的可选参数。
+        options: Optional ExportOptions to override defaults.
+            可选的 ExportOptions，用于覆盖默认值。
+    Returns:
+        ExportPayload: Payload containing filename, media type, and byte stream.
+            包含文件名、媒体类型和字节流的导出负载。
+
+    """
+    return await _export(
+        source,
+        fmt=ExportFormat.ARROW,
+        resource=resource,
+        params=params,
+        options=options,
+    )
+
+
+async def export_parquet(
+    source: Any,
+    *,
+    resource: type[Resource] | None = None,
+    params: Any | None = None,
+    options: ExportOptions | None = None,
+) -> ExportPayload:
+    """Export data to Parquet with sensible defaults.
+    以合理默认值导出 Parquet。
+
+    Columnar binary output for API clients that can read it; values keep their
+    types and are not encoded as text.
+    面向可读取该格式的 API 客户端的列式二进制输出；值保留类型，不编码为文本。
+
+    Args:
+        source: Data source (iterable rows, DataFrame, or query function).
+            数据源（可迭代行、DataFrame 或查询函数）。
+        resource: Optional Resource class for field mapping.
+            可选的用于字段映射的 Resource 类。
+        params: Optional parameters to pass to query function if source is callable.
+            如果 source 可调用，传递给查询函数的可选参数。
+        options: Optional ExportOptions to override defaults.
+            可选的 ExportOptions，用于覆盖默认值。
+    Returns:
+        ExportPayload: Payload containing filename, media type, and byte stream.
+            包含文件名、媒体类型和字节流的导出负载。
+
+    """
+    return await _export(
+        source,
+        fmt=ExportFormat.PARQUET,
+        resource=resource,
+        params=params,
+        options=options,
+    )
+
+
 async def import_csv(
     file: UploadFile,
     *,
@@ -205,10 +303,54 @@ async def _export(
             包含文件名、媒体类型和字节流的导出负载。
 
     """
+    if callable(source):
+        source = await _call_query_fn(source, resource=resource, params=params)
+    if isinstance(source, Sized) and len(source) < _THREADED_EXPORT_MIN_ROWS:
+        return _export_data(source, fmt=fmt, resource=resource, options=options)
+    # Normalization and eager serialization are CPU-bound; keep them off the event loop.
+    # 规范化与即时序列化为 CPU 密集操作，放到事件循环之外执行。
+    return await asyncio.to_thread(_export_data, source, fmt=fmt, resource=resource, options=options)
+
+
+def _export_data(
+    data: Any,
+    *,
+    fmt: ExportFormat,
+    resource: type[Resource] | None,
+    options: ExportOptions | None,
+) -> ExportPayload:
+    """Build the export payload for already-resolved data.
+    为已解析的数据构建导出负载。
+
+    Normalization and serialization never await, so this runs as a plain function
+    that `_export` hands to a worker thread for large inputs. CSV chunks of large
+    inputs are produced later, while the stream is consumed, through `render_iter`;
+    small inputs are serialized at once. Either way chunks are `options.chunk_size`
+    bytes long.
+    规范化与序列化从不等待，因此以普通函数执行，大输入由 `_export` 交给工作线程运行。
+    大输入的 CSV 分块在消费流时经 `render_iter` 生成；小输入立即序列化。
+    两种情况下每块均为 `options.chunk_size` 字节。
+
+    Args:
+        data: Resolved data (iterable rows or DataFrame).
+            已解析的数据（可迭代行或 DataFrame）。
+        fmt: Export format (e.g., 'csv' or 'xlsx').
+            导出格式（例如 'csv' 或 'xlsx'）。
+        resource: Optional Resource class for field mapping.
+            可选的用于字段映射的 Resource 类。
+        options: Optional ExportOptions to override defaults.
+            可选的 ExportOptions，用于覆盖默认值。
+    Returns:
+        ExportPayload: Payload containing filename, media type, and byte stream.
+            包含文件名、媒体类型和字节流的导出负载。
+    """
     opts = options or ExportOptions()
-    data = await _resolve_source(source, resource=resource, params=params)
-    rows, output_columns = _normalize_rows(data, resource=resource, columns=opts.columns)
-    serializer = CsvSerializer() if fmt == ExportFormat.CSV else XlsxSerializer()
+    # Resolve resource metadata once per request. / 每次请求仅解析一次资源元数据。
+    mapping = resource.export_mapping() if resource is not None else {}
+    order = resource.field_order() if resource is not None else None
+    codecs = resource.field_codecs if resource is not None else {}
+    rows, output_columns = _normalize_rows(data, mapping=mapping, order=order, codecs=codecs, columns=opts.columns)
+    serializer = _SERIALIZERS[fmt]()
     effective_options = ExportOptions(
         filename=opts.filename,
         media_type=opts.media_type,
@@ -216,9 +358,16 @@ async def _export(
         line_ending=opts.line_ending,
         chunk_size=opts.chunk_size,
         columns=output_columns,
+        xlsx_constant_memory=opts.xlsx_constant_memory,
     )
-    payload_bytes = serializer.serialize(data=rows, options=effective_options)
-    stream = render_chunks(payload_bytes, chunk_size=opts.chunk_size)
+    stream: AsyncIterator[bytes]
+    if isinstance(serializer, CsvSerializer) and len(rows) >= _THREADED_EXPORT_MIN_ROWS:
+        stream = render_iter(
+            serializer.iter_serialize(data=rows, options=effective_options), chunk_size=opts.chunk_size
+        )
+    else:
+        payload_bytes = serializer.serialize(data=rows, options=effective_options)
+        stream = render_chunks(payload_bytes, chunk_size=opts.chunk_size)
     filename = opts.filename or _default_filename(fmt=fmt, resource=resource)
     media_type = opts.media_type or media_type_for(fmt)
     return ExportPayload(filename=filename, media_type=media_type, stream=stream)
@@ -301,27 +450,6 @@ async def _import_file(
     return ImportResult(status=ImportStatus.COMMITTED, imported_rows=commit.imported_rows, errors=[])
 
 
-async def _resolve_source(source: Any, *, resource: type[Resource] | None, params: Any | None) -> Any:
-    """Resolve the data source, calling it if it's a callable.
-    解析数据源，如果是可调用的则调用它。
-
-    Args:
-        source: Data source (iterable rows, DataFrame, or query function).
-            数据源（可迭代行、DataFrame 或查询函数）。
-        resource: Optional Resource class for field mapping.
-            可选的用于字段映射的 Resource 类。
-        params: Optional parameters to pass to query function if source is callable.
-            如果 source 可调用，传递给查询函数的可选参数。
-    Returns:
-        Any: Resolved data from the source.
-            来自数据源的解析数据。
-
-    """
-    if callable(source):
-        return await _call_query_fn(source, resource=resource, params=params)
-    return source
-
-
 async def _call_query_fn(fn: Any, *, resource: type[Resource] | None, params: Any | None) -> Any:
     """Call the query function with optional resource and params.
     调用查询函数，可选地传递 resource 和 params。
@@ -337,11 +465,11 @@ async def _call_query_fn(fn: Any, *, resource: type[Resource] | None, params: An
         Any: Result from the query function.
             查询函数的结果。
     """
-    sig = inspect.signature(fn)
+    accepts_resource, accepts_params = _query_fn_kwargs(fn)
     kwargs: dict[str, Any] = {}
-    if _accepts_kw(sig, "resource"):
+    if accepts_resource:
         kwargs["resource"] = resource
-    if _accepts_kw(sig, "params"):
+    if accepts_params:
         kwargs["params"] = params
     result = fn(**kwargs)
     if inspect.isawaitable(result):
@@ -349,6 +477,37 @@ async def _call_query_fn(fn: Any, *, resource: type[Resource] | None, params: An
     return result
 
 
+def _query_fn_kwargs(fn: Any) -> tuple[bool, bool]:
+    """Resolve which optional keyword arguments a query function accepts.
+    解析查询函数接受哪些可选关键字参数。
+
+    Traits are cached per function in a `WeakKeyDictionary`, so `inspect.signature`
+    runs once per function and the cache never keeps a function alive. Bound
+    methods are keyed by their underlying function; callables that cannot be
+    weakly referenced are probed on every call.
+    特征按函数缓存在 `WeakKeyDictionary` 中，使 `inspect.signature` 对每个函数只执行一次，
+    且缓存不会延长函数的生命周期。绑定方法以其底层函数为键；无法弱引用的可调用对象每次调用时检查。
+
+    Args:
+        fn: Query function to inspect.
+            要检查的查询函数。
+    Returns:
+        tuple[bool, bool]: Whether `resource` and `params` are accepted.
+            是否接受 `resource` 与 `params`。
+    """
+    key = getattr(fn, "__func__", fn)
+    try:
+        return _QUERY_FN_KWARGS[key]
+    except KeyError:
+        sig = inspect.signature(fn)
+        traits = _accepts_kw(sig, "resource"), _accepts_kw(sig, "params")
+        _QUERY_FN_KWARGS[key] = traits
+        return traits
+    except TypeError:
+        sig = inspect.signature(fn)
+        return _accepts_kw(sig, "resource"), _accepts_kw(sig, "params")
+
+
 def _accepts_kw(sig: inspect.Signature, name: str) -> bool:
     """Check if the function signature accepts a keyword argument.
     检查函数签名是否接受某个关键字参数。
@@ -370,48 +529,105 @@ def _accepts_kw(sig: inspect.Signature, name: str) -> bool:
 def _normalize_rows(
     data: Any,
     *,
-    resource: type[Resource] | None,
+    mapping: Mapping[str, str],
+    order: list[str] | None,
+    codecs: Mapping[str, Codec],
     columns: list[str] | None,
-) -> tuple[list[dict[str, Any]], list[str] | None]:
-    """Normalize the data into a list of dict rows and determine output columns.
-    将数据规范化为字典行列表，并确定输出列。
+) -> tuple[Any, list[str] | None]:
+    """Normalize the data into output rows and determine output columns.
+    将数据规范化为输出行，并确定输出列。
+
+    Polars DataFrames are normalized column-wise (select, codec format, rename) and
+    returned as a DataFrame; other inputs become a list of dict rows.
+    Polars DataFrame 按列规范化（选择、编解码格式化、重命名）并以 DataFrame 返回；
+    其他输入转换为字典行列表。
 
     Args:
         data: Input data (iterable rows or DataFrame).
             输入数据（可迭代行或 DataFrame）。
-        resource: Optional Resource class for field mapping.
-            可选的用于字段映射的 Resource 类。
+        mapping: Resource export mapping (field -> output header).
+            资源导出映射（字段 -> 输出表头）。
+        order: Resource field order, or None when no resource is given.
+            资源字段顺序；未提供资源时为 None。
+        codecs: Resource field codecs.
+            资源字段编解码器。
         columns: Optional list of columns to include in the output.
             可选的要包含在输出中的列列表。
     Returns:
-        tuple: A tuple containing the list of normalized rows and the list of output columns.
-            包含规范化行列表和输出列列表的元组。
+        tuple: A tuple containing the normalized rows (list of dicts or DataFrame) and the list of output columns.
+            包含规范化行（字典列表或 DataFrame）和输出列列表的元组。
     """
-    rows = _to_rows(data, resource=resource)
-    mapping = resource.export_mapping() if resource is not None else {}
-    ordered = columns or (resource.field_order() if resource is not None else _infer_columns(rows))
-    codecs = resource.field_codecs if resource is not None else {}
-    output_columns = [mapping.get(col, col) for col in ordered]
-    output: list[dict[str, Any]] = []
-    for row in rows:
-        out: dict[str, Any] = {}
-        for col in ordered:
-            value = row.get(col)
-            codec = codecs.get(col)
-            if codec is not None:
-                value = codec.format(value)
-            out[mapping.get(col, col)] = value
-        output.append(out)
+    if _is_polars_df(data):
+        ordered = columns or (order if order is not None else (data.columns if data.height else []))
+        output_columns = [mapping.get(col, col) for col in ordered]
+        if len(set(output_columns)) == len(output_columns):
+            return _normalize_frame(data, ordered=ordered, mapping=mapping, codecs=codecs), output_columns
+    rows = _to_rows(data, fields=order)
+    ordered = columns or (order if order is not None else _infer_columns(rows))
+    # Resolve output name and codec per column once instead of per cell.
+    # 每列仅解析一次输出列名与编解码器，而非逐单元格解析。
+    plan = [(col, mapping.get(col, col), codecs.get(col)) for col in ordered]
+    output_columns = [out for _, out, _ in plan]
+    output = [
+        {out: row.get(col) if codec is None else codec.format(row.get(col)) for col, out, codec in plan} for row in rows
+    ]
     return output, output_columns
 
 
-def _to_rows(data: Any, *, resource: type[Resource] | None) -> list[dict[str, Any]]:
+def _normalize_frame(
+    df: Any,
+    *,
+    ordered: list[str],
+    mapping: Mapping[str, str],
+    codecs: Mapping[str, Codec],
+) -> Any:
+    """Select, format and rename DataFrame columns for export in one Polars pass.
+    在一次 Polars 计算中为导出选择、格式化并重命名 DataFrame 列。
+
+    Columns missing from the frame become nulls; codec columns are formatted with
+    `codec.format` (nulls included) into strings.
+    数据帧中缺失的列填充为空值；编解码器列通过 `codec.format`（包含空值）格式化为字符串。
+
+    Args:
+        df: Source Polars DataFrame.
+            源 Polars DataFrame。
+        ordered: Source column names in output order.
+            按输出顺序排列的源列名。
+        mapping: Mapping from source column to output header.
+            源列到输出表头的映射。
+        codecs: Mapping from source column to Codec.
+            源列到 Codec 的映射。
+    Returns:
+        pl.DataFrame: Normalized DataFrame with output headers.
+            使用输出表头的规范化 DataFrame。
+    """
+    import polars as pl
+
+    present = set(df.columns)
+    missing = [col for col in ordered if col not in present]
+    if missing:
+        # Added via with_columns so literals broadcast to the frame height.
+        # 通过 with_columns 添加，使字面量按数据帧高度广播。
+        df = df.with_columns([pl.lit(None).alias(col) for col in missing])
+    exprs = []
+    for col in ordered:
+        expr = pl.col(col)
+        codec = codecs.get(col)
+        if codec is not None:
+            expr = expr.map_elements(codec.format, return_dtype=pl.String, skip_nulls=False)
+        exprs.append(expr.alias(mapping.get(col, col)))
+    return df.select(exprs)
+
+
+def _to_rows(data: Any, *, fields: list[str] | None) -> list[dict[str, Any]]:
     """Convert input data to a list of dict rows.
     将输入数据转换为字典行列表。
 
     Args:
         data: Input data (iterable rows or DataFrame).
             输入数据（可迭代行或 DataFrame）。
+        fields: Resource field order used to read object rows, or None without a resource.
+            用于读取对象行的资源字段顺序；未提供资源时为 None。
     Returns:
         list[dict[str, Any]]: List of dict rows.
             字典行列表。
@@ -423,45 +639,50 @@ def _to_rows(data: Any, *, resource: type[Resource] | None) -> list[dict[str, An
     if isinstance(data, (str, bytes)):
         raise TypeError("export source must be iterable rows or DataFrame / 导出源必须是可迭代行或 DataFrame")
     if isinstance(data, Iterable):
-        rows: list[dict[str, Any]] = []
-        for item in data:
-            rows.append(_coerce_row(item, resource=resource))
-        return rows
+        coerce_row = _row_coercer(fields)
+        return [coerce_row(item) for item in data]
     raise TypeError("export source must be iterable rows or DataFrame / 导出源必须是可迭代行或 DataFrame")
 
 
-def _coerce_row(item: Any, *, resource: type[Resource] | None) -> dict[str, Any]:
-    """Coerce a single item into a mapping (row dict) for export.
+def _row_coercer(fields: list[str] | None) -> Callable[[Any], dict[str, Any]]:
+    """Build a function that coerces a single item into a row dict for export.
+    构建将单个项目强制转换为导出字典行的函数。
 
-    将单个项目强制转换为导出所用的映射（字典行）。
-
-    If `item` is already a mapping, it is converted to a plain dict. If a
-    `resource` is provided, attributes are read in the resource field order.
-
-    如果 `item` 已经是映射，则转换为普通字典；如果提供了 `resource`，则按照 `resource.field_order()` 读取属性。
+    Mapping items are converted to plain dicts. If resource `fields` are provided,
+    object attributes are read in that order through one precompiled
+    `operator.attrgetter`; objects missing an attribute fall back to
+    `getattr(..., None)`.
+    映射项转换为普通字典；如果提供了资源字段 `fields`，则通过预编译的 `operator.attrgetter`
+    按该顺序读取对象属性；缺少属性的对象回退为 `getattr(..., None)`。
 
     Args:
-        item: The input row item (mapping or object).
-            输入行项（映射或对象）。
-        resource: Optional Resource class for attribute-to-field mapping.
-            可选：用于属性到字段映射的 Resource 类。
+        fields: Resource field order (`resource.field_order()`), or None without a resource.
+            资源字段顺序（`resource.field_order()`）；未提供资源时为 None。
 
     Returns:
-        dict: The coerced row dictionary.
-            强制转换后的字典行。
-
-    Raises:
-        TypeError: If the input cannot be coerced to a mapping.
-            当输入无法转换为映射时抛出 TypeError。
+        Callable: Coerces a mapping or object into a row dict; raises TypeError when
+            an item cannot be coerced.
+            将映射或对象转换为字典行的可调用对象；项目无法转换时抛出 TypeError。
     """
-    if isinstance(item, Mapping):
-        return dict(item)
-    if resource is not None:
-        fields = resource.field_order()
-        if not fields:
-            raise TypeError("resource has no fields; cannot export object rows / 资源未定义字段，无法导出对象行")
-        return {field: getattr(item, field, None) for field in fields}
-    raise TypeError("export rows must be mappings unless resource is provided / 导出行必须是映射，除非提供 resource")
+    keys = tuple(fields or ())
+    getter = attrgetter(*keys) if keys else None
+
+    def coerce_row(item: Any) -> dict[str, Any]:
+        if isinstance(item, Mapping):
+            return dict(item)
+        if getter is None:
+            if fields is not None:
+                raise TypeError("resource has no fields; cannot export object rows / 资源未定义字段，无法导出对象行")
+            raise TypeError(
+                "export rows must be mappings unless resource is provided / 导出行必须是映射，除非提供 resource"
+            )
+        try:
+            values = getter(item)
+        except AttributeError:
+            return {field: getattr(item, field, None) for field in keys}
+        return dict(zip(keys, values, strict=True)) if len(keys) > 1 else {keys[0]: values}
+
+    return coerce_row
 
 
 def _decode_df_with_codecs(df: Any, codecs: dict[str, Codec]) -> tuple[Any, list[dict[str, Any]]]:
@@ -472,6 +693,11 @@ def _decode_df_with_codecs(df: Any, codecs: dict[str, Codec]) -> tuple[Any, list
     describing row/field parse failures.
     返回 (decoded_df, errors)。errors 为描述行/字段解析失败的错误字典列表。
 
+    Decoding runs column by column and rebuilds only the codec columns; rows with
+    any parse failure are dropped with a single filter. Frames without codec
+    columns are returned as-is.
+    按列解码且仅重建编解码列；存在解析失败的行通过一次过滤整体剔除。不含编解码列的数据帧原样返回。
+
     Args:
         df: Polars DataFrame containing data rows (including `row_number`).
             包含数据行（包括 `row_number`）的 Polars DataFrame。
@@ -482,44 +708,99 @@ def _decode_df_with_codecs(df: Any, codecs: dict[str, Codec]) -> tuple[Any, list
         Tuple[pl.DataFrame, list]: Decoded DataFrame and error list.
             解码后的 DataFrame 与错误列表。
     """
+    if not df.is_empty() and codecs.keys().isdisjoint(df.columns):
+        return df, []
+
     import polars as pl
 
-    rows = df.to_dicts() if not df.is_empty() else []
-    decoded_rows: list[dict[str, Any]] = []
-    errors: list[dict[str, Any]] = []
-    for row in rows:
-        row_number = int(row.get("row_number") or 0)
-        decoded: dict[str, Any] = dict(row)
-        decoded["row_number"] = row_number
-        has_error = False
-        for field, codec in codecs.items():
-            if field not in row:
-                continue
-            raw = row.get(field)
+    if df.is_empty():
+        return pl.DataFrame(), []
+    if "row_number" in df.columns:
+        df = df.with_columns(pl.col("row_number").fill_null(0).cast(pl.Int64))
+    else:
+        df = df.with_columns(pl.lit(0, dtype=pl.Int64).alias("row_number"))
+    row_numbers = df.get_column("row_number").to_list()
+    failed: list[tuple[int, dict[str, Any]]] = []
+    decoded_columns: list[tuple[str, list[Any]]] = []
+    for field, codec in codecs.items():
+        if field not in df.columns:
+            continue
+        parse = codec.parse
+        values: list[Any] = []
+        append = values.append
+        for index, raw in enumerate(df.get_column(field).to_list()):
             raw_text = "" if raw is None else str(raw).strip()
             try:
-                decoded[field] = codec.parse(raw_text)
+                append(parse(raw_text))
             except Exception:
-                errors.append(
-                    {
-                        "row_number": row_number,
-                        "field": field,
-                        "message": f"Invalid value for {field}: {raw_text} / 字段 {field} 格式错误: {raw_text}",
-                        "type": "format",
-                        "value": raw_text,
-                    }
+                append(None)
+                failed.append(
+                    (
+                        index,
+                        {
+                            "row_number": row_numbers[index],
+                            "field": field,
+                            "message": f"Invalid value for {field}: {raw_text} / 字段 {field} 格式错误: {raw_text}",
+                            "type": "format",
+                            "value": raw_text,
+                        },
+                    )
                 )
-                has_error = True
-        if not has_error:
-            decoded_rows.append(decoded)
-    decoded_df = pl.DataFrame(decoded_rows) if decoded_rows else pl.DataFrame()
-    return decoded_df, errors
+        decoded_columns.append((field, values))
+    # Report errors row by row, then in codec order within a row (stable sort).
+    # 按行输出错误，同一行内保持编解码器顺序（稳定排序）。
+    failed.sort(key=lambda item: item[0])
+    errors = [error for _, error in failed]
+    if failed:
+        keep = [True] * df.height
+        for index, _ in failed:
+            keep[index] = False
+        if not any(keep):
+            return pl.DataFrame(), errors
+        df = df.filter(pl.Series(keep))
+        decoded_columns = [
+            (field, [value for value, ok in zip(values, keep, strict=True) if ok]) for field, values in decoded_columns
+        ]
+    if decoded_columns:
+        df = df.with_columns([_decoded_series(field, values) for field, values in decoded_columns])
+    return df, errors
+
+
+def _decoded_series(name: str, values: list[Any]) -> Any:
+    """Build a Series from decoded values, keeping Python enums as objects.
+    由解码值构建 Series，Python 枚举保留为对象。
+
+    The `pl.Series` constructor turns enum members into their string values (even
+    for `pl.Object`), while validators expect the members returned by the codec, so
+    enum columns are gathered through `map_elements` instead.
+    `pl.Series` 构造器会将枚举成员转换为字符串值（即使指定 `pl.Object`），而校验函数期望得到
+    编解码器返回的成员，因此枚举列改为通过 `map_elements` 构建。
+
+    Args:
+        name: Column name.
+            列名。
+        values: Decoded values of the column.
+            该列的解码值。
+    Returns:
+        pl.Series: Decoded column.
+            解码后的列。
+    """
+    import polars as pl
+
+    first = next((value for value in values if value is not None), None)
+    if not isinstance(first, Enum):
+        return pl.Series(name, values)
+    return pl.Series(name, range(len(values))).map_elements(values.__getitem__, return_dtype=pl.Object)
 
 
 def _encode_df_with_codecs(df: Any, codecs: dict[str, Codec]) -> Any:
     """Encode DataFrame fields to text using provided codecs.
     使用提供的编解码器将 DataFrame 字段格式化为文本。
 
+    Only the codec columns are rebuilt; other columns keep their dtypes. Frames
+    without codec columns are returned as-is.
+    仅重建编解码列，其他列保留原有类型。不含编解码列的数据帧原样返回。
+
     Args:
         df: Polars DataFrame containing typed values.
             包含类型化值的 Polars DataFrame。
@@ -530,18 +811,19 @@ def _encode_df_with_codecs(df: Any, codecs: dict[str, Codec]) -> Any:
         pl.DataFrame: DataFrame with formatted string values.
             包含格式化字符串值的 DataFrame。
     """
+    if not df.is_empty() and codecs.keys().isdisjoint(df.columns):
+        return df
+
     import polars as pl
 
-    rows = df.to_dicts() if not df.is_empty() else []
-    encoded_rows: list[dict[str, Any]] = []
-    for row in rows:
-        encoded: dict[str, Any] = dict(row)
-        for field, codec in codecs.items():
-            if field not in row:
-                continue
-            encoded[field] = codec.format(row.get(field))
-        encoded_rows.append(encoded)
-    return pl.DataFrame(encoded_rows) if encoded_rows else pl.DataFrame()
+    if df.is_empty():
+        return pl.DataFrame()
+    encoded = [
+        pl.Series(field, [codec.format(value) for value in df.get_column(field).to_list()], dtype=pl.String)
+        for field, codec in codecs.items()
+        if field in df.columns
+    ]
+    return df.with_columns(encoded) if encoded else df
 
 
 def _is_polars_df(value: Any) -> bool:
@@ -560,32 +842,7 @@ def _is_polars_df(value: Any) -> bool:
         bool: True when the value is a Polars DataFrame, otherwise False.
             值为 Polars DataFrame 时为 True，否则为 False。
     """
-    try:
-        import polars as pl  # type: ignore
-    except Exception:
-        return False
-    return isinstance(value, pl.DataFrame)
-
-
-def _infer_columns(rows: Iterable[Mapping[str, Any]]) -> list[str]:
-    """Infer column names from an iterable of mapping rows.
-    从映射行的可迭代对象中推断列名。
-
-    Args:
-        rows: Iterable of mapping rows.
-            映射行的可迭代对象。
-    Returns:
-        list[str]: List of inferred column names.
-            推断的列名列表。
-    """
-    columns: list[str] = []
-    seen: set[str] = set()
-    for row in rows:
-        for k in row.keys():
-            if k not in seen:
-                seen.add(k)
-                columns.append(k)
-    return columns
+    return isinstance(value, _polars_dataframe_type())
 
 
 def _default_filename(*, fmt: ExportFormat, resource: type[Resource] | None) -> str:
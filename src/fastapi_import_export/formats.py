@@ -17,6 +17,8 @@ class ExportFormat(StrEnum):
 
     CSV = "csv"
     XLSX = "xlsx"
+    ARROW = "arrow"
+    PARQUET = "parquet"
 
 
 CSV_ALLOWED_EXTENSIONS: tuple[str, ...] = (".csv",)
@@ -33,14 +35,21 @@ XLSX_ALLOWED_MIME_TYPES: tuple[str, ...] = (
     "application/vnd.ms-excel.sheet.macroEnabled.12",
 )
 
+# `ExportFormat` is a `StrEnum`, so members hash and compare like their values and
+# both enum and plain-string keys hit these dicts directly without enum coercion.
+# `ExportFormat` 为 `StrEnum`，成员的哈希与比较同其值一致，枚举与普通字符串键均可直接命中，无需枚举转换。
 _MEDIA_TYPES: dict[ExportFormat, str] = {
     ExportFormat.CSV: "text/csv; charset=utf-8",
     ExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ExportFormat.ARROW: "application/vnd.apache.arrow.file",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
 }
 
 _EXTENSIONS: dict[ExportFormat, str] = {
     ExportFormat.CSV: ".csv",
     ExportFormat.XLSX: ".xlsx",
+    ExportFormat.ARROW: ".arrow",
+    ExportFormat.PARQUET: ".parquet",
 }
 
 
@@ -56,8 +65,10 @@ def media_type_for(fmt: ExportFormat | str) -> str:
             格式的默认 media type。
 
     """
-    key = ExportFormat(fmt)
-    return _MEDIA_TYPES[key]
+    try:
+        return _MEDIA_TYPES[fmt]
+    except (KeyError, TypeError):
+        return _MEDIA_TYPES[ExportFormat(fmt)]
 
 
 def extension_for(fmt: ExportFormat | str) -> str:
@@ -72,5 +83,7 @@ def extension_for(fmt: ExportFormat | str) -> str:
             格式的默认文件扩展名。
 
     """
-    key = ExportFormat(fmt)
-    return _EXTENSIONS[key]
+    try:
+        return _EXTENSIONS[fmt]
+    except (KeyError, TypeError):
+        return _EXTENSIONS[ExportFormat(fmt)]
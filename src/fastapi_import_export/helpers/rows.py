@@ -8,6 +8,7 @@
 """
 
 from collections.abc import Iterable, Iterator, Mapping
+from functools import lru_cache
 from typing import Any
 
 
@@ -56,8 +57,21 @@ def _is_polars_df(value: Any) -> bool:
     lazily on demand.
     该助手通过按需延迟导入 polars 来避免在模块导入时立即导入该库。
     """
+    return isinstance(value, _polars_dataframe_type())
+
+
+@lru_cache(maxsize=1)
+def _polars_dataframe_type() -> Any:
+    """Return the Polars DataFrame class, or an empty tuple when polars is not installed.
+    返回 Polars DataFrame 类；未安装 polars 时返回空元组。
+
+    Polars is imported on the first call and the result is cached, so `isinstance`
+    checks against it neither import polars at module import time nor repeat the import.
+    首次调用时导入 polars 并缓存结果，因此基于它的 `isinstance` 检查既不会在模块导入时导入 polars，
+    也不会重复导入。
+    """
     try:
-        import polars as pl  # type: ignore
-    except Exception:
-        return False
-    return isinstance(value, pl.DataFrame)
+        import polars as pl
+    except Exception:  # pragma: no cover - polars is an optional extra
+        return ()
+    return pl.DataFrame
@@ -17,6 +17,24 @@ from fastapi_import_export.schemas import ImportErrorItem
 from fastapi_import_export.typing import ParseFn, PersistFn, TransformFn, ValidateFn
 
 
+async def _identity_transform[TTable](*, data: TTable, resource: type[Resource]) -> TTable:
+    """
+    Default transform returning valid data unchanged.
+    默认转换函数，原样返回有效数据。
+
+    Args:
+        data: Valid table data.
+            通过校验的表格数据。
+        resource: Resource class.
+            资源类。
+
+    Returns:
+        TTable: The input data.
+        TTable: 输入数据。
+    """
+    return data
+
+
 class ImportStatus(StrEnum):
     """
     Import status enum.
@@ -55,6 +73,12 @@ class Importer[TTable, TError: ImportErrorItem]:
     This class defines the lifecycle hooks:
     parse -> validate -> transform -> persist.
     该类定义生命周期钩子：解析 -> 校验 -> 转换 -> 持久化。
+
+    Validation may run in two phases: an optional cheap `fast_validator` (headers,
+    required columns, row count) whose errors end the import before the full
+    per-row `validator` runs.
+    校验可分两阶段执行：可选的轻量 `fast_validator`（表头、必填列、行数）一旦返回错误即结束导入，
+    不再运行完整的逐行 `validator`。
     """
 
     def __init__(
@@ -62,8 +86,9 @@ class Importer[TTable, TError: ImportErrorItem]:
         *,
         parser: ParseFn[TTable],
         validator: ValidateFn[TTable, TError],
-        transformer: TransformFn[TTable],
+        transformer: TransformFn[TTable] = _identity_transform,
         persister: PersistFn[TTable],
+        fast_validator: ValidateFn[TTable, TError] | None = None,
     ) -> None:
         """
         Initialize importer.
@@ -74,15 +99,21 @@ class Importer[TTable, TError: ImportErrorItem]:
             parser: 解析函数。
             validator: Validate function.
             validator: 校验函数。
-            transformer: Transform function.
-            transformer: 转换函数。
+            transformer: Transform function; defaults to returning the data unchanged.
+            transformer: 转换函数；默认原样返回数据。
             persister: Persist function.
             persister: 落库函数。
+            fast_validator: Optional cheap validator run before `validator`; its errors are returned immediately.
+            fast_validator: 可选的轻量校验函数，在 `validator` 之前运行；返回错误时立即结束。
         """
         self._parser = parser
         self._validator = validator
         self._transformer = transformer
         self._persister = persister
+        self._fast_validator = fast_validator
+        # Skip the transform stage entirely when it is the default no-op and not overridden.
+        # 当转换阶段为默认空操作且未被重写时完全跳过。
+        self._transform_is_identity = transformer is _identity_transform and type(self).transform is Importer.transform
 
     async def import_data(
         self,
@@ -111,7 +142,10 @@ class Importer[TTable, TError: ImportErrorItem]:
         valid_data, errors = await self.validate(data=data, resource=resource, allow_overwrite=allow_overwrite)
         if errors:
             return ImportResult(status=ImportStatus.VALIDATED, imported_rows=0, errors=errors)
-        transformed = await self.transform(data=valid_data, resource=resource)
+        if self._transform_is_identity:
+            transformed = valid_data
+        else:
+            transformed = await self.transform(data=valid_data, resource=resource)
         imported_rows = await self.persist(data=transformed, resource=resource, allow_overwrite=allow_overwrite)
         return ImportResult(status=ImportStatus.COMMITTED, imported_rows=imported_rows, errors=[])
 
@@ -151,6 +185,10 @@ class Importer[TTable, TError: ImportErrorItem]:
             tuple[TTable, list[TError]]: Valid data and error list.
             tuple[TTable, list[TError]]: 通过校验的数据与错误列表。
         """
+        if self._fast_validator is not None:
+            data, errors = await self._fast_validator(data=data, resource=resource, allow_overwrite=allow_overwrite)
+            if errors:
+                return data, errors
         return await self._validator(data=data, resource=resource, allow_overwrite=allow_overwrite)
 
     async def transform(self, *, data: TTable, resource: type[Resource]) -> TTable:
@@ -18,6 +18,10 @@ from fastapi_import_export.db_validation import DbCheckSpec
 class ExportOptions:
     """Export options (explicit configuration layer).
     导出选项（显式配置层）。
+
+    `xlsx_constant_memory` streams XLSX rows through a temporary file instead of
+    keeping the whole worksheet in memory.
+    `xlsx_constant_memory` 通过临时文件流式写出 XLSX 行，而非在内存中保留整个工作表。
     """
 
     filename: str | None = None
@@ -26,6 +30,7 @@ class ExportOptions:
     line_ending: str = "\r\n"
     chunk_size: int = 64 * 1024
     columns: list[str] | None = None
+    xlsx_constant_memory: bool = True
 
 
 @dataclass(frozen=True, slots=True)
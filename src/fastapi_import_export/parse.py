@@ -7,18 +7,24 @@
 解析模块门面（可选后端）。
 """
 
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from fastapi_import_export.exceptions import ImportExportError
 
 
+@lru_cache(maxsize=1)
 def _load_backend() -> Any:
     """Load optional parsing backend (polars/openpyxl) and return module.
     加载可选的解析后端（polars/openpyxl）并返回模块。
 
     Raises ImportExportError when optional dependencies are not installed.
     当可选依赖未安装时抛出 ImportExportError。
+
+    Successful loads are cached; a failed import is retried on the next call.
+    成功加载的模块会被缓存；导入失败时下次调用会重试。
     """
     try:
         from fastapi_import_export import parse_polars
@@ -51,7 +57,28 @@ def parse_tabular_file(file_path: Path, *, filename: str) -> Any:
     return backend.parse_tabular_file(file_path, filename=filename)
 
 
-def normalize_columns(df: Any, column_mapping: dict[str, str]) -> Any:
+def parse_tabular_file_batched(file_path: Path, *, filename: str, batch_size: int = 100_000) -> Iterator[Any]:
+    """
+    Parse a CSV/Excel file lazily into DataFrame batches.
+    将 CSV/Excel 文件惰性解析为多个 DataFrame 批次。
+
+    Args:
+        file_path: File path on disk.
+        file_path: 文件磁盘路径。
+        filename: Original filename.
+        filename: 原始文件名。
+        batch_size: Approximate number of rows per CSV batch.
+        batch_size: 每个 CSV 批次的大致行数。
+
+    Returns:
+        Iterator[DataFrame]: Parsed batches including `row_number`.
+        Iterator[DataFrame]: 包含 `row_number` 的解析批次。
+    """
+    backend = _load_backend()
+    return backend.parse_tabular_file_batched(file_path, filename=filename, batch_size=batch_size)
+
+
+def normalize_columns(df: Any, column_mapping: dict[str, str] | None) -> Any:
     """
     Normalize column names using a mapping table.
     基于列名映射表标准化列名。
@@ -59,8 +86,8 @@ def normalize_columns(df: Any, column_mapping: dict[str, str]) -> Any:
     Args:
         df: Input DataFrame.
         df: 输入 DataFrame。
-        column_mapping: Mapping from raw header to canonical header.
-        column_mapping: 列名映射（原始表头 -> 规范表头）。
+        column_mapping: Mapping from raw header to canonical header, or None for no aliases.
+        column_mapping: 列名映射（原始表头 -> 规范表头），None 表示无别名。
 
     Returns:
         DataFrame: Renamed DataFrame.
@@ -70,7 +97,7 @@ def normalize_columns(df: Any, column_mapping: dict[str, str]) -> Any:
     return backend.normalize_columns(df, column_mapping)
 
 
-def dataframe_to_preview_rows(df: Any) -> list[dict[str, Any]]:
+def dataframe_to_preview_rows(df: Any, *, preview_rows: int | None = None) -> list[dict[str, Any]]:
     """
     Convert a DataFrame to preview rows.
     将 DataFrame 转换为预览行。
@@ -78,13 +105,15 @@ def dataframe_to_preview_rows(df: Any) -> list[dict[str, Any]]:
     Args:
         df: Input DataFrame.
         df: 输入 DataFrame。
+        preview_rows: Maximum number of rows to convert; None converts all rows.
+        preview_rows: 最多转换的行数；None 表示转换全部行。
 
     Returns:
         list[dict[str, Any]]: Preview rows.
         list[dict[str, Any]]: 预览行列表。
     """
     backend = _load_backend()
-    return backend.dataframe_to_preview_rows(df)
+    return backend.dataframe_to_preview_rows(df, preview_rows=preview_rows)
 
 
 if TYPE_CHECKING:
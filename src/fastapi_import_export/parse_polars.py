@@ -8,6 +8,7 @@
 """
 
 import warnings
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
@@ -147,39 +148,99 @@ def parse_tabular_file(file_path: Path, *, filename: str) -> ParsedTable:
     return ParsedTable(df=df, total_rows=df.height, columns=list(df.columns))
 
 
-def normalize_columns(df: pl.DataFrame, column_mapping: dict[str, str]) -> pl.DataFrame:
+def parse_tabular_file_batched(file_path: Path, *, filename: str, batch_size: int = 100_000) -> Iterator[pl.DataFrame]:
+    """
+    Parse a CSV/Excel file lazily into DataFrame batches.
+    将 CSV/Excel 文件惰性解析为多个 DataFrame 批次。
+
+    CSV files are scanned with `pl.scan_csv(...).collect_batches()`, so only about
+    `batch_size` rows are held at a time. Excel workbooks cannot be read
+    incrementally and are yielded as a single batch. Each batch has the same
+    string columns and running `row_number` as `parse_tabular_file`.
+    CSV 文件通过 `pl.scan_csv(...).collect_batches()` 扫描，任一时刻仅保留约 `batch_size` 行。
+    Excel 工作簿无法增量读取，作为单个批次输出。每个批次的字符串列与连续 `row_number`
+    与 `parse_tabular_file` 一致。
+
+    Args:
+        file_path: Path to the file on disk.
+        file_path: 文件磁盘路径。
+        filename: Original filename (used for suffix detection).
+        filename: 原始文件名（用于判断扩展名）。
+        batch_size: Approximate number of rows per CSV batch.
+        batch_size: 每个 CSV 批次的大致行数。
+
+    Yields:
+        pl.DataFrame: Parsed batch including `row_number`.
+        pl.DataFrame: 包含 `row_number` 的解析批次。
+
+    Raises:
+        ValueError: If the file type is not supported.
+        ValueError: 不支持的文件类型时抛出。
+    """
+    suffix = Path(filename).suffix.lower().lstrip(".")
+    if suffix in {"xlsx", "xlsm", "xls"}:
+        yield parse_tabular_file(file_path, filename=filename).df
+        return
+    if suffix not in {"csv"}:
+        raise ValueError(f"Unsupported file type: .{suffix} / 不支持的文件类型: .{suffix}")
+
+    lf = pl.scan_csv(str(file_path), infer_schema=False, encoding="utf8-lossy")
+    offset = 1
+    for batch in lf.collect_batches(chunk_size=max(int(batch_size), 1)):
+        yield batch.with_row_index(name="row_number", offset=offset)
+        offset += batch.height
+
+
+def normalize_columns(df: pl.DataFrame, column_mapping: dict[str, str] | None) -> pl.DataFrame:
     """
     Normalize column names using a mapping table.
     基于列名映射表标准化 DataFrame 列名。
 
+    Headers are always stripped; the DataFrame is returned unchanged when no
+    column name changes.
+    表头总会去除首尾空白；若没有列名发生变化，则原样返回 DataFrame。
+
     Args:
         df: Input DataFrame.
         df: 输入 DataFrame。
-        column_mapping: Mapping from raw header to canonical header.
-        column_mapping: 列名映射（原始表头 -> 规范表头）。
+        column_mapping: Mapping from raw header to canonical header, or None for no aliases.
+        column_mapping: 列名映射（原始表头 -> 规范表头），None 表示无别名。
 
     Returns:
         pl.DataFrame: Renamed DataFrame.
         pl.DataFrame: 重命名后的 DataFrame。
     """
+    mapping = column_mapping or {}
     normalized: dict[str, str] = {}
     for c in df.columns:
         c_norm = str(c).strip()
-        normalized[c] = column_mapping.get(c_norm, c_norm)
+        target = mapping.get(c_norm, c_norm)
+        if target != c:
+            normalized[c] = target
+    if not normalized:
+        return df
     return df.rename(normalized)
 
 
-def dataframe_to_preview_rows(df: pl.DataFrame) -> list[dict[str, Any]]:
+def dataframe_to_preview_rows(df: pl.DataFrame, *, preview_rows: int | None = None) -> list[dict[str, Any]]:
     """
     Convert a DataFrame to preview rows (list of dict).
     将 DataFrame 转换为预览行（列表 of dict）。
 
+    With `preview_rows`, only the leading rows are converted, so the cost does not
+    grow with the frame height.
+    指定 `preview_rows` 时仅转换开头的行，开销不随数据帧高度增长。
+
     Args:
         df: Polars DataFrame.
         df: Polars 数据框。
+        preview_rows: Maximum number of rows to convert; None converts all rows.
+        preview_rows: 最多转换的行数；None 表示转换全部行。
 
     Returns:
         list[dict[str, Any]]: List of rows as dicts (column -> value).
         list[dict[str, Any]]: 以字典形式的行列表（列 -> 值）。
     """
+    if preview_rows is not None:
+        df = df.head(max(int(preview_rows), 0))
     return df.to_dicts()
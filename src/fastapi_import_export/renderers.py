@@ -7,7 +7,8 @@
 字节流渲染辅助函数。
 """
 
-from collections.abc import AsyncIterator
+import asyncio
+from collections.abc import AsyncIterator, Iterable, Iterator
 
 
 async def render_bytes(data: bytes) -> AsyncIterator[bytes]:
@@ -40,3 +41,55 @@ async def render_chunks(data: bytes, *, chunk_size: int = 64 * 1024) -> AsyncIte
     size = max(int(chunk_size), 1)
     for i in range(0, len(data), size):
         yield data[i : i + size]
+
+
+def _rechunk(chunks: Iterable[bytes], *, chunk_size: int) -> Iterator[bytes]:
+    """Regroup byte chunks into chunks of exactly `chunk_size` bytes (the last may be shorter).
+    将字节分块重新组合为恰好 `chunk_size` 字节的分块（最后一块可能更短）。
+
+    Args:
+        chunks: Iterable of byte chunks of any size.
+            任意大小的字节分块可迭代对象。
+        chunk_size: Size of each output chunk in bytes.
+            每个输出分块的字节数。
+    Yields:
+        bytes: Regrouped chunks in order.
+            按顺序输出的重组分块。
+    """
+    size = max(int(chunk_size), 1)
+    pending = bytearray()
+    for chunk in chunks:
+        pending += chunk
+        end = len(pending) - len(pending) % size
+        if end:
+            for start in range(0, end, size):
+                yield bytes(pending[start : start + size])
+            del pending[:end]
+    if pending:
+        yield bytes(pending)
+
+
+async def render_iter(chunks: Iterable[bytes], *, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+    """Render a lazy iterable of byte chunks as an async stream.
+    将惰性的字节分块可迭代对象渲染为异步流。
+
+    Chunks are produced only as the stream is consumed, so a serializer generator
+    never holds more than one chunk at a time. Each chunk is produced in a worker
+    thread so serialization does not block the event loop. With `chunk_size`, the
+    chunks are regrouped to that many bytes, as `render_chunks` does.
+    分块仅在消费流时生成，因此序列化器生成器任一时刻只保留一个分块。
+    每个分块在工作线程中生成，序列化不会阻塞事件循环。指定 `chunk_size` 时，
+    分块按该字节数重新组合，与 `render_chunks` 一致。
+
+    Args:
+        chunks: Iterable of byte chunks, e.g. `CsvSerializer.iter_serialize(...)`.
+            字节分块的可迭代对象，例如 `CsvSerializer.iter_serialize(...)`。
+        chunk_size: Optional size of each chunk in bytes; None keeps the input chunks.
+            可选的每块字节数；为 None 时保留输入分块。
+    Yields:
+        bytes: Each chunk in order.
+            按顺序输出的各分块。
+    """
+    it = iter(chunks) if chunk_size is None else _rechunk(chunks, chunk_size=chunk_size)
+    while (chunk := await asyncio.to_thread(next, it, None)) is not None:
+        yield chunk
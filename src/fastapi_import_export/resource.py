@@ -7,12 +7,18 @@
 资源基类与字段映射钩子。
 """
 
+from collections.abc import Callable
 from typing import Any, ClassVar
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel, ConfigDict
 
 from fastapi_import_export.codecs import Codec
 
+# Resolved field metadata per Resource subclass, tagged with the configuration it was built from.
+# 按 Resource 子类缓存的已解析字段元数据，并标记其构建时所依据的配置。
+_RESOLVED_CACHE: WeakKeyDictionary[type, tuple[tuple[Any, ...], dict[str, Any]]] = WeakKeyDictionary()
+
 
 class Resource(BaseModel):
     """
@@ -45,9 +51,7 @@ class Resource(BaseModel):
             dict[str, str]: Mapping from input header to resource field.
             dict[str, str]: 输入表头到资源字段的映射。
         """
-        mapping = {name: name for name in cls.field_order()}
-        mapping.update(cls.field_aliases)
-        return mapping
+        return dict(cls._cached("field_mapping", cls._resolve_field_mapping))
 
     @classmethod
     def field_order(cls) -> list[str]:
@@ -59,10 +63,7 @@ class Resource(BaseModel):
             list[str]: List of field names in order.
             list[str]: 按顺序的字段名列表。
         """
-        declared = list(cls.model_fields.keys())
-        if declared:
-            return declared
-        return cls._infer_model_fields()
+        return list(cls._cached("field_order", cls._resolve_field_order))
 
     @classmethod
     def export_mapping(cls) -> dict[str, str]:
@@ -70,6 +71,80 @@ class Resource(BaseModel):
         Return export column mapping (field -> output header).
         返回导出字段映射（字段 -> 输出列名）。
 
+        Returns:
+            dict[str, str]: Mapping from resource field to output header.
+            dict[str, str]: 资源字段到输出表头的映射。
+        """
+        return dict(cls._cached("export_mapping", cls._resolve_export_mapping))
+
+    @classmethod
+    def _cached(cls, key: str, build: Callable[[], Any]) -> Any:
+        """Return a resolved value from the per-class cache, building it on first use.
+        从按类缓存中返回已解析的值，首次使用时构建。
+
+        Entries are dropped when the class configuration (`model`, aliases,
+        `exclude_fields`) no longer equals the snapshot they were built from, so
+        reassigning or mutating those attributes is still picked up. Callers copy
+        the cached value before returning it.
+        当类配置（`model`、别名、`exclude_fields`）与构建时的快照不再相等时丢弃缓存，
+        因此重新赋值或原地修改这些属性仍会生效。调用方在返回前会复制缓存值。
+
+        Args:
+            key: Cache key of the resolved value.
+                已解析值的缓存键。
+            build: Builder called on a cache miss.
+                缓存未命中时调用的构建函数。
+        Returns:
+            Any: The cached value.
+            Any: 缓存的值。
+        """
+        token = (
+            cls.model,
+            tuple(cls.field_aliases.items()),
+            tuple(cls.export_aliases.items()),
+            tuple(cls.exclude_fields),
+        )
+        entry = _RESOLVED_CACHE.get(cls)
+        if entry is None or entry[0] != token:
+            entry = (token, {})
+            _RESOLVED_CACHE[cls] = entry
+        values = entry[1]
+        if key not in values:
+            values[key] = build()
+        return values[key]
+
+    @classmethod
+    def _resolve_field_mapping(cls) -> dict[str, str]:
+        """Build the field mapping returned by `field_mapping`.
+        构建 `field_mapping` 返回的字段映射。
+
+        Returns:
+            dict[str, str]: Mapping from input header to resource field.
+            dict[str, str]: 输入表头到资源字段的映射。
+        """
+        mapping = {name: name for name in cls.field_order()}
+        mapping.update(cls.field_aliases)
+        return mapping
+
+    @classmethod
+    def _resolve_field_order(cls) -> list[str]:
+        """Build the field order returned by `field_order`.
+        构建 `field_order` 返回的字段顺序。
+
+        Returns:
+            list[str]: List of field names in order.
+            list[str]: 按顺序的字段名列表。
+        """
+        declared = list(cls.model_fields.keys())
+        if declared:
+            return declared
+        return cls._infer_model_fields()
+
+    @classmethod
+    def _resolve_export_mapping(cls) -> dict[str, str]:
+        """Build the export mapping returned by `export_mapping`.
+        构建 `export_mapping` 返回的导出映射。
+
         Returns:
             dict[str, str]: Mapping from resource field to output header.
             dict[str, str]: 资源字段到输出表头的映射。
@@ -9,19 +9,30 @@
 
 import csv
 import io
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import batched
+from operator import itemgetter
 from typing import Any, Protocol
 
 from fastapi_import_export.exceptions import ImportExportError
+from fastapi_import_export.helpers.rows import _is_polars_df, _polars_dataframe_type
 from fastapi_import_export.options import ExportOptions
 
+_BUFFER_POOL_SIZE = 16
+_CSV_STREAM_SLICE_ROWS = 10_000
+_BUFFER_POOL: list[io.BytesIO] = []
+
 
 class Serializer(Protocol):
     """Serializer protocol.
     序列化器协议。
     """
 
-    def serialize(self, *, data: Iterable[Mapping[str, Any]], options: ExportOptions) -> bytes: ...
+    def serialize(self, *, data: Iterable[Mapping[str, Any]] | Any, options: ExportOptions) -> bytes: ...
 
 
 def _infer_columns(rows: Iterable[Mapping[str, Any]]) -> list[str]:
@@ -29,8 +40,11 @@ def _infer_columns(rows: Iterable[Mapping[str, Any]]) -> list[str]:
     从映射行的可迭代对象中推断列顺序。
 
     Iterates rows in order and collects the first occurrence of each key to
-    preserve header ordering for CSV/XLSX output.
-    遍历行并收集每个键的首次出现位置，以便在 CSV/XLSX 输出中保持表头顺序。
+    preserve header ordering for CSV/XLSX output. Export rows almost always share
+    the first row's keys, so each later row is first checked with a single
+    key-view subset test and only scanned key by key when it adds new columns.
+    遍历行并收集每个键的首次出现位置，以便在 CSV/XLSX 输出中保持表头顺序。导出行几乎总是与首行键相同，
+    因此后续每行先做一次键视图子集判断，仅在出现新列时才逐键扫描。
 
     Args:
         rows: Iterable of mapping rows.
@@ -40,64 +54,441 @@ def _infer_columns(rows: Iterable[Mapping[str, Any]]) -> list[str]:
         list[str]: Inferred column name list.
             推断的列名列表。
     """
-    columns: list[str] = []
-    seen: set[str] = set()
-    for row in rows:
-        for k in row.keys():
+    it = iter(rows)
+    first = next(it, None)
+    if first is None:
+        return []
+    columns = list(first.keys())
+    seen = set(columns)
+    for row in it:
+        keys = row.keys()
+        if keys <= seen:
+            continue
+        for k in keys:
             if k not in seen:
                 seen.add(k)
                 columns.append(k)
     return columns
 
 
+@contextmanager
+def _pooled_buffer() -> Iterator[io.BytesIO]:
+    """Borrow an empty `BytesIO` from a small free list and return it afterwards.
+    从小型空闲列表借用一个空 `BytesIO`，用完后归还。
+
+    Callers must copy the bytes out (`getvalue()`) before leaving the block; the
+    buffer is truncated on release so pooled buffers never hold export data.
+    调用方必须在离开代码块前取出字节（`getvalue()`）；归还时缓冲区会被截断，池中缓冲区不会保留导出数据。
+
+    Yields:
+        io.BytesIO: An empty buffer.
+            空缓冲区。
+    """
+    try:
+        buf = _BUFFER_POOL.pop()
+    except IndexError:
+        buf = io.BytesIO()
+    try:
+        yield buf
+    finally:
+        buf.seek(0)
+        buf.truncate(0)
+        if len(_BUFFER_POOL) < _BUFFER_POOL_SIZE:
+            _BUFFER_POOL.append(buf)
+
+
+def _select_frame_columns(df: Any, columns: list[str] | None) -> Any:
+    """Project a DataFrame onto the export columns, filling missing ones with nulls.
+    将 DataFrame 投影到导出列，缺失列以空值填充。
+
+    Args:
+        df: Polars DataFrame.
+            Polars DataFrame。
+        columns: Export columns, or None to keep the frame columns.
+            导出列；为 None 时保留数据帧原有列。
+    Returns:
+        pl.DataFrame: DataFrame whose columns are exactly the export columns.
+            列恰好为导出列的 DataFrame。
+    """
+    if not columns or columns == df.columns:
+        return df
+    import polars as pl
+
+    present = set(df.columns)
+    missing = [col for col in columns if col not in present]
+    if missing:
+        # Added via with_columns so literals broadcast to the frame height.
+        # 通过 with_columns 添加，使字面量按数据帧高度广播。
+        df = df.with_columns([pl.lit(None).alias(col) for col in missing])
+    return df.select(columns)
+
+
+_LINE_BREAKS = frozenset("\r\n")
+
+
+def _supports_native_csv(df: Any, *, line_ending: str) -> bool:
+    """Check whether Polars `write_csv` renders a frame exactly like the `csv` module.
+    检查 Polars `write_csv` 输出是否与 `csv` 模块完全一致。
+
+    String, integer, date and null columns print identically; booleans, floats and
+    other temporals differ from Python `str()` and keep the row writer. Single-column
+    frames also keep it, since `csv` quotes a lone empty field as `""`. `csv` only
+    quotes the line-break characters of its own terminator while Polars quotes both
+    `\\r` and `\\n`, so text holding the other one also keeps the row writer.
+    字符串、整数、日期与空列输出一致；布尔、浮点及其他时间类型与 Python `str()` 不同，仍使用逐行写入。
+    单列数据同样使用逐行写入，因为 `csv` 会将单独的空字段写为 `""`。`csv` 仅对其换行符中的字符加引号，
+    而 Polars 对 `\\r` 与 `\\n` 均加引号，因此包含另一换行字符的文本同样使用逐行写入。
+
+    Args:
+        df: Polars DataFrame.
+            Polars DataFrame。
+        line_ending: CSV line terminator.
+            CSV 换行符。
+    Returns:
+        bool: True when the frame can be written with `write_csv`.
+            可使用 `write_csv` 写出时为 True。
+    """
+    import polars as pl
+
+    if df.width < 2 or not line_ending or not set(line_ending) <= _LINE_BREAKS:
+        return False
+    if not all(dtype == pl.String or dtype == pl.Date or dtype == pl.Null or dtype.is_integer() for dtype in df.dtypes):
+        return False
+    unquoted = "".join(_LINE_BREAKS - set(line_ending))
+    if not unquoted:
+        return True
+    if any(unquoted in name for name in df.columns):
+        return False
+    text = [
+        pl.col(name).str.contains(unquoted, literal=True).any()
+        for name, dtype in df.schema.items()
+        if dtype == pl.String
+    ]
+    return not text or df.select(pl.any_horizontal(text)).item() is not True
+
+
+def _write_csv_frame(df: Any, *, options: ExportOptions, include_header: bool = True) -> bytes:
+    """Write a DataFrame to CSV bytes with Polars `write_csv`.
+    使用 Polars `write_csv` 将 DataFrame 写为 CSV 字节。
+
+    Empty strings are written as empty fields (not `""`) to match the `csv` module.
+    空字符串写为空字段（而非 `""`），与 `csv` 模块保持一致。
+
+    Args:
+        df: Polars DataFrame accepted by `_supports_native_csv`.
+            通过 `_supports_native_csv` 检查的 Polars DataFrame。
+        options: Export options (BOM, line ending).
+            导出选项（BOM、换行符）。
+        include_header: Whether to write the header row (and BOM).
+            是否写入表头行（及 BOM）。
+    Returns:
+        bytes: Serialized CSV data.
+            序列化的 CSV 数据。
+    """
+    import polars as pl
+
+    text = pl.col(pl.String)
+    with _pooled_buffer() as buf:
+        df.with_columns(pl.when(text != "").then(text).name.keep()).write_csv(
+            buf,
+            include_header=include_header,
+            include_bom=options.include_bom and include_header,
+            line_terminator=options.line_ending,
+        )
+        return buf.getvalue()
+
+
+@lru_cache(maxsize=1)
+def _native_csv_types() -> dict[type, Any]:
+    """Map Python types whose `str()` matches Polars `write_csv` output to their dtypes.
+    将 `str()` 与 Polars `write_csv` 输出一致的 Python 类型映射到对应 dtype。
+
+    Polars is imported on the first call and the mapping is cached; it is empty
+    when polars is not installed.
+    首次调用时导入 Polars 并缓存映射；未安装 polars 时映射为空。
+    """
+    if not _polars_dataframe_type():
+        return {}
+    import polars as pl
+
+    return {str: pl.String, int: pl.Int64, date: pl.Date}
+
+
+def _native_csv_frame(rows: list[Mapping[str, Any]], fieldnames: list[str]) -> Any | None:
+    """Build a DataFrame from mapping rows when every column has a single native CSV type.
+    当每列仅含一种原生 CSV 类型时，由映射行构建 DataFrame。
+
+    Missing keys become nulls and extra keys are ignored, like `csv.DictWriter`
+    with `restval=""` and `extrasaction="ignore"`. Columns mixing types or holding
+    anything but exact `str`/`int`/`date` values (bool, float, subclasses, ...) return
+    None so the caller keeps the row writer.
+    缺失键视为空值、多余键被忽略，与 `csv.DictWriter`（`restval=""`、`extrasaction="ignore"`）一致。
+    列中类型混杂或包含非精确 `str`/`int`/`date` 的值（bool、float、子类等）时返回 None，调用方继续逐行写入。
+
+    Args:
+        rows: Materialized mapping rows.
+            已物化的映射行。
+        fieldnames: Output columns.
+            输出列。
+    Returns:
+        pl.DataFrame | None: DataFrame of the output columns, or None when unsupported.
+            由输出列构成的 DataFrame；不支持时返回 None。
+    """
+    native_types = _native_csv_types()
+    if not native_types or not rows or len(fieldnames) < 2 or len(set(fieldnames)) != len(fieldnames):
+        return None
+    import polars as pl
+
+    columns = []
+    for name in fieldnames:
+        values = [row.get(name) for row in rows]
+        types = set(map(type, values))
+        types.discard(type(None))
+        if len(types) > 1:
+            return None
+        if not types:
+            columns.append(pl.Series(name, values, dtype=pl.Null))
+            continue
+        dtype = native_types.get(types.pop())
+        if dtype is None:
+            return None
+        try:
+            columns.append(pl.Series(name, values, dtype=dtype, strict=True))
+        except (OverflowError, TypeError, pl.exceptions.PolarsError):
+            return None
+    return pl.DataFrame(columns)
+
+
+def _row_values_getter(headers: list[str]) -> Callable[[Mapping[str, Any]], Sequence[Any]]:
+    """Build a function returning a mapping row's values in header order.
+    构建按表头顺序返回映射行取值的函数。
+
+    Rows holding every header go through one `operator.itemgetter` call; rows
+    missing a key fall back to per-key `get` with `""` as the default.
+    包含全部表头的行通过一次 `operator.itemgetter` 调用取值；缺少键的行回退为逐键 `get`，默认值为 `""`。
+
+    Args:
+        headers: Output column names.
+            输出列名。
+    Returns:
+        Callable: Function mapping a row to its values.
+            将行映射为取值序列的函数。
+    """
+    keys = tuple(headers)
+
+    def get_missing(row: Mapping[str, Any]) -> Sequence[Any]:
+        return [row.get(key, "") for key in keys]
+
+    if len(keys) < 2:
+        return get_missing
+    getter = itemgetter(*keys)
+
+    def get_values(row: Mapping[str, Any]) -> Sequence[Any]:
+        try:
+            return getter(row)
+        except KeyError:
+            return get_missing(row)
+
+    return get_values
+
+
 class CsvSerializer:
-    """CSV serializer using stdlib csv.DictWriter.
-    使用标准库 csv.DictWriter 的 CSV 序列化器。
+    """CSV serializer using stdlib csv.writer.
+    使用标准库 csv.writer 的 CSV 序列化器。
+
+    Mapping rows are written like `csv.DictWriter(restval="", extrasaction="ignore")`,
+    reading each row's values with one `itemgetter` call.
+    映射行的输出与 `csv.DictWriter(restval="", extrasaction="ignore")` 一致，每行通过一次 `itemgetter` 调用取值。
+
+    Polars DataFrames are written directly: with `write_csv` when the output is
+    identical, otherwise row by row without building dicts. Mapping rows whose
+    columns each hold a single `str`/`int`/`date` type are also handed to
+    `write_csv` when Polars is installed.
+    Polars DataFrame 直接写出：输出一致时使用 `write_csv`，否则逐行写出而不构建字典。
+    安装 Polars 时，各列仅含单一 `str`/`int`/`date` 类型的映射行同样交由 `write_csv` 写出。
     """
 
-    def serialize(self, *, data: Iterable[Mapping[str, Any]], options: ExportOptions) -> bytes:
+    def serialize(
+        self,
+        *,
+        data: Iterable[Mapping[str, Any]] | Any,
+        options: ExportOptions,
+        include_header: bool = True,
+    ) -> bytes:
         """Serialize data to CSV format.
         将数据序列化为 CSV 格式。
 
         Args:
-            data: Iterable of mapping rows.
-                映射行的可迭代对象。
+            data: Iterable of mapping rows, or a Polars DataFrame.
+                映射行的可迭代对象或 Polars DataFrame。
             options: Export options.
                 导出选项。
+            include_header: Whether to write the header row (and BOM); disable for
+                continuation chunks of a streamed export.
+                是否写入表头行（及 BOM）；流式导出的后续分块应关闭。
 
         Returns:
             bytes: Serialized CSV data.
                 序列化的 CSV 数据。
         """
+        if _is_polars_df(data):
+            return self._serialize_frame(data, options=options, include_header=include_header)
         rows = list(data)
         fieldnames = options.columns or _infer_columns(rows)
+        frame = _native_csv_frame(rows, fieldnames)
+        if frame is not None and _supports_native_csv(frame, line_ending=options.line_ending):
+            return _write_csv_frame(frame, options=options, include_header=include_header)
         buf = io.StringIO()
-        writer = csv.DictWriter(
-            buf,
-            fieldnames=fieldnames,
-            extrasaction="ignore",
-            restval="",
-            lineterminator=options.line_ending,
-        )
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(dict(row))
-        encoding = "utf-8-sig" if options.include_bom else "utf-8"
+        writer = csv.writer(buf, lineterminator=options.line_ending)
+        if include_header:
+            writer.writerow(fieldnames)
+        writer.writerows(map(_row_values_getter(fieldnames), rows))
+        encoding = "utf-8-sig" if options.include_bom and include_header else "utf-8"
+        return buf.getvalue().encode(encoding)
+
+    def iter_serialize(
+        self,
+        *,
+        data: Iterable[Mapping[str, Any]] | Any,
+        options: ExportOptions,
+        batch_rows: int = _CSV_STREAM_SLICE_ROWS,
+    ) -> Iterator[bytes]:
+        """Serialize data to CSV lazily, one encoded chunk per row batch.
+        按行批次惰性序列化为 CSV，每批输出一个已编码分块。
+
+        Each batch goes through `serialize`, so the output concatenates to exactly the
+        same bytes; the header (and BOM) is only written with the first chunk. Rows
+        are only materialized when `options.columns` is unset and must be inferred.
+        每批均经 `serialize` 处理，拼接结果与一次性输出完全一致；表头（及 BOM）仅随第一块写出。
+        仅在未设置 `options.columns` 需要推断列时才物化全部行。
+
+        Args:
+            data: Iterable of mapping rows, or a Polars DataFrame.
+                映射行的可迭代对象或 Polars DataFrame。
+            options: Export options.
+                导出选项。
+            batch_rows: Number of rows per chunk.
+                每个分块的行数。
+        Yields:
+            bytes: Encoded CSV chunks.
+                编码后的 CSV 分块。
+        """
+        size = max(int(batch_rows), 1)
+        batches: Iterable[Any]
+        if _is_polars_df(data):
+            data = _select_frame_columns(data, options.columns)
+            options = replace(options, columns=data.columns)
+            batches = data.iter_slices(n_rows=size)
+        else:
+            if not options.columns:
+                data = list(data)
+                options = replace(options, columns=_infer_columns(data))
+            batches = batched(data, size)
+        first = True
+        for batch in batches:
+            yield self.serialize(data=batch, options=options, include_header=first)
+            first = False
+        if first:
+            yield self.serialize(data=data if _is_polars_df(data) else [], options=options)
+
+    def _serialize_frame(self, df: Any, *, options: ExportOptions, include_header: bool) -> bytes:
+        """Serialize a Polars DataFrame to CSV format.
+        将 Polars DataFrame 序列化为 CSV 格式。
+
+        Args:
+            df: Polars DataFrame.
+                Polars DataFrame。
+            options: Export options.
+                导出选项。
+            include_header: Whether to write the header row (and BOM).
+                是否写入表头行（及 BOM）。
+
+        Returns:
+            bytes: Serialized CSV data.
+                序列化的 CSV 数据。
+        """
+        df = _select_frame_columns(df, options.columns)
+        if _supports_native_csv(df, line_ending=options.line_ending):
+            return _write_csv_frame(df, options=options, include_header=include_header)
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator=options.line_ending)
+        if include_header:
+            writer.writerow(df.columns)
+        writer.writerows(df.iter_rows())
+        encoding = "utf-8-sig" if options.include_bom and include_header else "utf-8"
         return buf.getvalue().encode(encoding)
 
 
+def _frame_cell_writers(ws: Any, df: Any, *, datetime_format: Any) -> list[Callable[[int, int, Any], Any]]:
+    """Pick a typed xlsxwriter cell writer for each DataFrame column.
+    为 DataFrame 的每列选择带类型的 xlsxwriter 单元格写入函数。
+
+    The generic `write` re-dispatches on every cell's Python type. Columns without
+    nulls whose dtype fixes the outcome call `write_number`/`write_datetime`/`write_string`
+    directly; strings are only typed when none is empty or formula-like, since
+    `write` turns those into blanks and formulas. Other columns keep `write`.
+    通用 `write` 会对每个单元格按 Python 类型重新分派。无空值且 dtype 可确定结果的列直接调用
+    `write_number`/`write_datetime`/`write_string`；字符串列仅在不含空串或类公式值时使用带类型写入，
+    因为 `write` 会将其写为空白或公式。其余列仍使用 `write`。
+
+    Args:
+        ws: xlsxwriter worksheet.
+            xlsxwriter 工作表。
+        df: Polars DataFrame being written.
+            待写入的 Polars DataFrame。
+        datetime_format: Cell format applied to datetimes.
+            应用于日期时间的单元格格式。
+    Returns:
+        list[Callable]: One `(row, col, value)` writer per column.
+            每列一个 `(row, col, value)` 写入函数。
+    """
+    import polars as pl
+
+    writers: list[Callable[[int, int, Any], Any]] = []
+    for series in df.iter_columns():
+        dtype = series.dtype
+        writer = ws.write
+        if series.null_count() == 0:
+            if dtype.is_numeric():
+                writer = ws.write_number
+            elif dtype == pl.Date:
+                writer = ws.write_datetime
+            elif dtype == pl.Datetime and dtype.time_zone is None:
+
+                def writer(row: int, col: int, value: Any) -> Any:
+                    return ws.write_datetime(row, col, value, datetime_format)
+
+            elif (
+                dtype == pl.String
+                and not ((series == "") | series.str.starts_with("=") | series.str.starts_with("{=")).any()
+            ):
+                writer = ws.write_string
+        writers.append(writer)
+    return writers
+
+
 class XlsxSerializer:
-    """XLSX serializer using openpyxl.
-    使用 openpyxl 的 XLSX 序列化器。
+    """XLSX serializer using xlsxwriter.
+    使用 xlsxwriter 的 XLSX 序列化器。
+
+    Rows are written strictly in order, so with `ExportOptions.xlsx_constant_memory`
+    (the default) each row is flushed to a temporary file as soon as the next one
+    starts and the worksheet is never held in memory.
+    行严格按顺序写入，因此在 `ExportOptions.xlsx_constant_memory`（默认开启）下，
+    每行在写下一行时即刷写到临时文件，工作表不会整体驻留内存。
     """
 
-    def serialize(self, *, data: Iterable[Mapping[str, Any]], options: ExportOptions) -> bytes:
+    def serialize(self, *, data: Iterable[Mapping[str, Any]] | Any, options: ExportOptions) -> bytes:
         """Serialize data to XLSX format.
         将数据序列化为 XLSX 格式。
 
+        Polars DataFrames are written from row tuples without building dicts, with
+        cell writers chosen once per column from its dtype.
+        Polars DataFrame 直接按行元组写入，不构建字典，并按列 dtype 一次性选定单元格写入函数。
+
         Args:
-            data: Iterable of mapping rows.
-                映射行的可迭代对象。
+            data: Iterable of mapping rows, or a Polars DataFrame.
+                映射行的可迭代对象或 Polars DataFrame。
             options: Export options.
                 导出选项。
 
@@ -105,37 +496,156 @@ class XlsxSerializer:
             bytes: Serialized XLSX data.
                 序列化的 XLSX 数据。
         """
-        rows = list(data)
-        headers = options.columns or _infer_columns(rows)
-        Workbook = _require_openpyxl()
-        wb = Workbook()
-        ws = wb.active
-        if ws is None:
-            raise RuntimeError("Workbook.active is None / Workbook.active 为空")
-        ws.append(headers)
-        for row in rows:
-            ws.append([row.get(h, "") for h in headers])
-        ws.freeze_panes = "A2"
-        buf = io.BytesIO()
-        wb.save(buf)
-        return buf.getvalue()
+        Workbook = _require_xlsxwriter()
+        with _pooled_buffer() as buf:
+            wb = Workbook(
+                buf,
+                {
+                    "constant_memory": options.xlsx_constant_memory,
+                    "in_memory": not options.xlsx_constant_memory,
+                    "strings_to_urls": False,
+                    "nan_inf_to_errors": True,
+                    "default_date_format": "yyyy-mm-dd",
+                },
+            )
+            ws = wb.add_worksheet("Sheet")
+            ws.freeze_panes(1, 0)
+            # Dates use the workbook default; datetimes keep their time part.
+            # 日期使用工作簿默认格式；日期时间保留时间部分。
+            datetime_format = wb.add_format({"num_format": "yyyy-mm-dd h:mm:ss"})
+            ws.add_write_handler(
+                datetime,
+                lambda sheet, row, col, value, *args: sheet.write_datetime(row, col, value, datetime_format),
+            )
+            # Bytes are decoded as UTF-8 text instead of being rejected by `write`.
+            # 字节按 UTF-8 解码为文本写入，避免被 `write` 拒绝。
+            ws.add_write_handler(
+                bytes,
+                lambda sheet, row, col, value, *args: sheet.write(row, col, value.decode("utf-8", "replace"), *args),
+            )
+            write_row = ws.write_row
+            if _is_polars_df(data):
+                df = _select_frame_columns(data, options.columns)
+                write_row(0, 0, df.columns)
+                writers = tuple(enumerate(_frame_cell_writers(ws, df, datetime_format=datetime_format)))
+                for index, values in enumerate(df.iter_rows(), start=1):
+                    for col, write in writers:
+                        write(index, col, values[col])
+            else:
+                # Known columns let rows stream from the source without materializing it.
+                # 已知列时行直接从数据源流式读取，无需物化。
+                rows = data if options.columns else list(data)
+                headers = options.columns or _infer_columns(rows)
+                write_row(0, 0, headers)
+                get_values = _row_values_getter(headers)
+                for index, row in enumerate(rows, start=1):
+                    write_row(index, 0, get_values(row))
+            wb.close()
+            return buf.getvalue()
+
+
+class ArrowSerializer:
+    """Arrow IPC file serializer using Polars `write_ipc`.
+    使用 Polars `write_ipc` 的 Arrow IPC 文件序列化器。
+
+    Columnar binary output: values keep their types and no text encoding happens.
+    列式二进制输出：值保留类型，不进行文本编码。
+    """
+
+    def serialize(self, *, data: Iterable[Mapping[str, Any]] | Any, options: ExportOptions) -> bytes:
+        """Serialize data to an Arrow IPC file.
+        将数据序列化为 Arrow IPC 文件。
+
+        Args:
+            data: Iterable of mapping rows, or a Polars DataFrame.
+                映射行的可迭代对象或 Polars DataFrame。
+            options: Export options.
+                导出选项。
+
+        Returns:
+            bytes: Serialized Arrow IPC data.
+                序列化的 Arrow IPC 数据。
+        """
+        df = _to_frame(data, options=options)
+        with _pooled_buffer() as buf:
+            df.write_ipc(buf)
+            return buf.getvalue()
+
+
+class ParquetSerializer:
+    """Parquet serializer using Polars `write_parquet`.
+    使用 Polars `write_parquet` 的 Parquet 序列化器。
+
+    Columnar compressed output: values keep their types and no text encoding happens.
+    列式压缩输出：值保留类型，不进行文本编码。
+    """
+
+    def serialize(self, *, data: Iterable[Mapping[str, Any]] | Any, options: ExportOptions) -> bytes:
+        """Serialize data to a Parquet file.
+        将数据序列化为 Parquet 文件。
+
+        Args:
+            data: Iterable of mapping rows, or a Polars DataFrame.
+                映射行的可迭代对象或 Polars DataFrame。
+            options: Export options.
+                导出选项。
+
+        Returns:
+            bytes: Serialized Parquet data.
+                序列化的 Parquet 数据。
+        """
+        df = _to_frame(data, options=options)
+        with _pooled_buffer() as buf:
+            df.write_parquet(buf)
+            return buf.getvalue()
+
+
+def _to_frame(data: Iterable[Mapping[str, Any]] | Any, *, options: ExportOptions) -> Any:
+    """Build a Polars DataFrame with the export columns from rows or a DataFrame.
+    由行或 DataFrame 构建包含导出列的 Polars DataFrame。
+
+    Args:
+        data: Iterable of mapping rows, or a Polars DataFrame.
+            映射行的可迭代对象或 Polars DataFrame。
+        options: Export options (columns).
+            导出选项（列）。
+    Returns:
+        pl.DataFrame: DataFrame whose columns are the export columns.
+            列为导出列的 DataFrame。
+    Raises:
+        ImportExportError: If polars is not available.
+            无法导入 polars 时抛出。
+    """
+    if _is_polars_df(data):
+        return _select_frame_columns(data, options.columns)
+    if not _polars_dataframe_type():
+        raise ImportExportError(
+            message="Missing optional dependency: polars / 缺少可选依赖 polars",
+            error_code="missing_dependency",
+        )
+    rows = list(data)
+    columns = options.columns or _infer_columns(rows)
+    import polars as pl
+
+    df = pl.from_dicts(rows, infer_schema_length=None) if rows else pl.DataFrame()
+    return _select_frame_columns(df, columns)
 
 
-def _require_openpyxl() -> Any:
-    """Ensure openpyxl is available and return the Workbook class.
-    确保 openpyxl 可用并返回 Workbook 类。
+def _require_xlsxwriter() -> Any:
+    """Ensure xlsxwriter is available and return the Workbook class.
+    确保 xlsxwriter 可用并返回 Workbook 类。
 
     Raises:
-        ImportExportError: If openpyxl cannot be imported.
-            无法导入 openpyxl 时抛出 ImportExportError。
+        ImportExportError: If xlsxwriter cannot be imported.
+            无法导入 xlsxwriter 时抛出 ImportExportError。
     """
     try:
-        from openpyxl import Workbook
+        from xlsxwriter import Workbook
 
         return Workbook
     except Exception as exc:  # pragma: no cover
         raise ImportExportError(
-            message="Missing optional dependency: openpyxl / 缺少可选依赖 openpyxl",
+            message="Missing optional dependency: xlsxwriter / 缺少可选依赖 xlsxwriter",
             details={"error": str(exc)},
             error_code="missing_dependency",
         ) from exc
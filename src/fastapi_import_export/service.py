@@ -34,12 +34,15 @@ FastAPI reuse. Python stdlib does not provide a built-in `UploadFile` type.
 或 file-like objects 来抽象上传文件。
 """
 
+import asyncio
+import hashlib
 import inspect
 import json
 from collections.abc import Iterable
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, BinaryIO, cast
 from uuid import UUID
 
 from fastapi import UploadFile
@@ -72,7 +75,6 @@ from fastapi_import_export.storage import (
     now_ts,
     read_meta,
     safe_rmtree,
-    sha256_file,
     write_meta,
 )
 from fastapi_import_export.validation import collect_infile_duplicates
@@ -136,6 +138,65 @@ async def _maybe_await(value: Any) -> Any:
     return value
 
 
+@lru_cache(maxsize=64)
+def _normalized_allow_list(values: tuple[str, ...]) -> frozenset[str]:
+    """Normalize an allow-list (strip, lowercase, drop blanks) into a frozenset.
+
+    将允许列表规范化（去空白、小写、去除空项）为 frozenset。
+
+    Cached so the default extension/MIME lists are normalized once, not per upload.
+    结果被缓存，默认的扩展名/MIME 列表只规范化一次，而非每次上传都规范化。
+
+    Args:
+        values: Allowed values as a tuple.
+            以元组形式给出的允许值。
+
+    Returns:
+        Normalized values for O(1) membership checks.
+            用于 O(1) 成员判断的规范化值。
+    """
+    return frozenset(v.strip().lower() for v in values if str(v).strip())
+
+
+_UPLOAD_COPY_CHUNK = 1024 * 1024
+
+
+def _copy_upload(src: BinaryIO, dest: Path, *, max_bytes: int) -> tuple[int, str]:
+    """Copy an upload stream to disk, hashing it on the way.
+    将上传流复制到磁盘，并在复制过程中计算哈希。
+
+    Runs in a worker thread, so the event loop never waits on disk writes and the
+    file is not read back from disk to compute its checksum.
+    在工作线程中运行，事件循环无需等待磁盘写入，也无需再次读取文件计算校验和。
+
+    Args:
+        src: Binary upload stream (`UploadFile.file`).
+            二进制上传流（`UploadFile.file`）。
+        dest: Destination path.
+            目标路径。
+        max_bytes: Maximum allowed size in bytes.
+            允许的最大字节数。
+
+    Returns:
+        tuple[int, str]: Copied size in bytes and sha256 hex digest.
+            复制的字节数与 sha256 十六进制摘要。
+
+    Raises:
+        ImportExportError: When the upload exceeds `max_bytes`.
+            上传超过 `max_bytes` 时抛出 ImportExportError。
+    """
+    size = 0
+    digest = hashlib.sha256()
+    with dest.open("wb") as out:
+        while chunk := src.read(_UPLOAD_COPY_CHUNK):
+            size += len(chunk)
+            if size > max_bytes:
+                raise ImportExportError(message="File too large / 上传文件过大", status_code=413)
+            digest.update(chunk)
+            out.write(chunk)
+    return size, digest.hexdigest()
+
+
 class ImportExportService:
     """Domain-agnostic import/export service.
 
@@ -244,10 +305,10 @@ class ImportExportService:
         ws = cast(Any, ws)
         ws.title = filename_prefix
 
-        headers = df.columns
-        ws.append(headers)
-        for row in df.to_dicts():
-            ws.append([row.get(h, "") for h in headers])
+        ws.append(df.columns)
+        # Row tuples are already aligned with the header order. / 行元组已与表头顺序对齐。
+        for row in df.iter_rows():
+            ws.append(row)
         ws.freeze_panes = "A2"
         wb.save(file_path)
 
@@ -291,7 +352,7 @@ class ImportExportService:
         self,
         *,
         file: UploadFile,
-        column_aliases: dict[str, str],
+        column_aliases: dict[str, str] | None,
         validate_fn: ServiceValidateFn,
         allow_overwrite: bool = False,
         unique_fields: list[str] | None = None,
@@ -318,8 +379,9 @@ class ImportExportService:
         Args:
             file: FastAPI UploadFile.
                 FastAPI UploadFile。
-            column_aliases: Column mapping for header normalization.
-                列名映射（用于表头归一）。
+            column_aliases: Column mapping for header normalization; None keeps the
+                (whitespace-stripped) headers as-is.
+                列名映射（用于表头归一）；为 None 时保留（去除首尾空白后的）原表头。
             validate_fn: Domain validation handler.
                 业务校验 handler。
             allow_overwrite: Pass-through overwrite flag for domain logic.
@@ -356,8 +418,8 @@ class ImportExportService:
             ext = Path(filename).suffix.lower()
             ext_source = self.config.allowed_extensions if allowed_extensions is None else allowed_extensions
             mime_source = self.config.allowed_mime_types if allowed_mime_types is None else allowed_mime_types
-            allowed_exts = {v.strip().lower() for v in ext_source if str(v).strip()}
-            allowed_mimes = {v.strip().lower() for v in mime_source if str(v).strip()}
+            allowed_exts = _normalized_allow_list(tuple(ext_source))
+            allowed_mimes = _normalized_allow_list(tuple(mime_source))
             if allowed_exts and ext not in allowed_exts:
                 raise ImportExportError(
                     message=f"Unsupported file extension: {ext} / 不支持的文件扩展名: {ext}",
@@ -373,18 +435,9 @@ class ImportExportService:
                 )
             original_path = paths.original.with_suffix(ext)
 
-            size = 0
-            with original_path.open("wb") as out:
-                while True:
-                    chunk = await file.read(1024 * 1024)
-                    if not chunk:
-                        break
-                    size += len(chunk)
-                    if size > int(self.max_upload_mb) * 1024 * 1024:
-                        raise ImportExportError(message="File too large / 上传文件过大", status_code=413)
-                    out.write(chunk)
-
-            checksum = sha256_file(original_path)
+            size, checksum = await asyncio.to_thread(
+                _copy_upload, file.file, original_path, max_bytes=int(self.max_upload_mb) * 1024 * 1024
+            )
             meta: dict[str, Any] = {
                 "import_id": str(import_id),
                 "filename": filename,
@@ -407,10 +460,10 @@ class ImportExportService:
                 errors.extend(await run_db_checks(db=self.db, df=df, specs=db_checks, allow_overwrite=allow_overwrite))
             if unique_fields:
                 errors.extend(collect_infile_duplicates(df, unique_fields))
-                extra_error_rows = {int(e.get("row_number") or 0) for e in errors if int(e.get("row_number") or 0) > 0}
-                if not valid_df.is_empty() and extra_error_rows:
-                    if "row_number" in valid_df.columns:
-                        valid_df = valid_df.filter(~pl.col("row_number").is_in(list(extra_error_rows)))
+            error_row_numbers = {rn for e in errors if (rn := int(e.get("row_number") or 0)) > 0}
+            if unique_fields and not valid_df.is_empty() and error_row_numbers:
+                if "row_number" in valid_df.columns:
+                    valid_df = valid_df.filter(~pl.col("row_number").is_in(list(error_row_numbers)))
             paths.errors_json.write_text(json.dumps(errors, ensure_ascii=False, indent=2), encoding="utf-8")
             # Always write valid.parquet, even when empty, to keep commit semantics consistent. / 无论是否为空，都要写入 valid.parquet，以保持提交语义一致。
             # 始终写入 valid.parquet，即使为空，保证提交语义一致。
@@ -421,7 +474,7 @@ class ImportExportService:
                 checksum=checksum,
                 total_rows=int(parsed.total_rows),
                 valid_rows=int(valid_df.height) if not valid_df.is_empty() else 0,
-                error_rows=len({e["row_number"] for e in errors if int(e.get("row_number") or 0) > 0}) if errors else 0,
+                error_rows=len(error_row_numbers),
                 errors=[
                     ImportErrorItem(
                         row_number=int(e.get("row_number") or 0),
@@ -8,6 +8,7 @@
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
@@ -16,14 +17,15 @@ from fastapi_import_export.config import ImportExportConfig
 from fastapi_import_export.exceptions import ImportExportError
 
 
+@lru_cache(maxsize=1)
 def _load_backend() -> Any:
     """Load the storage backend module.
     加载存储后端模块。
 
     This facade function attempts to import the optional filesystem-based
-    backend module and returns it. If the optional backend is unavailable
-    an ImportExportError is raised.
-    该门面函数尝试导入可选的基于文件系统的后端模块并返回它；若不可用则抛出 ImportExportError。
+    backend module and returns it, memoized after the first success. If the
+    optional backend is unavailable an ImportExportError is raised.
+    该门面函数尝试导入可选的基于文件系统的后端模块并返回它，首次成功后即缓存；若不可用则抛出 ImportExportError。
 
     Returns:
         Any: The backend module (e.g. ``storage_fs``).
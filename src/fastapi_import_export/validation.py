@@ -8,16 +8,21 @@
 """
 
 from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 
 from fastapi_import_export.exceptions import ImportExportError
 
 
+@lru_cache(maxsize=1)
 def _load_backend() -> Any:
     """
     Load the validation backend.
     加载校验后端。
 
+    Only a successful import is cached.
+    仅缓存成功的导入。
+
     Raises:
         ImportExportError: If the backend cannot be imported.
             如果无法导入后端则抛出 ImportExportError。
@@ -32,6 +32,9 @@ def collect_infile_duplicates(df: pl.DataFrame, unique_fields: Iterable[str]) ->
     if df.is_empty():
         return errors
     cols = set(df.columns)
+    # Row numbers are read once as ints (nulls as 0) and shared by every field.
+    # 行号一次性读取为整数（空值记为 0），供所有字段共用。
+    row_numbers = df.get_column("row_number").fill_null(0).to_list()
     for field in unique_fields:
         if field not in cols:
             continue
@@ -40,12 +43,12 @@ def collect_infile_duplicates(df: pl.DataFrame, unique_fields: Iterable[str]) ->
         )
         if not dup_values:
             continue
-        for r in df.select(["row_number", field]).to_dicts():
-            value = str(r.get(field) or "")
+        for row_number, raw in zip(row_numbers, df.get_column(field).to_list(), strict=True):
+            value = str(raw or "")
             if value and value in dup_values:
                 errors.append(
                     {
-                        "row_number": int(r.get("row_number") or 0),
+                        "row_number": row_number,
                         "field": field,
                         "message": f"Duplicate value for field {field}: {value} / 字段 {field} 重复值: {value}",
                         "value": value,
@@ -80,12 +83,13 @@ def build_conflict_errors(
     if not cv or df.is_empty() or field not in df.columns:
         return []
     errors: list[dict[str, Any]] = []
-    for r in df.select(["row_number", field]).to_dicts():
-        value = str(r.get(field) or "")
+    row_numbers = df.get_column("row_number").fill_null(0).to_list()
+    for row_number, raw in zip(row_numbers, df.get_column(field).to_list(), strict=True):
+        value = str(raw or "")
         if value and value in cv:
             errors.append(
                 {
-                    "row_number": int(r.get("row_number") or 0),
+                    "row_number": row_number,
                     "field": field,
                     "message": f"Conflict: {reason}; {field}={value} / 冲突：{reason}；{field}={value}",
                     "value": value,
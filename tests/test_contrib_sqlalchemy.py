@@ -7,9 +7,13 @@
 SQLAlchemy 适配层测试。
 """
 
+from types import SimpleNamespace
+
 import pytest
 
+from fastapi_import_export.constraint_parser import is_unique_constraint_error
 from fastapi_import_export.contrib.sqlalchemy import export_model_csv, import_model_csv
+from fastapi_import_export.exceptions import ImportExportError
 from fastapi_import_export.importer import ImportStatus
 from tests.conftest import make_upload_file
 
@@ -46,3 +50,276 @@ async def test_contrib_sqlalchemy_import_export() -> None:
         data = b"".join([chunk async for chunk in payload.stream])
         assert b"title" in data
         assert b"111" in data
+
+
+def test_contrib_sqlalchemy_spec_and_codec_cache() -> None:
+    pytest.importorskip("sqlalchemy")
+    from sqlalchemy import Boolean, Column, Integer, String
+    from sqlalchemy.orm import declarative_base
+
+    from fastapi_import_export.contrib.sqlalchemy.adapters import clear_cache, get_field_specs, resolve_field_codecs
+
+    Base = declarative_base()
+
+    class Flag(Base):
+        __tablename__ = "flags"
+        id = Column(Integer, primary_key=True, autoincrement=True)
+        name = Column(String, nullable=False)
+        enabled = Column(Boolean, nullable=False)
+
+    specs = get_field_specs(Flag)
+    assert [spec.name for spec in specs] == ["id", "name", "enabled"]
+    assert get_field_specs(Flag) == specs
+    assert get_field_specs(Flag) is not specs
+
+    codecs = resolve_field_codecs(Flag, specs)
+    assert set(codecs) == {"enabled"}
+    assert resolve_field_codecs(Flag, specs) is codecs
+
+    clear_cache()
+    assert resolve_field_codecs(Flag, specs) is not codecs
+
+
+def test_contrib_sqlalchemy_validate_fn_cache() -> None:
+    pytest.importorskip("sqlalchemy")
+    from sqlalchemy import Column, Integer, String
+    from sqlalchemy.orm import declarative_base
+
+    from fastapi_import_export.contrib.sqlalchemy.adapters import get_field_specs, resolve_import_specs
+    from fastapi_import_export.contrib.sqlalchemy.import_model import _cached_validate_fn
+
+    Base = declarative_base()
+
+    class Tag(Base):
+        __tablename__ = "tags"
+        id = Column(Integer, primary_key=True, autoincrement=True)
+        name = Column(String, nullable=False, unique=True)
+
+    specs = resolve_import_specs(get_field_specs(Tag), None)
+    validate_fn = _cached_validate_fn(model=Tag, specs=specs, unique_fields=["name"])
+    assert _cached_validate_fn(model=Tag, specs=list(specs), unique_fields=["name"]) is validate_fn
+    assert _cached_validate_fn(model=Tag, specs=specs, unique_fields=None) is not validate_fn
+
+
+@pytest.mark.asyncio
+async def test_contrib_sqlalchemy_persist_reports_unique_conflicts() -> None:
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("aiosqlite")
+    import polars as pl
+    from sqlalchemy import Column, Integer, String, select
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from sqlalchemy.orm import declarative_base
+
+    from fastapi_import_export.contrib.sqlalchemy.import_model import _build_persist_fn, _resolve_conflict_insert
+
+    Base = declarative_base()
+
+    class Tag(Base):
+        __tablename__ = "tags"
+        id = Column(Integer, primary_key=True, autoincrement=True)
+        code = Column(String, nullable=False, unique=True)
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session() as session:
+        session.add(Tag(code="b"))
+        await session.commit()
+
+        persist_fn = _build_persist_fn(model=Tag, unique_fields=["code"])
+        valid_df = pl.DataFrame({"row_number": [1, 2, 3, 4], "code": ["a", "b", "c", "c"]})
+        with pytest.raises(ImportExportError) as exc_info:
+            await persist_fn(session, valid_df)
+        details = exc_info.value.details
+        assert details["row_numbers"] == [2, 4]
+        assert [(error["type"], error["field"], error["value"]) for error in details["errors"]] == [
+            ("db_unique", "code", ("b",)),
+            ("db_unique", "code", ("c",)),
+        ]
+        # Not mistaken for a driver error by the service's constraint parser.
+        # 不会被服务的约束解析器误判为驱动错误。
+        assert not is_unique_constraint_error(exc_info.value.message)
+        codes = (await session.execute(select(Tag.code).order_by(Tag.code))).scalars().all()
+        assert codes == ["b"]
+
+        assert await persist_fn(session, valid_df.filter(pl.col("row_number") == 1)) == 1
+
+    def sqlite_db(insert_returning: bool) -> SimpleNamespace:
+        return SimpleNamespace(
+            bind=SimpleNamespace(dialect=SimpleNamespace(name="sqlite", insert_returning=insert_returning))
+        )
+
+    # SQLite before 3.35 has no INSERT ... RETURNING; keep the plain INSERT there.
+    # SQLite 3.35 之前不支持 INSERT ... RETURNING；此时保留普通 INSERT。
+    assert _resolve_conflict_insert(db=sqlite_db(True), model=Tag, unique_fields=["code"]) is not None
+    assert _resolve_conflict_insert(db=sqlite_db(False), model=Tag, unique_fields=["code"]) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("multi_values", [True, False])
+async def test_contrib_sqlalchemy_persist_batches_follow_dialect(multi_values: bool) -> None:
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("aiosqlite")
+    import polars as pl
+    from sqlalchemy import Column, Integer, String, event, select
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from sqlalchemy.orm import declarative_base
+
+    from fastapi_import_export.contrib.sqlalchemy.import_model import _build_persist_fn
+
+    Base = declarative_base()
+
+    class Pair(Base):
+        __tablename__ = "pairs"
+        id = Column(Integer, primary_key=True, autoincrement=True)
+        left = Column(String, nullable=False)
+        right = Column(String, nullable=False)
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    # Mimic a dialect without multi-row VALUES (Oracle) or with a small bind limit.
+    # 模拟不支持多行 VALUES 的方言（Oracle）或绑定参数上限较小的方言。
+    engine.dialect.supports_multivalues_insert = multi_values
+    engine.dialect.insertmanyvalues_max_parameters = 5
+    statements: list[tuple[str, bool]] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.startswith("INSERT"):
+            statements.append((statement, executemany))
+
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with async_session() as session:
+        valid_df = pl.DataFrame({"row_number": [1, 2, 3, 4, 5], "left": list("abcde"), "right": list("vwxyz")})
+        assert await _build_persist_fn(model=Pair)(session, valid_df) == 5
+        rows = (await session.execute(select(Pair.left, Pair.right).order_by(Pair.id))).all()
+        assert [tuple(row) for row in rows] == list(zip("abcde", "vwxyz", strict=True))
+
+    if multi_values:
+        # Two columns per row under a 5-parameter limit: batches of 2 rows.
+        # 每行两列、上限 5 个参数：每批 2 行。
+        assert [statement.count("(?, ?)") for statement, _ in statements] == [2, 2, 1]
+        assert not any(executemany for _, executemany in statements)
+    else:
+        assert len(statements) == 1 and statements[0][1]
+
+
+@pytest.mark.asyncio
+async def test_contrib_sqlalchemy_export_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy import Column, Integer, String
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from sqlalchemy.orm import declarative_base
+
+    from fastapi_import_export.contrib.sqlalchemy import export_model as export_module
+    from fastapi_import_export.options import ExportOptions
+
+    Base = declarative_base()
+
+    class Note(Base):
+        __tablename__ = "notes"
+        id = Column(Integer, primary_key=True, autoincrement=True)
+        body = Column(String, nullable=False)
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(export_module, "_EXPORT_PARTITION_SIZE", 2)
+
+    async with async_session() as session:
+        session.add_all([Note(body=text) for text in ("a", "b", "c")])
+        await session.commit()
+
+        payload = await export_module.export_model_csv(
+            model=Note, db=session, stream=True, options=ExportOptions(include_bom=True)
+        )
+        chunks = [chunk async for chunk in payload.stream]
+        assert payload.filename == "note.csv"
+        assert chunks == [b"\xef\xbb\xbfid,body\r\n1,a\r\n2,b\r\n", b"3,c\r\n"]
+
+
+@pytest.mark.asyncio
+async def test_contrib_sqlalchemy_export_callable_filter_runs_once() -> None:
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy import Column, Integer, String
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from sqlalchemy.orm import declarative_base
+
+    Base = declarative_base()
+
+    class Memo(Base):
+        __tablename__ = "memos"
+        id = Column(Integer, primary_key=True, autoincrement=True)
+        body = Column(String, nullable=False)
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    calls: list[object] = []
+
+    def only_b(model: object) -> object:
+        calls.append(model)
+        return Memo.body == "b"
+
+    async with async_session() as session:
+        session.add_all([Memo(body=text) for text in ("a", "b")])
+        await session.commit()
+
+        payload = await export_model_csv(model=Memo, db=session, filters=only_b)
+        data = b"".join([chunk async for chunk in payload.stream])
+        assert data == b"id,body\r\n2,b\r\n"
+        assert calls == [Memo]
+
+
+@pytest.mark.asyncio
+async def test_contrib_sqlalchemy_enum_import_keeps_members() -> None:
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("aiosqlite")
+    from enum import Enum
+
+    import polars as pl
+    from sqlalchemy import Column, Integer, select
+    from sqlalchemy import Enum as SAEnum
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from sqlalchemy.orm import declarative_base
+
+    from fastapi_import_export.contrib.sqlalchemy.adapters import get_field_specs, resolve_import_specs
+    from fastapi_import_export.contrib.sqlalchemy.import_model import _build_persist_fn, _cached_validate_fn
+
+    class Color(Enum):
+        RED = "red"
+        BLUE = "blue"
+
+    Base = declarative_base()
+
+    class Paint(Base):
+        __tablename__ = "paints"
+        id = Column(Integer, primary_key=True, autoincrement=True)
+        color = Column(SAEnum(Color), nullable=False)
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    specs = resolve_import_specs(get_field_specs(Paint), None)
+    validate_fn = _cached_validate_fn(model=Paint, specs=specs, unique_fields=None)
+    async with async_session() as session:
+        df = pl.DataFrame({"row_number": [1, 2], "color": ["red", "blue"]})
+        valid_df, errors = await validate_fn(session, df)
+        assert errors == []
+        assert valid_df["color"].dtype == pl.Object
+        assert valid_df["color"].to_list() == [Color.RED, Color.BLUE]
+
+        persist_fn = _build_persist_fn(model=Paint)
+        assert await persist_fn(session, valid_df) == 2
+        colors = (await session.execute(select(Paint.color).order_by(Paint.id))).scalars().all()
+        assert colors == [Color.RED, Color.BLUE]
@@ -7,6 +7,11 @@
 Tortoise ORM 适配层测试。
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from types import SimpleNamespace
+
 import pytest
 
 from fastapi_import_export.importer import ImportStatus
@@ -27,6 +32,21 @@ class Book(models.Model):
         table = "books_tortoise"
 
 
+class Level(IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+class Seat(models.Model):
+    id = fields.IntField(primary_key=True)
+    section = fields.CharField(max_length=5, source_field="group")
+    level = fields.IntEnumField(Level)
+    note = fields.CharField(max_length=20, default="-")
+
+    class Meta(models.Model.Meta):
+        table = "order"
+
+
 @pytest.mark.asyncio
 async def test_contrib_tortoise_import_export() -> None:
     await Tortoise.init(db_url="sqlite://:memory:", modules={"models": [__name__]})
@@ -45,3 +65,210 @@ async def test_contrib_tortoise_import_export() -> None:
         assert b"333" in data
     finally:
         await Tortoise.close_connections()
+
+
+class _RecordingClient:
+    capabilities = SimpleNamespace(dialect="postgres")
+
+    def __init__(self) -> None:
+        self.queries: list[tuple[str, list[object]]] = []
+
+    async def execute_query_dict(self, sql: str, params: list[object]) -> list[dict[str, object]]:
+        self.queries.append((sql, params))
+        return []
+
+
+class _AsyncpgClient(_RecordingClient):
+    __module__ = "tortoise.backends.asyncpg.client"
+
+
+class _PsycopgClient(_RecordingClient):
+    __module__ = "tortoise.backends.psycopg.client"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("client_cls", "groups"),
+    [(_AsyncpgClient, "($1, $2), ($3, $4)"), (_PsycopgClient, "(%s, %s), (%s, %s)")],
+)
+async def test_contrib_tortoise_row_value_placeholders_follow_client(client_cls: type, groups: str) -> None:
+    from fastapi_import_export.contrib.tortoise.import_model import _fetch_existing_tuples
+
+    client = client_cls()
+    field = SimpleNamespace(to_db_value=lambda value, instance: value, to_python_value=lambda value: value)
+    meta = SimpleNamespace(
+        db=client,
+        fields_map={"a": field, "b": field},
+        fields_db_projection={"a": "a", "b": "b"},
+        db_table="pairs",
+        schema=None,
+    )
+    model = SimpleNamespace(_meta=meta)
+    assert await _fetch_existing_tuples(model=model, fields=["a", "b"], keys=((1, "x"), (2, "y"))) == []
+    assert client.queries == [
+        (f'SELECT "a", "b" FROM "pairs" WHERE ("a", "b") IN ({groups})', [1, "x", 2, "y"]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_contrib_tortoise_composite_unique_conflicts_sqlite() -> None:
+    import polars as pl
+
+    from fastapi_import_export.contrib.tortoise.adapters import get_field_specs, resolve_import_specs
+    from fastapi_import_export.contrib.tortoise.import_model import _cached_validate_fn, _fetch_existing_tuples
+
+    await Tortoise.init(db_url="sqlite://:memory:", modules={"models": [__name__]})
+    await Tortoise.generate_schemas()
+
+    try:
+        await Seat.create(section="A", level=Level.HIGH)
+        # Reserved table/column names are quoted and keys round-trip through the IntEnum field.
+        # 保留字表名/列名会被引用，键值经 IntEnum 字段往返转换。
+        keys = (("A", Level.HIGH), ("A", Level.LOW))
+        matched = await _fetch_existing_tuples(model=Seat, fields=["section", "level"], keys=keys)
+        assert matched == [("A", Level.HIGH)]
+        assert type(matched[0][1]) is Level
+
+        specs = resolve_import_specs(get_field_specs(Seat), None)
+        validate_fn = _cached_validate_fn(model=Seat, specs=specs, unique_fields=["section", "level"])
+        df = pl.DataFrame({"row_number": [1, 2, 3], "section": ["A", "A", "B"], "level": ["HIGH", "1", "2"]})
+        valid_df, errors = await validate_fn(None, df)
+        assert [(error["row_number"], error["type"], error["value"]) for error in errors] == [
+            (1, "db_unique", ("A", Level.HIGH))
+        ]
+        assert valid_df["row_number"].to_list() == [2, 3]
+    finally:
+        await Tortoise.close_connections()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("with_note", [True, False])
+async def test_contrib_tortoise_persist_round_trip_sqlite(with_note: bool) -> None:
+    import polars as pl
+
+    from fastapi_import_export.contrib.tortoise.adapters import get_field_specs, resolve_import_specs
+    from fastapi_import_export.contrib.tortoise.import_model import _build_persist_fn, _cached_validate_fn
+
+    await Tortoise.init(db_url="sqlite://:memory:", modules={"models": [__name__]})
+    await Tortoise.generate_schemas()
+
+    try:
+        columns = ["section", "level", "note"] if with_note else ["section", "level"]
+        specs = resolve_import_specs(get_field_specs(Seat), columns)
+        validate_fn = _cached_validate_fn(model=Seat, specs=specs, unique_fields=None)
+        data = {"row_number": [1, 2, 3], "section": ["A", "B", "C"], "level": ["LOW", "HIGH", "2"]}
+        if with_note:
+            data["note"] = ["x", "y", "z"]
+        valid_df, errors = await validate_fn(None, pl.DataFrame(data))
+        assert errors == []
+
+        # With every DB field present, rows after the first skip Model.__init__.
+        # 提供全部数据库字段时，第一行之后的行会跳过 Model.__init__。
+        assert await _build_persist_fn(model=Seat)(None, valid_df) == 3
+        rows = await Seat.all().order_by("id").values_list("section", "level", "note")
+        notes = ["x", "y", "z"] if with_note else ["-", "-", "-"]
+        assert rows == [
+            ("A", Level.LOW, notes[0]),
+            ("B", Level.HIGH, notes[1]),
+            ("C", Level.HIGH, notes[2]),
+        ]
+    finally:
+        await Tortoise.close_connections()
+
+
+class _CopyConnection:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, object]]] = []
+
+    async def copy_records_to_table(self, table: str, **kwargs: object) -> None:
+        self.calls.append((table, kwargs))
+
+
+class _CopyClient:
+    def __init__(self) -> None:
+        self.connection = _CopyConnection()
+
+    @asynccontextmanager
+    async def acquire_connection(self) -> AsyncIterator[_CopyConnection]:
+        yield self.connection
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("schema", "expected"), [(None, {}), ("", {}), ("sales", {"schema_name": "sales"})])
+async def test_contrib_tortoise_copy_schema_only_when_set(schema: str | None, expected: dict[str, object]) -> None:
+    from fastapi_import_export.contrib.tortoise.import_model import _copy_instances
+
+    plain = SimpleNamespace(generated=False, to_db_value=lambda value, instance: value)
+    generated = SimpleNamespace(generated=True, to_db_value=lambda value, instance: value)
+    meta = SimpleNamespace(
+        fields_map={"id": generated, "name": plain},
+        fields_db_projection={"id": "id", "name": "name"},
+        db_table="items",
+        schema=schema,
+    )
+    client = _CopyClient()
+    await _copy_instances(client=client, model=SimpleNamespace(_meta=meta), objs=[SimpleNamespace(id=None, name="a")])
+    assert client.connection.calls == [("items", {"records": [("a",)], "columns": ["name"], **expected})]
+
+
+class _TempTableConnection:
+    def __init__(self, *, fail_copy: bool = False) -> None:
+        self.fail_copy = fail_copy
+        self.statements: list[str] = []
+        self.transactions: list[str] = []
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        self.transactions.append("begin")
+        try:
+            yield
+        except BaseException:
+            self.transactions.append("rollback")
+            raise
+        self.transactions.append("commit")
+
+    async def execute(self, sql: str) -> None:
+        self.statements.append(sql)
+
+    async def copy_records_to_table(self, table: str, **kwargs: object) -> None:
+        if self.fail_copy:
+            raise ValueError("copy failed")
+        self.statements.append(f"COPY {table}")
+
+    async def fetch(self, sql: str) -> list[tuple[object, ...]]:
+        self.statements.append(sql)
+        return [("a",)]
+
+
+@asynccontextmanager
+async def _acquire(connection: _TempTableConnection) -> AsyncIterator[_TempTableConnection]:
+    yield connection
+
+
+@pytest.mark.asyncio
+async def test_contrib_tortoise_temp_table_check_is_isolated() -> None:
+    from fastapi_import_export.contrib.tortoise.import_model import _fetch_existing_via_temp_table
+
+    field = SimpleNamespace(to_db_value=lambda value, instance: value, to_python_value=lambda value: value)
+    meta = SimpleNamespace(
+        fields_map={"code": field}, fields_db_projection={"code": "code"}, db_table="tags", schema=None
+    )
+    model = SimpleNamespace(_meta=meta)
+
+    connection = _TempTableConnection()
+    meta.db = SimpleNamespace(acquire_connection=lambda: _acquire(connection))
+    assert await _fetch_existing_via_temp_table(model=model, fields=["code"], keys=["a", "b"]) == ["a"]
+    assert await _fetch_existing_via_temp_table(model=model, fields=["code"], keys=["a"]) == ["a"]
+    creates = [sql for sql in connection.statements if sql.startswith("CREATE TEMP TABLE")]
+    assert len(creates) == 2 and len(set(creates)) == 2
+    assert all(" ON COMMIT DROP AS SELECT " in sql for sql in creates)
+    assert connection.transactions == ["begin", "commit", "begin", "commit"]
+
+    # A failing COPY surfaces its own error and rolls the savepoint back without a DROP.
+    # COPY 失败时抛出其原始错误，并回滚保存点而不执行 DROP。
+    failing = _TempTableConnection(fail_copy=True)
+    meta.db = SimpleNamespace(acquire_connection=lambda: _acquire(failing))
+    with pytest.raises(ValueError, match="copy failed"):
+        await _fetch_existing_via_temp_table(model=model, fields=["code"], keys=["a"])
+    assert failing.transactions == ["begin", "rollback"]
+    assert not any(sql.startswith("DROP") for sql in failing.statements)
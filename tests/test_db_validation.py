@@ -7,6 +7,7 @@
 db_validation.py 与 db_validation_polars.py 模块测试。
 """
 
+import asyncio
 from typing import Any
 
 import polars as pl
@@ -63,6 +64,23 @@ class TestBuildKeyToRowNumbers:
         result = build_key_to_row_numbers(df, ["email"])
         assert ("",) not in result
 
+    def test_nested_key_values_stringified(self) -> None:
+        """Nested key values are stringified like Python str() / 嵌套 key 值按 Python str() 转为字符串。"""
+        df = pl.DataFrame(
+            {
+                "row_number": [1, 2, 3, 4],
+                "tags": [[1, 2], [], None, [1, 2]],
+                "meta": [{"a": 1}, {"a": 2}, {"a": 1}, {"a": 1}],
+            }
+        )
+        assert build_key_to_row_numbers(df, ["tags"]) == {("[1, 2]",): [1, 4]}
+        assert build_key_to_row_numbers(df, ["meta"]) == {("{'a': 1}",): [1, 3, 4], ("{'a': 2}",): [2]}
+
+    def test_key_strip_matches_python(self) -> None:
+        """Key text is stripped like str.strip(), including \\x1c-\\x1f / 去空白与 str.strip() 一致。"""
+        df = pl.DataFrame({"row_number": [1, 2, 3], "email": ["\x1ca@b.com\x1f", " a@b.com\u3000", "\x1e"]})
+        assert build_key_to_row_numbers(df, ["email"]) == {("a@b.com",): [1, 2]}
+
     def test_empty_key_fields_list(self) -> None:
         """Empty key_fields returns empty / 空 key_fields 返回空字典。"""
         df = pl.DataFrame({"row_number": [1], "email": ["a"]})
@@ -163,3 +181,28 @@ class TestRunDbChecks:
         specs = [DbCheckSpec(key_fields=["email"], check_fn=check_fn)]
         errors = await run_db_checks(db=None, df=df, specs=specs)
         assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_overlap(self) -> None:
+        """Concurrent checks run together and keep spec order / 并发校验同时执行并保持规范顺序。"""
+        df = pl.DataFrame({"row_number": [1], "email": ["a@b.com"], "name": ["alice"]})
+        started: list[str] = []
+        release = asyncio.Event()
+
+        async def check_email(db: Any, keys: list, *, allow_overwrite: bool = False) -> dict:
+            started.append("email")
+            await release.wait()
+            return {("a@b.com",): {"message": "email exists"}}
+
+        async def check_name(db: Any, keys: list, *, allow_overwrite: bool = False) -> dict:
+            started.append("name")
+            release.set()
+            return {("alice",): {"message": "name exists"}}
+
+        specs = [
+            DbCheckSpec(key_fields=["email"], check_fn=check_email, field="email"),
+            DbCheckSpec(key_fields=["name"], check_fn=check_name, field="name"),
+        ]
+        errors = await run_db_checks(db=None, df=df, specs=specs, concurrent=True)
+        assert started == ["email", "name"]
+        assert [e["field"] for e in errors] == ["email", "name"]
@@ -7,6 +7,7 @@
 易用层 API 测试。
 """
 
+import io
 from datetime import date
 from decimal import Decimal
 from enum import Enum
@@ -14,12 +15,13 @@ from enum import Enum
 import polars as pl
 import pytest
 
-from fastapi_import_export import export_csv, export_xlsx, import_csv
+from fastapi_import_export import easy as easy_module
+from fastapi_import_export import export_arrow, export_csv, export_parquet, export_xlsx, import_csv
 from fastapi_import_export.codecs import DateCodec, DecimalCodec, EnumCodec
 from fastapi_import_export.importer import ImportStatus
 from fastapi_import_export.options import ExportOptions
 from fastapi_import_export.resource import Resource
-from fastapi_import_export.serializers import CsvSerializer
+from fastapi_import_export.serializers import CsvSerializer, XlsxSerializer
 from tests.conftest import make_upload_file
 
 
@@ -146,6 +148,26 @@ async def test_easy_import_csv_applies_codecs() -> None:
     assert result.imported_rows == 1
 
 
+@pytest.mark.asyncio
+async def test_easy_import_csv_codec_errors_drop_rows() -> None:
+    csv = "title,status,published_at,price\nA,可借阅,2010-01-01,1.00\nB,未知,bad,2.00\nC,不可借阅,2011-02-03,3.00\n"
+    file = make_upload_file("books.csv", csv.encode())
+    seen: list[str] = []
+
+    async def validate_fn(db, df, *, allow_overwrite: bool = False):
+        seen.extend(df.get_column("title").to_list())
+        assert df.get_column("status").to_list() == [Status.AVAILABLE, Status.UNAVAILABLE]
+        return df, []
+
+    async def persist_fn(db, valid_df, *, allow_overwrite: bool = False) -> int:
+        return int(valid_df.height)
+
+    result = await import_csv(file, resource=BookResource, validate_fn=validate_fn, persist_fn=persist_fn)
+    assert result.status == ImportStatus.VALIDATED
+    assert seen == ["A", "C"]
+    assert [(e.row_number, e.field) for e in result.errors] == [(2, "status"), (2, "published_at")]
+
+
 @pytest.mark.asyncio
 async def test_easy_export_object_rows() -> None:
     class Book:
@@ -164,3 +186,145 @@ async def test_easy_export_object_rows() -> None:
     assert b"title" in data
     assert b"price" in data
     assert b"A" in data
+
+
+@pytest.mark.asyncio
+async def test_easy_export_csv_dataframe_matches_rows() -> None:
+    df = pl.DataFrame(
+        {
+            "title": ["A", "", "C, D"],
+            "status": ["x", None, "z"],
+            "published_at": [date(2024, 1, 2), None, date(2024, 3, 4)],
+            "stock": [1, None, 3],
+        }
+    )
+    options = ExportOptions(include_bom=True, line_ending="\n")
+    frame_payload = await export_csv(df, options=options)
+    rows_payload = await export_csv(df.to_dicts(), options=options)
+    frame_data = b"".join([chunk async for chunk in frame_payload.stream])
+    rows_data = b"".join([chunk async for chunk in rows_payload.stream])
+    assert frame_data == rows_data
+    assert frame_data.startswith(b"\xef\xbb\xbftitle,status,published_at,stock\n")
+
+
+def test_serializer_csv_dataframe_matches_rows() -> None:
+    df = pl.DataFrame({"a": [1, None], "b": ["x", ""], "c": [1.5, None]})
+    for columns in (None, ["b", "missing", "a"]):
+        options = ExportOptions(columns=columns)
+        assert CsvSerializer().serialize(data=df, options=options) == CsvSerializer().serialize(
+            data=df.to_dicts(), options=options
+        )
+
+
+def test_serializer_csv_typed_rows_match_dictwriter() -> None:
+    rows = [
+        {"id": 1, "name": "a,b", "born": date(2020, 1, 2)},
+        {"id": 2, "name": "", "extra": "ignored"},
+        {"id": None, "name": 'q"q', "born": None},
+    ]
+    data = CsvSerializer().serialize(data=rows, options=ExportOptions(columns=["id", "name", "born", "missing"]))
+    assert data == b'id,name,born,missing\r\n1,"a,b",2020-01-02,\r\n2,,,\r\n,"q""q",,\r\n'
+
+
+def test_serializer_csv_iter_serialize_matches_serialize() -> None:
+    rows = [{"id": i, "name": f"n{i}", "score": i / 2} for i in range(5)]
+    df = pl.DataFrame(rows)
+    options = ExportOptions(include_bom=True)
+    for data in (rows, df, df.clear()):
+        chunks = list(CsvSerializer().iter_serialize(data=data, options=options, batch_rows=2))
+        assert b"".join(chunks) == CsvSerializer().serialize(data=data, options=options)
+        assert len(chunks) == max((len(data) + 1) // 2, 1)
+
+
+@pytest.mark.parametrize("line_ending", ["\n", "\r\n", "\r", ";"])
+def test_serializer_csv_dataframe_line_endings_match_rows(line_ending: str) -> None:
+    df = pl.DataFrame({"a": ["x\ry", "p\nq", "z"], "b": [1, 2, 3]})
+    options = ExportOptions(line_ending=line_ending)
+    assert CsvSerializer().serialize(data=df, options=options) == CsvSerializer().serialize(
+        data=df.to_dicts(), options=options
+    )
+
+
+@pytest.mark.parametrize("constant_memory", [True, False])
+def test_serializer_xlsx_constant_memory_toggle(constant_memory: bool) -> None:
+    openpyxl = pytest.importorskip("openpyxl")
+    rows = [{"title": "A", "published_at": date(2024, 1, 2)}, {"title": "B", "published_at": None}]
+    data = XlsxSerializer().serialize(data=rows, options=ExportOptions(xlsx_constant_memory=constant_memory))
+    ws = openpyxl.load_workbook(io.BytesIO(data)).active
+    assert ws.freeze_panes == "A2"
+    values = list(ws.iter_rows(values_only=True))
+    assert values[0] == ("title", "published_at")
+    assert values[1][0] == "A" and values[1][1].date() == date(2024, 1, 2)
+    assert values[2] == ("B", None)
+
+
+@pytest.mark.parametrize("as_frame", [False, True])
+def test_serializer_xlsx_nan_inf_and_bytes(as_frame: bool) -> None:
+    openpyxl = pytest.importorskip("openpyxl")
+    rows = [
+        {"a": float("nan"), "b": float("inf"), "c": b"hi"},
+        {"a": 1.5, "b": 2.0, "c": "café".encode()},
+    ]
+    data = XlsxSerializer().serialize(data=pl.DataFrame(rows) if as_frame else rows, options=ExportOptions())
+    values = list(openpyxl.load_workbook(io.BytesIO(data)).active.iter_rows(values_only=True))
+    assert values[0] == ("a", "b", "c")
+    assert values[1] == ("=#NUM!", "=1/0", "hi")
+    assert values[2] == (1.5, 2, "café")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("threaded", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+async def test_easy_export_csv_honors_chunk_size(
+    monkeypatch: pytest.MonkeyPatch, chunk_size: int, threaded: bool
+) -> None:
+    if threaded:
+        monkeypatch.setattr(easy_module, "_THREADED_EXPORT_MIN_ROWS", 0)
+    rows = [{"id": i, "name": f"name-{i}"} for i in range(50)]
+    options = ExportOptions(chunk_size=chunk_size)
+    for data in (rows, pl.DataFrame(rows)):
+        payload = await export_csv(data, options=options)
+        chunks = [chunk async for chunk in payload.stream]
+        assert b"".join(chunks) == CsvSerializer().serialize(data=data, options=options)
+        assert all(len(chunk) == chunk_size for chunk in chunks[:-1])
+        assert 0 < len(chunks[-1]) <= chunk_size
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("export_fn", [export_csv, export_xlsx])
+async def test_easy_export_small_inputs_skip_worker_threads(monkeypatch: pytest.MonkeyPatch, export_fn) -> None:
+    async def fail_to_thread(*args, **kwargs):
+        raise AssertionError("small exports must not use a worker thread")
+
+    monkeypatch.setattr(easy_module.asyncio, "to_thread", fail_to_thread)
+    rows = [{"id": i} for i in range(3)]
+    for data in (rows, pl.DataFrame(rows)):
+        payload = await export_fn(data)
+        assert b"".join([chunk async for chunk in payload.stream])
+
+
+@pytest.mark.asyncio
+async def test_easy_export_csv_dataframe_missing_columns_keep_height() -> None:
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    options = ExportOptions(columns=["x", "y"])
+    payload = await export_csv(df, options=options)
+    data = b"".join([chunk async for chunk in payload.stream])
+    assert data == b"x,y\r\n,\r\n,\r\n,\r\n"
+    assert CsvSerializer().serialize(data=df, options=options) == data
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("export_fn", "read_fn", "suffix"),
+    [(export_arrow, pl.read_ipc, ".arrow"), (export_parquet, pl.read_parquet, ".parquet")],
+)
+async def test_easy_export_columnar_formats(export_fn, read_fn, suffix: str) -> None:
+    df = pl.DataFrame({"id": [1, 2], "username": ["alice", None]})
+    for source in (df, df.to_dicts()):
+        payload = await export_fn(source, resource=UserResource)
+        data = b"".join([chunk async for chunk in payload.stream])
+        assert payload.filename == f"userresource{suffix}"
+        result = read_fn(io.BytesIO(data))
+        assert result.columns == ["id", "username", "email"]
+        assert result.get_column("id").to_list() == [1, 2]
+        assert result.get_column("username").to_list() == ["alice", None]
@@ -118,3 +118,40 @@ class TestImporter:
         )
         result = await importer.persist(data="data", resource=DummyResource, allow_overwrite=True)
         assert result == 42
+
+    @pytest.mark.asyncio
+    async def test_default_transformer_passes_valid_data_through(self) -> None:
+        """Default transformer hands valid data to persist unchanged / 默认转换函数将有效数据原样交给 persist。"""
+        valid = [{"name": "alice"}]
+        persister = AsyncMock(return_value=1)
+        importer = Importer(
+            parser=AsyncMock(return_value=valid),
+            validator=AsyncMock(return_value=(valid, [])),
+            persister=persister,
+        )
+        result = await importer.import_data(file=MagicMock(spec=UploadFile), resource=DummyResource)
+        assert result.imported_rows == 1
+        assert persister.call_args.kwargs["data"] is valid
+        assert await importer.transform(data=valid, resource=DummyResource) is valid
+
+    @pytest.mark.asyncio
+    async def test_fast_validator_errors_skip_full_validation(self) -> None:
+        """Fast validator errors return before the full validator / 快速校验出错时不再执行完整校验。"""
+        error = ImportErrorItem(row_number=0, field="name", message="missing column")
+        fast_validator = AsyncMock(return_value=([], [error]))
+        validator = AsyncMock()
+        importer = Importer(
+            parser=AsyncMock(return_value=[{}]),
+            validator=validator,
+            persister=AsyncMock(),
+            fast_validator=fast_validator,
+        )
+        result = await importer.import_data(file=MagicMock(spec=UploadFile), resource=DummyResource)
+        assert result.status == ImportStatus.VALIDATED
+        assert result.errors == [error]
+        validator.assert_not_called()
+
+        fast_validator.return_value = ([{"name": "alice"}], [])
+        validator.return_value = ([{"name": "alice"}], [])
+        await importer.validate(data=[{"name": "alice"}], resource=DummyResource, allow_overwrite=False)
+        validator.assert_awaited_once()
@@ -8,6 +8,8 @@
 """
 
 import importlib
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -31,6 +33,11 @@ class TestAllExports:
         mod = importlib.import_module("fastapi_import_export")
         assert mod is not None
 
+    def test_import_does_not_import_polars(self) -> None:
+        """Importing the package leaves polars unloaded / 导入包不会加载 polars。"""
+        code = "import sys, fastapi_import_export; sys.exit('polars' in sys.modules)"
+        assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0
+
 
 class TestPyTyped:
     """Tests for py.typed marker.
@@ -17,6 +17,7 @@ from fastapi_import_export.parse_polars import (
     dataframe_to_preview_rows,
     normalize_columns,
     parse_tabular_file,
+    parse_tabular_file_batched,
 )
 
 
@@ -58,6 +59,24 @@ class TestParseTabularFile:
         assert "age" in result.df.columns
 
 
+class TestParseTabularFileBatched:
+    """Tests for parse_tabular_file_batched.
+    parse_tabular_file_batched 测试。
+    """
+
+    def test_csv_batches_match_full_parse(self, sample_csv_path: Path) -> None:
+        """CSV batches concatenate to the full parse / CSV 批次拼接结果与完整解析一致。"""
+        batches = list(parse_tabular_file_batched(sample_csv_path, filename="sample.csv", batch_size=2))
+        assert len(batches) > 1
+        full = parse_tabular_file(sample_csv_path, filename="sample.csv").df
+        assert pl.concat(batches).equals(full)
+
+    def test_unsupported_suffix_raises(self, sample_csv_path: Path) -> None:
+        """Unsupported suffix raises ValueError / 不支持的扩展名抛出 ValueError。"""
+        with pytest.raises(ValueError):
+            next(parse_tabular_file_batched(sample_csv_path, filename="sample.txt"))
+
+
 class TestNormalizeColumns:
     """Tests for normalize_columns.
     normalize_columns 测试。
@@ -78,6 +97,14 @@ class TestNormalizeColumns:
         result = normalize_columns(df, {})
         assert result.columns == ["X"]
 
+    def test_none_mapping_only_strips(self) -> None:
+        """None mapping strips headers and skips no-op renames / None 映射仅去除表头空白并跳过无效重命名。"""
+        df = pl.DataFrame({" X ": [1], "Y": [2]})
+        result = normalize_columns(df, None)
+        assert result.columns == ["X", "Y"]
+        clean = pl.DataFrame({"X": [1]})
+        assert normalize_columns(clean, None) is clean
+
 
 class TestDataframeToPreviewRows:
     """Tests for dataframe_to_preview_rows.
@@ -97,3 +124,8 @@ class TestDataframeToPreviewRows:
         for row in rows:
             assert "username" in row
             assert "email" in row
+
+    def test_preview_rows_limit(self, sample_polars_df: pl.DataFrame) -> None:
+        """preview_rows bounds the converted rows / preview_rows 限制转换行数。"""
+        rows = dataframe_to_preview_rows(sample_polars_df, preview_rows=2)
+        assert rows == sample_polars_df.head(2).to_dicts()
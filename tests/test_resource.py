@@ -101,6 +101,22 @@ class TestResource:
         mapping = AliasResource.export_mapping()
         assert mapping == {"username": "User Name"}
 
+    def test_mappings_are_cached_per_class_and_track_config(self) -> None:
+        """Cached mappings are copies and follow alias changes / 缓存映射返回副本并跟随别名变更。"""
+
+        class CachedResource(Resource):
+            username: str
+            field_aliases = {"User": "username"}
+
+        CachedResource.field_mapping()["extra"] = "x"
+        CachedResource.field_order().append("extra")
+        assert CachedResource.field_mapping() == {"username": "username", "User": "username"}
+        assert CachedResource.field_order() == ["username"]
+        CachedResource.field_aliases["Login"] = "username"
+        assert CachedResource.field_mapping()["Login"] == "username"
+        CachedResource.export_aliases = {"username": "Login"}
+        assert CachedResource.export_mapping() == {"username": "Login"}
+
     def test_model_binding_infers_fields(self) -> None:
         """Model binding infers fields when no declarations / 未声明字段时自动推断。"""
         pytest.importorskip("sqlalchemy")